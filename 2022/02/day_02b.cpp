@@ -4,7 +4,7 @@
 #include <string>
 #include <vector>
 
-int main(int argc, char **argv[]) 
+int main(int argc, char **argv) 
 {
   std::string input;
   if (argc > 1) {
@@ -1,46 +1,33 @@
 #!/usr/bin/env python3
 
+import os
+import sys
+import time
 from string import digits
+from colorama import init
 
-# with open("inp_test_a.txt") as f:
-#     lines = f.read().split("\n")
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
 
-# with open("inp_test_b.txt") as f:
-#     lines = f.read().split("\n")
+init(autoreset=True)
 
-with open("inp.txt") as f:
-    lines = f.read().split("\n")
-
-
-#########################
-###      PART A      ####
-#########################
-
-answer_a = 0
-
-for line in lines:
-    numbers = []
-    
-    for digit in digits:
-        idx = line.find(digit)
-        if idx != -1:
-            numbers.append((idx, digit))
-        idx = line.rfind(digit)
-        if idx != -1:
-            numbers.append((idx, digit))
-
-    numbers.sort()
-    answer_a += int(f"{numbers[0][1]}{numbers[-1][1]}")
-
-print('ANSWER Part A -> ', answer_a)
-
-
-#########################
-###      PART B      ####
-#########################
+TEST_SOLUTIONS = {
+    "input_a.txt": {
+        "part1": 142,
+        "part2": 142,
+    },
+    "input_b.txt": {
+        # Some lines of the part 2 example only have spelled digits
+        "part1": None,
+        "part2": 281,
+    },
+    "input.txt": {
+        "part1": 55538,
+        "part2": 54875,
+    },
+}
 
-answer_b = 0
-spelled = {
+SPELLED = {
     "one": "1",
     "two": "2",
     "three": "3",
@@ -52,24 +39,69 @@ spelled = {
     "nine": "9",
 }
 
-for line in lines:
+
+def parse(content):
+    """
+    Parse stage shared by both parts: the calibration lines
+    """
+    return content.strip().split("\n")
+
+
+def find_occurrences(line, words):
+    """
+    (index, digit) of the first and last occurrence of every word in the line
+    """
     numbers = []
-    for word, digit in spelled.items():
+    for word, digit in words.items():
         idx = line.find(word)
         if idx != -1:
             numbers.append((idx, digit))
         idx = line.rfind(word)
         if idx != -1:
             numbers.append((idx, digit))
-    for digit in digits:
-        idx = line.find(digit)
-        if idx != -1:
-            numbers.append((idx, digit))
-        idx = line.rfind(digit)
-        if idx != -1:
-            numbers.append((idx, digit))
-   
-    numbers.sort()
-    answer_b += int(f"{numbers[0][1]}{numbers[-1][1]}")
+    return numbers
+
+
+def calibration_sum(lines, words):
+    """
+    Sum of the numbers formed by the first and last digit found in each line.
+    Lines without any digit add nothing.
+    """
+    total = 0
+    for line in lines:
+        numbers = find_occurrences(line, words)
+        if not numbers:
+            continue
+        numbers.sort()
+        total += int(f"{numbers[0][1]}{numbers[-1][1]}")
+    return total
+
+
+#########################
+###      PART A      ####
+#########################
+
+def part1(lines):
+    start_time = time.time()
+    answer_a = calibration_sum(lines, {digit: digit for digit in digits})
+    return {
+        "value": answer_a,
+        "execution_time": time.time() - start_time
+    }
+
+
+#########################
+###      PART B      ####
+#########################
+
+def part2(lines):
+    start_time = time.time()
+    answer_b = calibration_sum(lines, {**SPELLED, **{digit: digit for digit in digits}})
+    return {
+        "value": answer_b,
+        "execution_time": time.time() - start_time
+    }
+
 
-print('ANSWER Part B -> ', answer_b)
+if __name__ == "__main__":
+    run_day(__file__)
@@ -1,63 +1,95 @@
 #!/usr/bin/env python3
 
+import os
+import sys
+import time
 from collections import defaultdict
+from colorama import init
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+
+init(autoreset=True)
+
+TEST_SOLUTIONS = {
+    "input_a.txt": {
+        "part1": 8,
+        "part2": 2286,
+    },
+    "input_b.txt": {
+        "part1": 8,
+        "part2": 2286,
+    },
+    "input.txt": {
+        "part1": 1853,
+        "part2": 72706,
+    },
+}
+
+LIMITS = {'red': 12, 'green': 13, 'blue': 14}
+
+
+def parse_game(line):
+    """
+    Game id and its rounds, each round a list of (count, color)
+    """
+    game_num, rounds = line.split(':')
+    game_id = int(game_num[5:])
+    rounds = [[(int(k), color) for k, color in (r.strip().split() for r in round.split(','))]
+              for round in rounds.split(';')]
+    return game_id, rounds
 
-# with open("inp_test_a.txt") as f:
-#     lines = f.read().split('\n')
-
-# with open("inp_test_b.txt") as f:
-#     lines = f.read().split('\n')
 
-with open("inp.txt") as f:
-    lines = f.read().split('\n')
+def parse(content):
+    """
+    Parse stage shared by both parts: the games
+    """
+    return [parse_game(line) for line in content.strip().split('\n')]
 
 
 #########################
 ###      PART A      ####
 #########################
 
-answer_a = 0
-game_wrong = set()
-
-for line in lines:
-    game_num, rounds = line.split(':')
-    game_id = int(game_num[5:])
-
-    answer_a += game_id
+def part1(games):
+    start_time = time.time()
+    answer_a = 0
+    game_wrong = set()
 
-    rounds = rounds.split(';')
-    for round in rounds:
-        round = [r.strip().split() for r in round.split(',')]
-        for k, color in round:
-            if color == 'red' and int(k) > 12:
-                game_wrong.add(game_id)
-            if color == 'green' and int(k) > 13:
-                game_wrong.add(game_id)
-            if color == 'blue' and int(k) > 14:
-                game_wrong.add(game_id)
+    for game_id, rounds in games:
+        answer_a += game_id
+        for round in rounds:
+            for k, color in round:
+                if color in LIMITS and k > LIMITS[color]:
+                    game_wrong.add(game_id)
 
-print('ANSWER Part A -> ', answer_a - sum(game_wrong))
+    return {
+        "value": answer_a - sum(game_wrong),
+        "execution_time": time.time() - start_time
+    }
 
 
 #########################
 ###      PART B     ####
 #########################
 
-answer_b = 0
-
-for line in lines:
-    game_num, rounds = line.split(':')
-    game_id = int(game_num[5:])
+def part2(games):
+    start_time = time.time()
+    answer_b = 0
 
-    rounds = rounds.split(';')
+    for _, rounds in games:
+        d = defaultdict(int)
+        for round in rounds:
+            for k, color in round:
+                d[color] = max(d[color], k)
+        power = d['red'] * d['green'] * d['blue']
+        answer_b += power
 
-    d = defaultdict(int)
+    return {
+        "value": answer_b,
+        "execution_time": time.time() - start_time
+    }
 
-    for round in rounds:
-        round = [r.strip().split() for r in round.split(',')]
-        for k, color in round:
-            d[color] = max(d[color], int(k))
-    power = d['red'] * d['green'] * d['blue']
-    answer_b += power
 
-print('ANSWER Part B -> ', answer_b)
\ No newline at end of file
+if __name__ == "__main__":
+    run_day(__file__)
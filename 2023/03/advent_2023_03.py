@@ -1,114 +1,138 @@
 #!/usr/bin/python3
 
-from collections import defaultdict
+import os
+import sys
+import time
 from string import digits
-
-# with open("inp_test_a.txt") as f:
-#     lines = f.read().split('\n')
-
-# with open("inp_test_b.txt") as f:
-#     lines = f.read().split('\n')
-
-with open("inp.txt") as f:
-    lines = f.read().split('\n')
+from colorama import init
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+
+init(autoreset=True)
+
+TEST_SOLUTIONS = {
+    "input_a.txt": {
+        "part1": 4361,
+        "part2": 467835,
+    },
+    "input_b.txt": {
+        "part1": 4361,
+        "part2": 467835,
+    },
+    "input.txt": {
+        "part1": 509115,
+        "part2": 75220503,
+    },
+}
+
+SYMBOLS = {'#', '$', '%', '&', '*', '+', '-', '/', '=', '@'}
+
+ADJS = [
+    (-1, -1), (0, -1), (1, -1),
+    (-1, 0), (1, 0),
+    (-1, 1), (0, 1), (1, 1)
+]
+
+
+def parse(content):
+    """
+    Parse stage shared by both parts: the schematic lines
+    """
+    return content.strip().split('\n')
+
+
+def find_numbers(lines):
+    """
+    Every number of the schematic with the positions of its digits.
+    A number ends at the first non digit or at the end of its line.
+    """
+    numbers = []
+    k = ''
+    pos = []
+    for i, line in enumerate(lines):
+        if k:
+            numbers.append((k, pos))
+            k = ''
+            pos = []
+        for j, c in enumerate(line):
+            if k and c not in digits:
+                numbers.append((k, pos))
+                k = ''
+                pos = []
+            if c in digits:
+                k += c
+                pos.append((i, j))
+    if k:
+        numbers.append((k, pos))
+    return numbers
 
 
 #########################
 ###      PART A      ####
 #########################
 
-answer_a = 0
-sd = defaultdict(bool)
-symbols = {'#', '$', '%', '&', '*', '+', '-', '/', '=', '@'}
-
-for i, line in enumerate(lines):
-    for j, c in enumerate(line):
-        if c in symbols:
-            sd[(i, j)] = True
-
-seen = set()
-k = ''
-pos = []
-
-def _check_adjacencies():
-    adjs = [
-        (-1, -1), (0, -1), (1, -1),
-        (-1, 0), (1, 0),
-        (-1, 1), (0, 1), (1, 1)
-    ]
-    for x, y in pos:
-        for a, b in adjs:
+def _check_adjacencies(positions, sd):
+    for x, y in positions:
+        for a, b in ADJS:
             if (x + a, y + b) in sd:
-                return int(k)
+                return True
+    return False
 
-    return 0
 
-for i, line in enumerate(lines):
-    if k:
-        answer_a += _check_adjacencies()
-        k = ''
-        pos = []
-    for j, c in enumerate(line):
-        if c in symbols or c == '.':
-            answer_a += _check_adjacencies()
-            k = ''
-            pos = []
-        if c in digits:
-            k += c
-            pos.append((i, j))
+def part1(lines):
+    start_time = time.time()
+    sd = set()
 
-print('ANSWER Part A -> ', answer_a)
+    for i, line in enumerate(lines):
+        for j, c in enumerate(line):
+            if c in SYMBOLS:
+                sd.add((i, j))
+
+    answer_a = sum(int(number) for number, positions in find_numbers(lines)
+                   if _check_adjacencies(positions, sd))
+
+    return {
+        "value": answer_a,
+        "execution_time": time.time() - start_time
+    }
 
 
 #########################
 ###      PART B      ####
 #########################
 
-answer_b = 0
-sd = defaultdict(bool)
-gears = []
-numbers = []
-
-for i, line in enumerate(lines):
-    for j, c in enumerate(line):
-        if c == '*':
-            gears.append((i, j))
-
-seen = set()
-k = ''
-pos = []
-
-for i, line in enumerate(lines):
-    if k:
-        numbers.append((k, list(pos)))
-        k = ''
-        pos = []
-    for j, c in enumerate(line):
-        if k and c not in digits:
-            numbers.append((k, list(pos)))
-            k = ''
-            pos = []
-        if c in digits:
-            k += c
-            pos.append((i, j))
-
-def _check_adjacencies(xg, yg):
+def _gear_numbers(xg, yg, numbers):
     tmp = []
-    adjs = [
-        (-1, -1), (0, -1), (1, -1),
-        (-1, 0), (1, 0),
-        (-1, 1), (0, 1), (1, 1)
-    ]
     for number, positions in numbers:
-        for a, b in adjs:
+        for a, b in ADJS:
             if (xg + a, yg + b) in positions:
                 tmp.append(int(number))
                 break
     return tmp
 
-for gear in gears:
-    x = _check_adjacencies(*gear)
-    if len(x) == 2:
-        answer_b += (x[0] * x[1])
 
-print('ANSWER Part B -> ', answer_b)
\ No newline at end of file
+def part2(lines):
+    start_time = time.time()
+    answer_b = 0
+    gears = []
+
+    for i, line in enumerate(lines):
+        for j, c in enumerate(line):
+            if c == '*':
+                gears.append((i, j))
+
+    numbers = find_numbers(lines)
+    for gear in gears:
+        x = _gear_numbers(*gear, numbers)
+        if len(x) == 2:
+            answer_b += (x[0] * x[1])
+
+    return {
+        "value": answer_b,
+        "execution_time": time.time() - start_time
+    }
+
+
+if __name__ == "__main__":
+    run_day(__file__)
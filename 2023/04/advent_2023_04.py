@@ -1,64 +1,88 @@
 #!/usr/bin/python3
 
+import os
+import sys
 import time
-
-start_time = time.time()
-
 from collections import deque
+from colorama import init
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+
+init(autoreset=True)
+
+TEST_SOLUTIONS = {
+    "input_a.txt": {
+        "part1": 13,
+        "part2": 30,
+    },
+    "input_b.txt": {
+        "part1": 13,
+        "part2": 30,
+    },
+    "input.txt": {
+        "part1": 25004,
+        "part2": 14427616,
+    },
+}
+
+
+def parse_card(line):
+    """
+    Card id and how many of our numbers are winning numbers
+    """
+    cid, numbers = line.split(':')
+    cid = int(cid[4:])
+    winner, ours = numbers.split('|')
+    matches = set(winner.split()) & set(ours.split())
+    return cid, len(matches)
 
-# with open("inp_test_a.txt") as f:
-#     lines = f.read().split('\n')
-
-# with open("inp_test_b.txt") as f:
-#     lines = f.read().split('\n')
 
-with open("inp.txt") as f:
-    lines = f.read().split('\n')
+def parse(content):
+    """
+    Parse stage shared by both parts: the matches of every card
+    """
+    return [parse_card(line) for line in content.strip().split('\n')]
 
 
 #########################
 ###      PART A      ####
 #########################
 
-answer_a = 0
+def part1(cards):
+    start_time = time.time()
+    answer_a = 0
 
-for line in lines:
-    _, numbers = line.split(':')
-    winner, ours = numbers.split('|')
-    matches = set(winner.split()) & set(ours.split())
-    
-    if matches:
-        answer_a += 2 ** (len(matches) - 1)
+    for _, matches in cards:
+        if matches:
+            answer_a += 2 ** (matches - 1)
 
-print('ANSWER Part A ->', answer_a)
+    return {
+        "value": answer_a,
+        "execution_time": time.time() - start_time
+    }
 
 
 #########################
 ###      PART B      ####
 #########################
 
-answer_b = 0
-d = {}
-q = deque()
-
-for line in lines:
-    cid, numbers = line.split(':')
-    cid = int(cid[4:])
-    winner, ours = numbers.split('|')
-    ws = set(winner.split())
-    os = set(ours.split())
-    matches = ws & os
-    d[cid] = len(matches)
-    q.append(cid)
+def part2(cards):
+    start_time = time.time()
+    answer_b = 0
+    d = dict(cards)
+    q = deque(cid for cid, _ in cards)
 
-while q:
-    answer_b += 1
-    k = q.popleft()
-    q.extend(range(k + 1, k + d[k] + 1))
+    while q:
+        answer_b += 1
+        k = q.popleft()
+        q.extend(range(k + 1, k + d[k] + 1))
 
-print('ANSWER Part B ->', answer_b)
+    return {
+        "value": answer_b,
+        "execution_time": time.time() - start_time
+    }
 
 
-end_time = time.time()
-execution_time = end_time - start_time
-print(f"Execution time: {execution_time} seconds")
\ No newline at end of file
+if __name__ == "__main__":
+    run_day(__file__)
@@ -1,10 +1,30 @@
 #!/usr/bin/python3
 
-import pathlib
 import os
-from colorama import init, Fore
+import sys
+import time
+from colorama import init
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+
 init(autoreset=True)
 
+TEST_SOLUTIONS = {
+    "input_a.txt": {
+        "part1": 35,
+        "part2": 46,
+    },
+    "input_b.txt": {
+        "part1": 35,
+        "part2": 46,
+    },
+    "input.txt": {
+        "part1": 214922730,
+        "part2": 148041808,
+    },
+}
+
 def parse_data(puzzle_input):
     blocks = [lines.split("\n") for lines in puzzle_input.split("\n\n")]
     seeds = [int(seed) for seed in blocks[0][0].split()[1:]]
@@ -14,17 +34,31 @@ def parse_data(puzzle_input):
     ]
     return seeds, transforms
 
+def parse(content):
+    """
+    Parse stage shared by both parts
+    """
+    return parse_data(content.strip())
+
 def part1(data):
+    start_time = time.time()
     seeds, transforms = data
     locations = plant_seed_ranges([(seed, seed + 1) for seed in seeds], transforms)
-    return min(locations)[0]
+    return {
+        "value": min(locations)[0],
+        "execution_time": time.time() - start_time
+    }
 
 def part2(data):
+    start_time = time.time()
     seeds, transforms = data
     locations = plant_seed_ranges(
         [(seed, seed + num) for seed, num in zip(seeds[::2], seeds[1::2])], transforms
     )
-    return min(locations)[0]
+    return {
+        "value": min(locations)[0],
+        "execution_time": time.time() - start_time
+    }
 
 def plant_seed_ranges(seeds, transforms):
     """Plant ranges of seeds."""
@@ -52,21 +86,6 @@ def grow_range(seed_start, seed_stop, transform):
 
     return [(seed_start, seed_stop)]
 
-def solve(input_file):
-    data = parse_data(input_file)
-    yield part1(data)
-    yield part2(data)
 
 if __name__ == "__main__":
-    dir_input = "./input"
-
-    file_input = os.listdir(dir_input)
-
-    for file_name in file_input:
-        file_path = os.path.join(dir_input, file_name)
-
-        print(f"\n{Fore.YELLOW}{file_path}:")
-        input_file = pathlib.Path(file_path).read_text().rstrip()
-        solutions = solve(input_file)
-        print("\n".join(str(solution) for solution in solutions))
-        print("\n****************************************************")
\ No newline at end of file
+    run_day(__file__)
@@ -1,12 +1,31 @@
 #!/usr/bin/python3
 
-import time
-import pathlib
 import os
+import sys
+import time
 import math
-from colorama import init, Fore
+from colorama import init
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+
 init(autoreset=True)
 
+TEST_SOLUTIONS = {
+    "input_a.txt": {
+        "part1": 288,
+        "part2": 71503,
+    },
+    "input_b.txt": {
+        "part1": 71503,
+        "part2": 71503,
+    },
+    "input.txt": {
+        "part1": 227850,
+        "part2": 42948149,
+    },
+}
+
 def parse_data(puzzle_input):
     part1 = [
         [int(num) for num in line.split()[1:]] for line in puzzle_input.split("\n")
@@ -16,13 +35,28 @@ def parse_data(puzzle_input):
     )
     return list(zip(*part1)), part2
 
+
+def parse(content):
+    """
+    Parse stage shared by both parts
+    """
+    return parse_data(content.strip())
+
 def part1(data):
+    start_time = time.time()
     records, _ = data
-    return math.prod(find_num_records(time, distance) for time, distance in records)
+    return {
+        "value": math.prod(find_num_records(race_time, distance) for race_time, distance in records),
+        "execution_time": time.time() - start_time
+    }
 
 def part2(data):
-    _, (time, distance) = data
-    return find_num_records(time, distance)
+    start_time = time.time()
+    _, (race_time, distance) = data
+    return {
+        "value": find_num_records(race_time, distance),
+        "execution_time": time.time() - start_time
+    }
 
 def find_num_records(time, distance):
     """Find the number of records.
@@ -54,36 +88,6 @@ def find_num_records(time, distance):
 
     return time - 2 * high + 1
 
-def solve(input_file):
-    data = parse_data(input_file)
-    yield part1(data)
-    yield part2(data)
 
 if __name__ == "__main__":
-    dir_input = "./input"
-
-    file_input = os.listdir(dir_input)
-
-    for file_name in file_input:
-        start_time = time.time()
-
-        file_path = os.path.join(dir_input, file_name)
-
-        print(f"{Fore.YELLOW}{file_path}:")
-        
-        try:
-            input_file = pathlib.Path(file_path).read_text().rstrip()
-            if not input_file:
-                print("⚠️  Input file is empty.")
-            else:
-                solutions = solve(input_file)
-                print("\n".join(str(solution) for solution in solutions))
-        except Exception as e:
-            print(f"🔴  Error reading or processing the file: {e}")
-
-        end_time = time.time()
-        execution_time = end_time - start_time
-        execution_time_rounded = "{:.4f}".format(execution_time)
-        print(f"Execution time: {execution_time_rounded} s")
-
-        print("*" * 50)
\ No newline at end of file
+    run_day(__file__)
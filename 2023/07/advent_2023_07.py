@@ -1,15 +1,33 @@
 #!/usr/bin/python3
 
 import os
-import time
-import pathlib
 import sys
+import time
 
 import collections
 
-from colorama import init, Fore
+from colorama import init
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+
 init(autoreset=True)
 
+TEST_SOLUTIONS = {
+    "input_a.txt": {
+        "part1": 6440,
+        "part2": 5905,
+    },
+    "input_b.txt": {
+        "part1": 6440,
+        "part2": 5905,
+    },
+    "input_x.txt": {
+        "part1": 250058342,
+        "part2": 250506580,
+    },
+}
+
 # Function to parse the input data
 def parse_data(puzzle_input):
     data = []
@@ -20,19 +38,31 @@ def parse_data(puzzle_input):
         data.append((cards, int(bid)))
     return data
 
+# Parse stage shared by both parts
+def parse(content):
+    return parse_data(content.strip())
+
 # Function to solve part 1 of the puzzle
 def part1(data):
+    start_time = time.time()
     # Sort the cards based on their rank and calculate the score
     cards = sorted(((rank_cards(cards), bid) for cards, bid in data), reverse=True)
-    return sum(rank * bid for rank, (_, bid) in enumerate(cards, start=1))
+    return {
+        "value": sum(rank * bid for rank, (_, bid) in enumerate(cards, start=1)),
+        "execution_time": time.time() - start_time
+    }
 
 # Function to solve part 2 of the puzzle
 def part2(data):
     # Sort the cards based on their rank (using joker) and calculate the score
+    start_time = time.time()
     cards = sorted(
         ((rank_cards(cards, use_joker=True), bid) for cards, bid in data), reverse=True
     )
-    return sum(rank * bid for rank, (_, bid) in enumerate(cards, start=1))
+    return {
+        "value": sum(rank * bid for rank, (_, bid) in enumerate(cards, start=1)),
+        "execution_time": time.time() - start_time
+    }
 
 # Function to rank the cards based on their type and order
 def rank_cards(cards, use_joker=False):
@@ -74,36 +104,6 @@ def classify(cards, use_joker):
         # Raise an error if the hand couldn't be classified
         raise ValueError(f"couldn't classify {cards}")
 
-def solve(input_file):
-    data = parse_data(input_file)
-    yield part1(data)
-    yield part2(data)
 
 if __name__ == "__main__":
-    dir_input = "./input"
-
-    file_input = os.listdir(dir_input)
-
-    for file_name in file_input:
-        start_time = time.time()
-
-        file_path = os.path.join(dir_input, file_name)
-
-        print(f"{Fore.YELLOW}{file_path}:")
-        
-        try:
-            input_file = pathlib.Path(file_path).read_text().rstrip()
-            if not input_file:
-                print("⚠️  Input file is empty.")
-            else:
-                solutions = solve(input_file)
-                print("\n".join(str(solution) for solution in solutions))
-        except Exception as e:
-            print(f"🔴  Error reading or processing the file: {e}")
-
-        end_time = time.time()
-        execution_time = end_time - start_time
-        execution_time_rounded = "{:.4f}".format(execution_time)
-        print(f"Execution time: {execution_time_rounded} s")
-
-        print("*" * 50)
\ No newline at end of file
+    run_day(__file__)
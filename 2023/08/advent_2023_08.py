@@ -1,14 +1,36 @@
 #!/usr/bin/python3
 
 import os
-import time
-import pathlib
 import sys
+import time
 
 import itertools
-from colorama import init, Fore
+from colorama import init
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+
 init(autoreset=True)
 
+TEST_SOLUTIONS = {
+    "input_a.txt": {
+        "part1": 2,
+        "part2": 2,
+    },
+    "input_b.txt": {
+        "part1": 6,
+        "part2": 6,
+    },
+    "input_c.txt": {
+        "part1": None,
+        "part2": 6,
+    },
+    "input_x.txt": {
+        "part1": 24253,
+        "part2": 12357789728873,
+    },
+}
+
 def parse_data(puzzle_input):
     # Split the puzzle input into path and nodes
     path, nodes = puzzle_input.split("\n\n")
@@ -21,6 +43,10 @@ def parse_data(puzzle_input):
 
     return path_list, nodes_dict
 
+def parse(content):
+    # Parse stage shared by both parts
+    return parse_data(content.strip())
+
 def parse_node(node):
     # Split the node into starting point and targets
     start, targets = node.split(" = ")
@@ -51,15 +77,23 @@ def part1(data):
     # Unpack data into path and nodes
     path, nodes = data
     
-    # Call the walk_path function and return the result
-    return walk_path(nodes, path)
+    start_time = time.time()
+    # The part 2 example has no "AAA" node to start from
+    value = walk_path(nodes, path) if "AAA" in nodes else None
+    return {
+        "value": value,
+        "execution_time": time.time() - start_time
+    }
 
 def part2(data):
     # Unpack data into path and nodes
     path, nodes = data
     
-    # Call the walk_ghost_path function and return the result
-    return walk_ghost_path(nodes, path)
+    start_time = time.time()
+    return {
+        "value": walk_ghost_path(nodes, path),
+        "execution_time": time.time() - start_time
+    }
 
 def walk_path(nodes, path):
     # Start at node "AAA"
@@ -94,34 +128,6 @@ def walk_ghost_path(nodes, path):
         # Update the current nodes based on the turn
         current = [nodes[node][turn] for node in current]
 
-def solve(input_file):
-    data = parse_data(input_file)
-    yield part1(data)
-    yield part2(data)
 
 if __name__ == "__main__":
-    dir_input = "./input"
-    file_input = os.listdir(dir_input)
-
-    for file_name in file_input:
-        start_time = time.time()
-        file_path = os.path.join(dir_input, file_name)
-
-        print(f"{Fore.YELLOW}{file_path}:")
-
-        try:
-            input_file = pathlib.Path(file_path).read_text().rstrip()
-            if not input_file:
-                print("⚠️  Input file is empty.")
-            else:
-                solutions = solve(input_file)
-                print("\n".join(str(solution) for solution in solutions))
-        except Exception as e:
-            print(f"🔴  Error reading or processing the file: {e}")
-
-        end_time = time.time()
-        execution_time = end_time - start_time
-        execution_time_rounded = "{:.4f}".format(execution_time)
-        print(f"Execution time: {execution_time_rounded} s")
-
-        print("*" * 50)
+    run_day(__file__)
@@ -71,9 +71,15 @@ Once again consider your left and right lists. What is their similarity score?
 '''
 
 import os
-from colorama import init, Fore
+import sys
+import time
 
-init(autoreset=True)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import inputs
+from aoc.runner import run_day
+
+# The input is streamed from disk instead of being read into one string
+STREAM_INPUT = True
 
 
 def calculate_min_total_distance(left_list, right_list):
@@ -118,54 +124,50 @@ def calculate_similarity_score(left_list, right_list):
     return similarity_score
 
 
-def process_file(filepath):
+def parse_lists(source):
     """
-    Process a single file containing two columns of integer data.
-    The function reads the file, processes the integers into two lists, and 
-    calculates:
-    - The minimum total distance between the two lists.
-    - The similarity score between the two lists.
+    Parse the two columns of integer data into a left and a right list.
+    The input is streamed line by line, only the integers are kept.
     """
-    with open(filepath, 'r') as file:
-        lines = file.readlines()
-        left_list, right_list = [], []
-        for line in lines:
-            left, right = map(int, line.strip().split())
+    left_list, right_list = [], []
+    for line in inputs.lines(source):
+        if line.strip():
+            left, right = map(int, line.split())
             left_list.append(left)
             right_list.append(right)
-        
-        part1_result = calculate_min_total_distance(left_list, right_list)
-        part2_result = calculate_similarity_score(left_list, right_list)
-        return part1_result, part2_result
+    return left_list, right_list
+
+
+def parse(source):
+    """
+    Parse stage shared by both parts: the left and right lists.
+    """
+    return parse_lists(source)
+
+
+def part1(lists):
+    """
+    Solution for Part 1: The minimum total distance between the two lists.
+    """
+    start_time = time.time()
+    left_list, right_list = lists
+    return {
+        "value": calculate_min_total_distance(left_list, right_list),
+        "execution_time": time.time() - start_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part2(lists):
     """
-    Processes all files in the specified directory.
+    Solution for Part 2: The similarity score between the two lists.
     """
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    start_time = time.time()
+    left_list, right_list = lists
+    return {
+        "value": calculate_similarity_score(left_list, right_list),
+        "execution_time": time.time() - start_time
+    }
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-    
-    for file, result in results.items():
-        if result[0]: 
-            part1, part2 = result[1], result[2]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Min Total Distance): {Fore.GREEN}{part1}")
-            print(f"  {Fore.YELLOW}Part 2 (Similarity Score): {Fore.GREEN}{part2}")
-        else:  
-            print(f"{Fore.BLUE}{file}: {Fore.RED}{result[1]}")
+    run_day(__file__)
@@ -0,0 +1,16 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2024/01: size lines of two location IDs.
+"""
+
+SIZES = (10000, 100000, 1000000)
+
+
+def generate(size, rng):
+    """
+    size lines of "left   right", IDs drawn from a small range so that the
+    similarity score has repeats to count
+    """
+    return ''.join(f"{rng.randint(10000, 99999)}   {rng.randint(10000, 99999)}\n"
+                   for _ in range(size))
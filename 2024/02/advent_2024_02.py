@@ -55,9 +55,15 @@ Update your analysis by handling situations where the Problem Dampener can remov
 '''
 
 import os
-from colorama import init, Fore
+import sys
+import time
 
-init(autoreset=True)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import inputs
+from aoc.runner import run_day
+
+# The input is streamed from disk instead of being read into one string
+STREAM_INPUT = True
 
 
 def is_safe_report(levels):
@@ -97,61 +103,62 @@ def can_be_safe_with_one_removal(levels):
     return False
 
 
-def process_file(filepath):
+def parse_levels(line):
     """
-    Processes a single file containing reports and counts:
-    - Safe reports.
-    - Reports that become safe after removing one level.
+    Parses one report into its list of levels.
     """
-    with open(filepath, 'r') as file:
-        lines = file.readlines()
-        safe_count = 0
-        safe_with_removal_count = 0
-        
-        for line in lines:
-            levels = list(map(int, line.strip().split()))
-            if is_safe_report(levels):
-                safe_count += 1
-            elif can_be_safe_with_one_removal(levels):
-                safe_with_removal_count += 1
-        
-        total_safe = safe_count + safe_with_removal_count
-    
-        part1_result = safe_count
-        part2_result = total_safe
-        return part1_result, part2_result
+    return list(map(int, line.split()))
 
 
-def process_directory(input_dir="./input/"):
+def parse_reports(source):
     """
-    Processes all files in the specified directory.
+    Lazy view of the reports, one list of levels per line. Each part streams
+    through the input once, so only one report is in memory at a time.
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    return inputs.Records(source, parse_levels)
+
+
+def parse(source):
+    """
+    Parse stage shared by both parts: the reports.
+    """
+    return parse_reports(source)
+
+
+def part1(reports):
+    """
+    Solution for Part 1: Counts the safe reports.
+    """
+    start_time = time.time()
+    safe_count = 0
+
+    for levels in reports:
+        if is_safe_report(levels):
+            safe_count += 1
+
+    return {
+        "value": safe_count,
+        "execution_time": time.time() - start_time
+    }
+
+
+def part2(reports):
+    """
+    Solution for Part 2: Counts the reports that are safe, or become safe
+    after removing one level.
+    """
+    start_time = time.time()
+    total_safe = 0
+
+    for levels in reports:
+        if is_safe_report(levels) or can_be_safe_with_one_removal(levels):
+            total_safe += 1
+
+    return {
+        "value": total_safe,
+        "execution_time": time.time() - start_time
+    }
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-    
-    for file, result in results.items():
-        if result[0]:  # Successfully processed
-            part1, part2 = result[1], result[2]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Safe reports): {Fore.GREEN}{part1}")
-            print(f"  {Fore.YELLOW}Part 2 (Safe reports with one removal): {Fore.GREEN}{part2}")
-        else:  # Error during processing
-            print(f"{Fore.CYAN}{file}: {Fore.RED}Error - {result[1]}")
+    run_day(__file__)
@@ -0,0 +1,28 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2024/02: size reports of 5 to 8 levels.
+"""
+
+SIZES = (10000, 100000, 1000000)
+
+
+def generate_report(rng):
+    """
+    Mostly monotonic levels with steps of 1-3, with the odd bad step mixed in
+    """
+    sign = rng.choice((-1, 1))
+    level = rng.randint(20, 80)
+    levels = [level]
+    for _ in range(rng.randint(4, 7)):
+        step = rng.randint(1, 3) if rng.random() < 0.9 else rng.randint(-3, 5)
+        level += sign * step
+        levels.append(level)
+    return ' '.join(map(str, levels))
+
+
+def generate(size, rng):
+    """
+    size report lines
+    """
+    return ''.join(generate_report(rng) + '\n' for _ in range(size))
@@ -39,130 +39,87 @@ Handle the new instructions; what do you get if you add up all of the results of
 '''
 
 import os
-from colorama import init, Fore
+import sys
+import time
 
-init(autoreset=True)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import inputs
+from aoc.runner import run_day
+
+# The input is streamed from disk instead of being read into one string
+STREAM_INPUT = True
 
 import re
 
-def sum_valid_mul_results(content: str) -> int:
+# Regex pattern to match multiplication operations:
+#   1. 'mul' - literal text
+#   2. '(' - opening parenthesis
+#   3. (\d{1,3}) - first number (1-3 digits)
+#   4. ',' - comma separator
+#   5. (\d{1,3}) - second number (1-3 digits)
+#   6. ')' - closing parenthesis
+MUL_PATTERN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)")
+
+# mul(X,Y) with numbers of any length, plus the do() and don't() controls
+CONTROL_PATTERN = re.compile(rb"mul\((\d+),(\d+)\)|do\(\)|don't\(\)")
+
+
+def sum_valid_mul_results(source) -> int:
     """
-    Computes the sum of valid `mul(X,Y)` operations in the given conetnt string.
+    Computes the sum of valid `mul(X,Y)` operations in the given content.
+    The regex scans the bytes directly, a memory map for streamed inputs.
     """
-    # Regex pattern to match multiplication operations:
-        # 1. 'mul' - literal text
-        # 2. '(' - opening parenthesis
-        # 3. (\d{1,3}) - first number (1-3 digits)
-        # 4. ',' - comma separator
-        # 5. (\d{1,3}) - second number (1-3 digits)
-        # 6. ')' - closing parenthesis
-    pattern = r"mul\((\d{1,3}),(\d{1,3})\)"
-    
-    # Find all matches
-    matches = re.findall(pattern, content)
-
     total_sum = 0
 
-    for x, y in matches:
-        total_sum += int(x) * int(y)
+    with inputs.buffer(source) as program:
+        for match in MUL_PATTERN.finditer(program):
+            total_sum += int(match.group(1)) * int(match.group(2))
     
     return total_sum
 
 
-def sum_valid_mul_results_with_control(content: str) -> int:
+def sum_valid_mul_results_with_control(source) -> int:
     """
-    Computes the sum of valid and enabled `mul(X,Y)` operations in the given content string,
+    Computes the sum of valid and enabled `mul(X,Y)` operations in the given content,
     considering the effect of `do()` and `don't()` instructions.
     """
-    pos = 0
     enabled = True  # Instructions start enabled
     total_sum = 0
-    
-    while pos < len(content):
-        # Check for do()
-        if content[pos:].startswith('do()'):
-            enabled = True
-            pos += 4
-            continue
-            
-        # Check for don't() - be careful not to match 'undo()'
-        if content[pos:].startswith("don't()"):
-            enabled = False
-            pos += 7
-            continue
-            
-        # Check for mul(X,Y)
-        if content[pos:].startswith('mul('):
-            pos += 4
-            # Extract numbers
-            num1 = ''
-            while pos < len(content) and content[pos].isdigit():
-                num1 += content[pos]
-                pos += 1
-                
-            # Must be followed by comma
-            if pos < len(content) and content[pos] == ',':
-                pos += 1
-                num2 = ''
-                while pos < len(content) and content[pos].isdigit():
-                    num2 += content[pos]
-                    pos += 1
-                    
-                # Must be followed by closing parenthesis
-                if pos < len(content) and content[pos] == ')' and num1 and num2:
-                    if enabled:
-                        total_sum += int(num1) * int(num2)
-                    pos += 1
-                    continue
-                    
-        pos += 1
+
+    with inputs.buffer(source) as program:
+        for match in CONTROL_PATTERN.finditer(program):
+            instruction = match.group(0)
+            if instruction == b"do()":
+                enabled = True
+            elif instruction == b"don't()":
+                enabled = False
+            elif enabled:
+                total_sum += int(match.group(1)) * int(match.group(2))
         
     return total_sum
 
 
-def process_file(filepath):
+def part1(content):
     """
-    Processes a single file containing reports and counts:
-    - Total sum of all mul operations
-    - Total sum of enabled mul operations considering do/don't controls
+    Solution for Part 1: Total sum of all mul operations
     """
-    with open(filepath, 'r') as file:
-        content = file.read()
-        part1_result = sum_valid_mul_results(content)
-        part2_result = sum_valid_mul_results_with_control(content)
-        return part1_result, part2_result
+    start_time = time.time()
+    return {
+        "value": sum_valid_mul_results(content),
+        "execution_time": time.time() - start_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part2(content):
     """
-    Processes all files in the specified directory.
+    Solution for Part 2: Total sum of enabled mul operations considering do/don't controls
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    start_time = time.time()
+    return {
+        "value": sum_valid_mul_results_with_control(content),
+        "execution_time": time.time() - start_time
+    }
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-    
-    for file, result in results.items():
-        if result[0]:  # Successfully processed
-            part1, part2 = result[1], result[2]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Sum valid mul results): {Fore.GREEN}{part1}")
-            print(f"  {Fore.YELLOW}Part 2 (Sum valid mul results with control): {Fore.GREEN}{part2}")
-        else:  # Error during processing
-            print(f"{Fore.CYAN}{file}: {Fore.RED}Error - {result[1]}")
+    run_day(__file__)
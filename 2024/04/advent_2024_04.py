@@ -72,9 +72,11 @@ Flip the word search from the instructions back over to the word search side and
 '''
 
 import os
-from colorama import init, Fore
+import sys
+import time
 
-init(autoreset=True)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
 
 
 def parse_grid(content):
@@ -200,50 +202,34 @@ def search_xmas_x(grid):
     return total_found
 
 
-def process_file(filepath):
+def parse(content):
     """
-    Processes a single file containing a word search grid:
-    - Counts all occurrences of 'XMAS'.
-    - Counts all occurrences of 'X-MAS' patterns.
+    Parse stage shared by both parts: the letter grid.
     """
-    with open(filepath, 'r') as file:
-        content = file.read()
-        grid = parse_grid(content)
-        part1_result = search_xmas(grid)
-        part2_result = search_xmas_x(grid)
-        return part1_result, part2_result
+    return parse_grid(content)
 
 
-def process_directory(input_dir="./input/"):
+def part1(grid):
     """
-    Processes all files in the specified directory.
+    Solution for Part 1: Counts all occurrences of 'XMAS'.
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    start_time = time.time()
+    return {
+        "value": search_xmas(grid),
+        "execution_time": time.time() - start_time
+    }
+
+
+def part2(grid):
+    """
+    Solution for Part 2: Counts all occurrences of 'X-MAS' patterns.
+    """
+    start_time = time.time()
+    return {
+        "value": search_xmas_x(grid),
+        "execution_time": time.time() - start_time
+    }
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-    
-    for file, result in results.items():
-        if result[0]:  # Successfully processed
-            part1, part2 = result[1], result[2]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Occurrences of 'XMAS':): {Fore.GREEN}{part1}")
-            print(f"  {Fore.YELLOW}Part 2 (Occurrences of 'X-MAS':): {Fore.GREEN}{part2}")
-        else:  # Error during processing
-            print(f"{Fore.CYAN}{file}: {Fore.RED}Error - {result[1]}")
+    run_day(__file__)
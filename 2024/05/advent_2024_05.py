@@ -90,9 +90,11 @@ Find the updates which are not in the correct order. What do you get if you add
 '''
 
 import os
-from colorama import init, Fore
+import sys
+import time
 
-init(autoreset=True)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
 
 
 def parse_input(content):
@@ -244,49 +246,27 @@ def sum_middle_page_numbers_after_sorting(content):
     return middle_sum
 
 
-def process_file(filepath):
+def part1(content):
     """
-    Process a single file and return results for both parts:
-    - Sum of middle page numbers from correct order rules
-    - Sum of middle page numbers after sorting incorrect order rules
+    Solution for Part 1: Sum of middle page numbers from correct order rules
     """
-    with open(filepath, 'r') as file:
-        content = file.read()
-        part1_result = sum_middle_page_numbers(content)
-        part2_result = sum_middle_page_numbers_after_sorting(content)
-        return part1_result, part2_result
+    start_time = time.time()
+    return {
+        "value": sum_middle_page_numbers(content),
+        "execution_time": time.time() - start_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part2(content):
     """
-    Processes all files in the specified directory.
+    Solution for Part 2: Sum of middle page numbers after sorting incorrect order rules
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    start_time = time.time()
+    return {
+        "value": sum_middle_page_numbers_after_sorting(content),
+        "execution_time": time.time() - start_time
+    }
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-    
-    for file, result in results.items():
-        if result[0]:  # Successfully processed
-            part1, part2 = result[1], result[2]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Sum of middle page numbers from correct order rules): {Fore.GREEN}{part1}")
-            print(f"  {Fore.YELLOW}Part 2 (Sum of middle page numbers after sorting incorrect order rules): {Fore.GREEN}{part2}")
-        else:  # Error during processing
-            print(f"{Fore.CYAN}{file}: {Fore.RED}Error - {result[1]}")
+    run_day(__file__)
@@ -180,11 +180,29 @@ You need to get the guard stuck in a loop by adding a single new obstruction. Ho
 '''
 
 import os
-from colorama import init, Fore
+import sys
+import time
+from array import array
+from itertools import chain
 
-init(autoreset=True)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import counters, progress
+from aoc.runner import run_day
+from aoc.output import log, DETAIL
 
-from tqdm import tqdm
+# Directions: (North, East, South, West) as coordinate changes
+DIRECTIONS = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+
+# Jump table entry of a cell from which the guard walks off the map
+OFF_MAP = -1
+
+# Candidates from which part 2 is sharded over a process pool, and tasks
+# handed to each worker
+SHARD_MIN_CANDIDATES = 50_000
+SHARD_TASKS_PER_WORKER = 8
+
+# Jump tables and patrol path of the sharded search, set in each worker by start_shard_worker
+_shard = {}
 
 
 def parse_map(content):
@@ -220,54 +238,57 @@ def parse_map(content):
     return grid, guard_pos, direction
 
 
-def guard_movements(content):
+def patrol_path(grid, guard_pos, direction):
     """
-    Simulates guard patrol and counts distinct positions visited before leaving the mapped area.
+    Walks the guard's patrol until it leaves the map and lists every cell it
+    enters for the first time, in order, as (cell, previous cell, direction):
+    the state of the guard just before first stepping onto the cell.
+    Cells are flat indices (row * cols + col); the start is not listed.
     """
-    # Parse map and get initial state
-    grid, guard_pos, direction = parse_map(content)
     rows = len(grid)
     cols = len(grid[0])
 
-    # Directions: (North, East, South, West) as coordinate changes
-    directions = [(-1, 0), (0, 1), (1, 0), (0, -1)]  
-
-    # Initialize tracking variables
-    visited = set([guard_pos])
     r, c = guard_pos
-    max_steps = rows * cols * 4  # Maximum steps to prevent infinite loop
-    steps = 0
+    visited = {r * cols + c}
     states = set()
+    path = []
 
-    while steps < max_steps:
+    while True:
         # Current state is position + direction
         current_state = (r, c, direction)
         if current_state in states:
-            print(f"Loop detected at position ({r}, {c}) facing direction {direction}")
-            return len(visited)
-            
+            log(f"Loop detected at position ({r}, {c}) facing direction {direction}", level=DETAIL)
+            return path
         states.add(current_state)
-        
-        dr, dc = directions[direction]
+
+        dr, dc = DIRECTIONS[direction]
         next_r, next_c = r + dr, c + dc
 
         # First check if we're about to leave the map
         if next_r < 0 or next_r >= rows or next_c < 0 or next_c >= cols:
-            return len(visited)  # Guard is about to leave the map
+            return path
 
         # Check if next position is blocked
         if grid[next_r][next_c] == '#':
             # Turn right
             direction = (direction + 1) % 4
-        else:
-            # Move forward
-            r, c = next_r, next_c
-            visited.add((r, c))
+            continue
 
-        steps += 1
-        
-    print(f"Reached maximum steps ({max_steps})")
-    return len(visited)
+        # Move forward
+        cell = next_r * cols + next_c
+        if cell not in visited:
+            visited.add(cell)
+            path.append((cell, r * cols + c, direction))
+        r, c = next_r, next_c
+
+
+def guard_movements(content):
+    """
+    Simulates guard patrol and counts distinct positions visited before leaving the mapped area.
+    """
+    grid, guard_pos, direction = parse_map(content)
+    # The starting cell plus every cell entered for the first time
+    return len(patrol_path(grid, guard_pos, direction)) + 1
 
 
 def simulate_guard_movement(grid, start_pos, start_direction):
@@ -308,17 +329,230 @@ def simulate_guard_movement(grid, start_pos, start_direction):
         else:
             r = next_r
             c = next_c
-            # If we've seen this state before, it's a loop
-            if visited[r][c][direction]:
-                return True
-            visited[r][c][direction] = True
+        # If we've seen this state before, it's a loop (turning in place too)
+        if visited[r][c][direction]:
+            return True
+        visited[r][c][direction] = True
             
     return True
 
 
-def obstacle_positions(content):
+def build_jump_tables(grid):
+    """
+    For each direction (N, E, S, W), the cell where the guard walking
+    straight from a cell stops in front of an obstruction, or OFF_MAP if the
+    guard walks off the map first. Tables are flat, indexed by row * cols + col.
+    """
+    rows = len(grid)
+    cols = len(grid[0])
+    north, east, south, west = ([OFF_MAP] * (rows * cols) for _ in range(4))
+
+    for c in range(cols):
+        stop = OFF_MAP
+        for r in range(rows):
+            if grid[r][c] == '#':
+                stop = (r + 1) * cols + c
+            else:
+                north[r * cols + c] = stop
+        stop = OFF_MAP
+        for r in range(rows - 1, -1, -1):
+            if grid[r][c] == '#':
+                stop = (r - 1) * cols + c
+            else:
+                south[r * cols + c] = stop
+
+    for r in range(rows):
+        stop = OFF_MAP
+        for c in range(cols - 1, -1, -1):
+            if grid[r][c] == '#':
+                stop = r * cols + c - 1
+            else:
+                east[r * cols + c] = stop
+        stop = OFF_MAP
+        for c in range(cols):
+            if grid[r][c] == '#':
+                stop = r * cols + c + 1
+            else:
+                west[r * cols + c] = stop
+
+    return [north, east, south, west]
+
+
+def simulate_with_obstruction(jumps, cols, start, direction, extra, seen, generation):
+    """
+    Follows the guard from cell start facing direction, one straight run per
+    step, with an extra obstruction at cell extra (>= 0).
+    Returns True if the guard gets stuck in a loop, False if the guard exits the map.
+
+    The extra obstruction is not written into the tables: each run is cut
+    short in front of it when it lies between the guard and the run's stop.
+    States are stamped in seen (4 slots per cell) with generation, so a
+    reused array needs no clearing as long as every call has a new one.
+    """
+    extra_r, extra_c = divmod(extra, cols)
+    pos = start
+    runs = 0
+
+    while True:
+        runs += 1
+        stop = jumps[direction][pos]
+        r, c = divmod(pos, cols)
+        if direction == 0:
+            if c == extra_c and extra_r < r and (stop == OFF_MAP or stop // cols <= extra_r):
+                stop = extra + cols
+        elif direction == 1:
+            if r == extra_r and c < extra_c and (stop == OFF_MAP or extra_c <= stop % cols):
+                stop = extra - 1
+        elif direction == 2:
+            if c == extra_c and r < extra_r and (stop == OFF_MAP or extra_r <= stop // cols):
+                stop = extra - cols
+        elif r == extra_r and extra_c < c and (stop == OFF_MAP or stop % cols <= extra_c):
+            stop = extra + 1
+
+        if stop == OFF_MAP:
+            counters.add("guard_runs", runs)
+            return False
+
+        # The guard stands at stop facing the obstruction: seen before means a loop
+        state = stop * 4 + direction
+        if seen[state] == generation:
+            counters.add("guard_runs", runs)
+            return True
+        seen[state] = generation
+        pos = stop
+        direction = (direction + 1) % 4
+
+
+def start_shard_worker(name, cells, cols, candidates):
+    """
+    Pool initializer: copy the jump tables and the patrol path out of the
+    shared memory block once per worker
+    """
+    from multiprocessing import shared_memory
+    block = shared_memory.SharedMemory(name=name)
+    table = block.buf.cast('i')
+    _shard["jumps"] = [table[d * cells:(d + 1) * cells].tolist() for d in range(4)]
+    _shard["path"] = table[4 * cells:4 * cells + 3 * candidates].tolist()
+    table.release()
+    block.close()
+    _shard["cols"] = cols
+    _shard["seen"] = [0] * (cells * 4)
+    _shard["generation"] = 0
+
+
+def check_shard(bounds):
+    """
+    Loop check of the candidates start to end of the patrol path, in a worker.
+    Returns the loop cells found and the work counters of the shard.
+    """
+    start, end = bounds
+    counters.reset()
+    jumps, cols, seen, path = _shard["jumps"], _shard["cols"], _shard["seen"], _shard["path"]
+    # The worker's seen array outlives its tasks, so generations keep counting
+    generation = _shard["generation"]
+    loop_cells = []
+    for i in range(3 * start, 3 * end, 3):
+        generation += 1
+        if simulate_with_obstruction(jumps, cols, path[i + 1], path[i + 2], path[i],
+                                     seen, generation):
+            loop_cells.append(path[i])
+    _shard["generation"] = generation
+    counters.add("simulations", end - start)
+    return loop_cells, counters.totals()
+
+
+def sharded_loop_cells(jumps, cols, path, workers):
+    """
+    Cells of the patrol path where an obstruction makes the guard loop,
+    checked on a process pool. The jump tables and the path are written once
+    to a shared memory block the workers copy when they start, so each task
+    only carries its range of candidates. Loop cells come back in path order.
+    """
+    from multiprocessing import Pool, shared_memory
+
+    cells = len(jumps[0])
+    table = array('i', chain(*jumps, chain.from_iterable(path)))
+    block = shared_memory.SharedMemory(create=True, size=len(table) * table.itemsize)
+    block.buf[:len(table) * table.itemsize] = table.tobytes()
+
+    size = -(-len(path) // (workers * SHARD_TASKS_PER_WORKER))
+    shards = [(start, min(start + size, len(path))) for start in range(0, len(path), size)]
+    loop_cells = []
+    try:
+        pool = Pool(workers, initializer=start_shard_worker,
+                    initargs=(block.name, cells, cols, len(path)))
+        try:
+            with progress.bar(total=len(path), desc="Checking positions",
+                              unit="candidates") as bar:
+                for (start, end), (shard_cells, counts) in zip(shards,
+                                                                pool.imap(check_shard, shards)):
+                    loop_cells.extend(shard_cells)
+                    for name, n in counts.items():
+                        counters.add(name, n)
+                    bar.update(end - start)
+        finally:
+            # Kills the workers rather than waiting for their shards, so a part
+            # stopped on its budget returns at once
+            pool.terminate()
+            pool.join()
+    finally:
+        # Only once no worker can still be attaching to it
+        block.close()
+        block.unlink()
+    return loop_cells
+
+
+def obstacle_positions(content, workers=None):
+    """
+    Find number of positions where placing an obstacle creates a patrol loop.
+
+    Only cells on the original patrol can change it, so those are the
+    candidates. Up to its first visit of a candidate the guard walks the
+    original patrol, so each simulation resumes from the state just before
+    that visit instead of from the start. Every simulation jumps between
+    obstructions through the jump tables, and all of them share one
+    generation-stamped visited array.
+
+    From SHARD_MIN_CANDIDATES candidates on (or whenever workers > 1 is
+    given) the candidates are sharded over a pool of workers, every CPU by
+    default.
+    """
+    grid, guard_pos, start_direction = parse_map(content)
+    rows = len(grid)
+    cols = len(grid[0])
+    jumps = build_jump_tables(grid)
+    path = patrol_path(grid, guard_pos, start_direction)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(path) >= SHARD_MIN_CANDIDATES else 1
+
+    log(f"Checking {len(path)} positions on the patrol path for possible loops. "
+        f"The size of the map is {rows}x{cols}.")
+    if workers > 1 and path:
+        log(f"Sharding the candidates over {workers} workers", level=DETAIL)
+        loop_cells = sharded_loop_cells(jumps, cols, path, workers)
+    else:
+        seen = [0] * (rows * cols * 4)
+        loop_cells = []
+        simulations = 0
+        for cell, previous, direction in progress.track(path, desc="Checking positions"):
+            simulations += 1
+            if simulate_with_obstruction(jumps, cols, previous, direction, cell, seen, simulations):
+                loop_cells.append(cell)
+        counters.add("simulations", simulations)
+
+    possible_positions = len(loop_cells)
+    loops_found = [divmod(cell, cols) for cell in loop_cells]
+    log(f"\nTotal loops found: {possible_positions}")
+    log("Loop positions:", ', '.join([f"({r}, {c})" for r, c in loops_found]), level=DETAIL)
+
+    return possible_positions
+
+
+def obstacle_positions_reference(content):
     """
     Find number of positions where placing an obstacle creates a patrol loop.
+    Walks a fresh copy of the grid cell by cell for every candidate; kept as
+    the oracle obstacle_positions is fuzzed against.
     """
     # Get initial map state
     grid, guard_pos, start_direction = parse_map(content)
@@ -336,11 +570,10 @@ def obstacle_positions(content):
     # Create progress bar for total positions to check
     total_positions = rows * cols
     
-    # Iterate through all positions with tqdm progress bar
-    print(f"Checking {total_positions} positions for possible loops. The size of the map is {rows}x{cols}.")
-    for r, c in tqdm([(r, c) for r in range(rows) for c in range(cols)], 
-                     desc="Checking positions", 
-                     total=total_positions):
+    # Iterate through all positions with a progress bar
+    log(f"Checking {total_positions} positions for possible loops. The size of the map is {rows}x{cols}.")
+    for r, c in progress.track(((r, c) for r in range(rows) for c in range(cols)),
+                               total=total_positions, desc="Checking positions"):
         
         # Skip if position:
         # - is guard's starting position
@@ -367,55 +600,46 @@ def obstacle_positions(content):
             possible_positions += 1
             loops_found.append((r, c))
     
-    print(f"\nTotal loops found: {possible_positions}")
-    print("Loop positions:", ', '.join([f"({r}, {c})" for r, c in loops_found]))
+    log(f"\nTotal loops found: {possible_positions}")
+    log("Loop positions:", ', '.join([f"({r}, {c})" for r, c in loops_found]), level=DETAIL)
     
     return possible_positions
 
 
-def process_file(filepath):
+def part1(content):
     """
-    Processes a single file and returns the results.
-    - Calculate the guard patrol movements
-    - Calculate the number of obstacle positions that create a loop in the patrol path
+    Solution for Part 1: Distinct positions visited by the guard
     """
-    with open(filepath, 'r') as file:
-        content = file.read()
-        part1_result = guard_movements(content)
-        part2_result = obstacle_positions(content)
-        return part1_result, part2_result
+    start_time = time.time()
+    return {
+        "value": guard_movements(content),
+        "execution_time": time.time() - start_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part2(content):
     """
-    Processes all files in the specified directory.
+    Solution for Part 2: Obstacle positions that create a loop in the patrol path
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    start_time = time.time()
+    return {
+        "value": obstacle_positions(content),
+        "execution_time": time.time() - start_time
+    }
+
+
+def part2_reference(content):
+    """
+    Cell by cell Part 2, the oracle part2 is fuzzed against
+    """
+    return obstacle_positions_reference(content)
+
+
+# Straightforward implementations the optimized parts are checked against (aoc.fuzz)
+REFERENCES = {
+    "part2": part2_reference,
+}
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-    
-    for file, result in results.items():
-        if result[0]:  # Successfully processed
-            part1, part2 = result[1], result[2]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Guard movements): {Fore.GREEN}{part1}")
-            print(f"  {Fore.YELLOW}Part 2 (Obstacle positions): {Fore.GREEN}{part2}")
-        else:  # Error during processing
-            print(f"{Fore.CYAN}{file}: {Fore.RED}Error - {result[1]}")
+    run_day(__file__)
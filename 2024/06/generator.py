@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2024/06: a size x size lab map with scattered
+obstructions and a guard whose patrol leaves the map.
+"""
+
+SIZES = (16, 32, 64, 128)
+FUZZ_SIZES = (4, 6, 8, 12)
+
+OBSTRUCTION_DENSITY = 0.06
+
+DIRECTIONS = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+
+def patrol_leaves(grid, row, col):
+    """
+    True if the guard starting at (row, col) facing up walks off the map
+    """
+    size = len(grid)
+    direction = 0
+    seen = set()
+    while (row, col, direction) not in seen:
+        seen.add((row, col, direction))
+        dr, dc = DIRECTIONS[direction]
+        next_row, next_col = row + dr, col + dc
+        if not (0 <= next_row < size and 0 <= next_col < size):
+            return True
+        if grid[next_row][next_col] == '#':
+            direction = (direction + 1) % 4
+        else:
+            row, col = next_row, next_col
+    return False
+
+
+def generate(size, rng):
+    """
+    Map of size x size cells; maps where the guard loops are redrawn
+    """
+    while True:
+        grid = [['#' if rng.random() < OBSTRUCTION_DENSITY else '.' for _ in range(size)]
+                for _ in range(size)]
+        row, col = rng.randrange(size), rng.randrange(size)
+        grid[row][col] = '^'
+        if patrol_leaves(grid, row, col):
+            return '\n'.join(''.join(line) for line in grid) + '\n'
@@ -48,12 +48,19 @@ Using your new knowledge of elephant hiding spots, determine which equations cou
 '''
 
 import os
-from colorama import init, Fore
+import sys
+import time
 
-init(autoreset=True)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import counters, progress
+from aoc.runner import run_day
 
 from itertools import product
-from tqdm import tqdm
+
+# Remaining part 2 equations from which they are checked on a process pool,
+# and equations handed to a worker at once, at most
+POOL_MIN_EQUATIONS = 5000
+MAX_CHUNK_EQUATIONS = 1024
 
 
 def evaluate_expression(numbers, operators):
@@ -75,11 +82,58 @@ def evaluate_expression(numbers, operators):
     return result
 
 
+def concat_power(n):
+    """
+    Smallest power of ten above n, so that a || n == a * concat_power(n) + n
+    """
+    power = 10
+    while power <= n:
+        power *= 10
+    return power
+
+
+def reachable(value, numbers, i, powers=None):
+    """
+    Checks if numbers[0..i], evaluated left to right, can produce value.
+    Works backwards from the last number: value is only reachable through
+    - `*` if it is divisible by numbers[i],
+    - `+` if subtracting numbers[i] does not go negative,
+    - `||` (when powers of concat_power are given) if it ends in the digits
+      of numbers[i],
+    each undone into the value the numbers before it have to produce.
+    """
+    n = numbers[i]
+    if i == 0:
+        return value == n
+
+    if n:
+        if value % n == 0 and reachable(value // n, numbers, i - 1, powers):
+            return True
+    elif value == 0:
+        # Anything times zero
+        return True
+    if powers is not None and value % powers[i] == n \
+            and reachable(value // powers[i], numbers, i - 1, powers):
+        return True
+    return value >= n and reachable(value - n, numbers, i - 1, powers)
+
+
 def is_valid_equation(target, numbers, include_concat=False):
     """
     Checks if any combination of operators between numbers evaluates to the target.
     By default, includes only addition (+) and multiplication (*).
     If include_concat is True, also includes concatenation (||).
+    Numbers are non-negative; operators are undone right to left from the
+    target, pruning every branch that cannot lead back to the first number.
+    """
+    powers = [concat_power(n) for n in numbers] if include_concat else None
+    return reachable(target, numbers, len(numbers) - 1, powers)
+
+
+def is_valid_equation_reference(target, numbers, include_concat=False):
+    """
+    Checks if any combination of operators between numbers evaluates to the target,
+    trying every combination. Kept as the oracle is_valid_equation is fuzzed against.
     """
     operators = ['+', '*']
     if include_concat:
@@ -95,15 +149,12 @@ def is_valid_equation(target, numbers, include_concat=False):
     return False
 
 
-def calibration(content):
+def parse_equations(content):
     """
-    Processes the input and calculates the total calibration result.
-    Includes only addition (+) and multiplication (*).
+    Parses the "target: numbers" lines into (target, numbers) pairs.
     """
-    total = 0
-    lines = content.split('\n')
-
-    for line in tqdm(lines, desc="Calibration", unit="line"):
+    equations = []
+    for line in content.split('\n'):
         if ':' in line:
             parts = line.split(':')
             target = int(parts[0].strip())
@@ -112,79 +163,135 @@ def calibration(content):
             for n in parts[1].strip().split():
                 numbers.append(int(n))
 
-            if is_valid_equation(target, numbers, include_concat=False):
-                total += target
+            equations.append((target, numbers))
+    return equations
+
+
+def parse(content):
+    """
+    Parse stage shared by both parts: the (target, numbers) equations
+    """
+    return parse_equations(content)
+
+
+def calibration(equations):
+    """
+    Calculates the total calibration result.
+    Includes only addition (+) and multiplication (*).
+    """
+    total = 0
+
+    for target, numbers in progress.track(equations, desc="Calibration", unit="line"):
+        if is_valid_equation(target, numbers, include_concat=False):
+            total += target
 
     return total
 
 
-def calibration_concat(content):
+def concat_total(equations):
     """
-    Processes the input and calculates the total calibration result,
+    Sum of the targets of the equations that hold with +, * and ||
+    """
+    total = 0
+    for target, numbers in equations:
+        if is_valid_equation(target, numbers, include_concat=True):
+            total += target
+    return total
+
+
+def calibration_concat(equations, workers=None):
+    """
+    Calculates the total calibration result,
     including addition (+), multiplication (*), and concatenation (||).
+
+    Equations that hold with + and * alone, the part 1 check with its
+    narrower and cheaper search, are counted as they are. Only the others go
+    through the concatenation solver: in chunks on a pool of workers, every
+    CPU by default, from POOL_MIN_EQUATIONS of them on.
     """
     total = 0
-    lines = content.split('\n')
+    remaining = []
+    for target, numbers in equations:
+        if is_valid_equation(target, numbers, include_concat=False):
+            total += target
+        else:
+            remaining.append((target, numbers))
+    counters.add("proven_without_concat", len(equations) - len(remaining))
+    counters.add("concat_checks", len(remaining))
+
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(remaining) >= POOL_MIN_EQUATIONS else 1
+    if workers == 1 or not remaining:
+        return total + concat_total(progress.track(remaining, desc="Calibration", unit="line"))
+
+    from multiprocessing import Pool
+    size = max(1, min(MAX_CHUNK_EQUATIONS, len(remaining) // (workers * 4)))
+    chunks = [remaining[start:start + size] for start in range(0, len(remaining), size)]
+    pool = Pool(workers)
+    try:
+        with progress.bar(total=len(remaining), desc="Calibration", unit="line") as bar:
+            for chunk, chunk_total in zip(chunks, pool.imap(concat_total, chunks)):
+                total += chunk_total
+                bar.update(len(chunk))
+    finally:
+        # Kills the workers rather than waiting for their chunks, so a part
+        # stopped on its budget returns at once
+        pool.terminate()
+        pool.join()
+    return total
 
-    for line in tqdm(lines, desc="Calibration", unit="line"):
-        if ':' in line:
-            parts = line.split(':')
-            target = int(parts[0].strip())
 
-            numbers = []
-            for n in parts[1].strip().split():
-                numbers.append(int(n))
+def calibration_reference(equations, include_concat):
+    """
+    Total calibration result trying every operator combination of every equation
+    """
+    return sum(target for target, numbers in equations
+               if is_valid_equation_reference(target, numbers, include_concat))
 
-            if is_valid_equation(target, numbers, include_concat=True):
-                total += target
 
-    return total
+def part1(equations):
+    """
+    Solution for Part 1: Total calibration result using add (+) and multiply (*) operators.
+    """
+    start_time = time.time()
+    return {
+        "value": calibration(equations),
+        "execution_time": time.time() - start_time
+    }
 
 
-def process_file(filepath):
+def part2(equations):
     """
-    Processes the specified file.
-    -
-    - Returns the total calibration result using add (+) and multiply (*) operators.
-    - Returns the total calibration result using add (+) and multiply (*) operators, as well as the concatenation operator (||).
+    Solution for Part 2: Total calibration result using add (+) and multiply (*)
+    operators, as well as the concatenation operator (||).
     """
-    with open(filepath, 'r') as file:
-        content = file.read()
-        part1_result = calibration(content)
-        part2_result = calibration_concat(content)
-        return part1_result, part2_result
+    start_time = time.time()
+    return {
+        "value": calibration_concat(equations),
+        "execution_time": time.time() - start_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part1_reference(equations):
     """
-    Processes all files in the specified directory.
+    Part 1 trying every operator combination, the oracle part1 is fuzzed against
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    return calibration_reference(equations, include_concat=False)
+
+
+def part2_reference(equations):
+    """
+    Part 2 trying every operator combination, the oracle part2 is fuzzed against
+    """
+    return calibration_reference(equations, include_concat=True)
+
+
+# Straightforward implementations the optimized parts are checked against (aoc.fuzz)
+REFERENCES = {
+    "part1": part1_reference,
+    "part2": part2_reference,
+}
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-    
-    for file, result in results.items():
-        if result[0]:  # Successfully processed
-            part1, part2 = result[1], result[2]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Calibration Result): {Fore.GREEN}{part1}")
-            print(f"  {Fore.YELLOW}Part 2 (Calibration Result with concat values): {Fore.GREEN}{part2}")
-        else:  # Error during processing
-            print(f"{Fore.CYAN}{file}: {Fore.RED}Error - {result[1]}")
+    run_day(__file__)
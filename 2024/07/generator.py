@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2024/07: size calibration equations.
+
+Most targets are the value of the numbers under random operators (+, *
+and ||), the rest are that value off by a little and usually unreachable.
+Fuzzing inputs use short equations, so trying every operator combination
+stays quick.
+"""
+
+SIZES = (100, 200, 400, 800)
+FUZZ_SIZES = (1, 2, 4, 8)
+
+MAX_NUMBERS = 12
+MAX_FUZZ_NUMBERS = 6
+
+OPERATORS = ('+', '*', '||')
+
+
+def generate_equation(rng, max_numbers, zeros=False):
+    """
+    One "target: numbers" line
+    """
+    count = rng.randint(2, max_numbers)
+    numbers = [rng.randint(0 if zeros else 1, 999 if rng.random() < 0.3 else 99)
+               for _ in range(count)]
+    target = numbers[0]
+    for n in numbers[1:]:
+        operator = rng.choice(OPERATORS)
+        if operator == '+':
+            target += n
+        elif operator == '*':
+            target *= n
+        else:
+            target = int(f"{target}{n}")
+    if rng.random() < 0.3:
+        target = max(0, target + rng.randint(-3, 3))
+    return f"{target}: {' '.join(map(str, numbers))}"
+
+
+def generate(size, rng):
+    """
+    size equations of 2 to MAX_NUMBERS numbers
+    """
+    return '\n'.join(generate_equation(rng, MAX_NUMBERS) for _ in range(size)) + '\n'
+
+
+def fuzz(size, rng):
+    """
+    size short equations, whose numbers can be zero
+    """
+    return '\n'.join(generate_equation(rng, MAX_FUZZ_NUMBERS, zeros=True)
+                     for _ in range(size)) + '\n'
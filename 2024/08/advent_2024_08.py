@@ -116,8 +116,14 @@ Calculate the impact of the signal using this updated model. How many unique loc
 '''
 
 import os
+import sys
+import time
 from colorama import init, Fore
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+from aoc.output import log, DETAIL, enabled
+
 init(autoreset=True)
 
 CURRENT_FILEPATH = ""
@@ -157,13 +163,13 @@ def parse_grid(content):
                 # Add the position to the list for this frequency
                 antennas[char].append((x, y))
     
-    print(f"{Fore.YELLOW}Parsed grid from input: {CURRENT_FILEPATH} ")
-    print(f"    Width map: {width}")
-    print(f"    Height map: {height}")
-    print(f"    Total number of antennas: {sum(len(v) for v in antennas.values())}")
-    print(f"    Antennas frequencies count: {len(antennas)}")
-    print(f"    Antennas frequencies: {list(antennas.keys())}")
-    print(f"    Antennas locations: {antennas}")
+    log(f"{Fore.YELLOW}Parsed grid from input: {CURRENT_FILEPATH} ")
+    log(f"    Width map: {width}")
+    log(f"    Height map: {height}")
+    log(f"    Total number of antennas: {sum(len(v) for v in antennas.values())}")
+    log(f"    Antennas frequencies count: {len(antennas)}")
+    log(f"    Antennas frequencies: {list(antennas.keys())}")
+    log(f"    Antennas locations: {antennas}", level=DETAIL)
 
     return width, height, antennas
 
@@ -219,7 +225,7 @@ def calculate_antinodes(width, height, antennas):
                 for antinode in pair_antinodes:
                     all_antinodes.add(antinode)
     
-    print(f"{Fore.GREEN}    Antinodes locations: {Fore.RESET}{all_antinodes}")
+    log(f"{Fore.GREEN}    Antinodes locations: {Fore.RESET}{all_antinodes}", level=DETAIL)
     
     return all_antinodes
 
@@ -287,7 +293,7 @@ def calculate_antinodes_resonant(width, height, antennas):
                 pair_antinodes = get_antinodes_resonant(p1, p2, width, height)
                 all_antinodes.update(pair_antinodes)
     
-    print(f"{Fore.GREEN}    Antinodes locations: {Fore.RESET}{all_antinodes}")
+    log(f"{Fore.GREEN}    Antinodes locations: {Fore.RESET}{all_antinodes}", level=DETAIL)
 
     return all_antinodes
 
@@ -299,6 +305,9 @@ def print_map(content, antinodes=None):
     - Antinodes in green (if provided)
     - Regular positions in white/default color
     """
+    if not enabled(DETAIL):
+        return
+
     # Get the map lines (only the ones with dots or alphanumeric characters)
     grid_lines = []
     for line in content.splitlines():
@@ -309,21 +318,21 @@ def print_map(content, antinodes=None):
     # Convert antinodes to set for faster lookup if provided
     antinode_positions = set() if antinodes is None else antinodes
     
-    print(f"{Fore.YELLOW}Map visualization:")
+    log(f"{Fore.YELLOW}Map visualization:")
     # Print each line of the map
     for y, line in enumerate(grid_lines):
         for x, char in enumerate(line):
             if char.isalnum():
                 # Antenna position - print in red
-                print(f"{Fore.RED}{char}{Fore.RESET}", end='')
+                log(f"{Fore.RED}{char}{Fore.RESET}", end='')
             elif (x, y) in antinode_positions:
                 # Antinode position - print # in green
-                print(f"{Fore.GREEN}#{Fore.RESET}", end='')
+                log(f"{Fore.GREEN}#{Fore.RESET}", end='')
             else:
                 # Regular position - print in default color
-                print(char, end='')
-        print()  # New line after each row
-    print()  # Extra line at the end
+                log(char, end='')
+        log()  # New line after each row
+    log()  # Extra line at the end
 
 
 def antinodes(content):
@@ -346,51 +355,27 @@ def antinodes_resonant(content):
     return len(antinodes_set)
 
 
-def process_file(filepath):
+def part1(content):
     """
-    Processes the file at the specified path using the functions:
-    - Counts unique antinode locations within the bounds of the map.
+    Solution for Part 1: Unique antinode locations within the bounds of the map.
     """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
+    start_time = time.time()
+    return {
+        "value": antinodes(content),
+        "execution_time": time.time() - start_time
+    }
 
-    with open(filepath, 'r') as file:
-        content = file.read()
-        part1_result = antinodes(content)
-        part2_result = antinodes_resonant(content)
-        return part1_result, part2_result
 
-
-def process_directory(input_dir="./input/"):
+def part2(content):
     """
-    Processes all files in the specified directory.
+    Solution for Part 2: Unique antinode locations taking resonant harmonics into account.
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    start_time = time.time()
+    return {
+        "value": antinodes_resonant(content),
+        "execution_time": time.time() - start_time
+    }
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-    
-    for file, result in results.items():
-        if result[0]:  # Successfully processed
-            part1, part2 = result[1], result[2]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Antinodes): {Fore.GREEN}{part1}")
-            print(f"  {Fore.YELLOW}Part 2 (Antinodes Resonant): {Fore.GREEN}{part2}")
-        else:  # Error during processing
-            print(f"{Fore.CYAN}{file}: {Fore.RED}Error - {result[1]}")
+    run_day(__file__)
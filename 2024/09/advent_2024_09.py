@@ -68,8 +68,14 @@ Start over, now compacting the amphipod's hard drive using this new method inste
 '''
 
 import os
+import sys
+import time
 from colorama import init, Fore, Style
-from tqdm import tqdm
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import progress
+from aoc.runner import run_day
+from aoc.output import log
 import inspect
 
 init(autoreset=True)
@@ -81,10 +87,10 @@ def show_header(filename, function_name):
     """
     Prints a formatted header showing current file and operation
     """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Function: {Fore.YELLOW}{function_name}")
-    print(f"{Fore.CYAN}{'='*80}\n")
+    log(f"\n{Fore.CYAN}{'='*80}")
+    log(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
+    log(f"{Fore.CYAN}Function: {Fore.YELLOW}{function_name}")
+    log(f"{Fore.CYAN}{'='*80}\n")
 
 
 def single_block_movement(content):
@@ -126,9 +132,8 @@ def single_block_movement(content):
     
     # Move blocks from end to start
     total_files = file_id
-    for current_file in tqdm(range(total_files - 1, -1, -1), 
-                           desc="Moving blocks", 
-                           bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'):
+    for current_file in progress.track(range(total_files - 1, -1, -1),
+                                       desc="Moving blocks", unit="files"):
         # Find all blocks of this file
         blocks_positions = []
         for position, block in enumerate(disk):
@@ -194,9 +199,8 @@ def whole_file_movement(content):
     
     # Move files from end to start
     total_files = file_id
-    for current_file in tqdm(range(total_files - 1, -1, -1), 
-                           desc="Moving files", 
-                           bar_format='{desc}: {percentage:3.0f}%|{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]'):
+    for current_file in progress.track(range(total_files - 1, -1, -1),
+                                       desc="Moving files", unit="files"):
         # Find the boundaries of current file
         blocks_positions = []
         for position, block in enumerate(disk):
@@ -244,54 +248,27 @@ def whole_file_movement(content):
     return final_score
 
 
-def process_file(filepath):
+def part1(content):
     """
-    Process a single input file through both parts of the puzzle
+    Solution for Part 1: Filesystem checksum after moving single blocks.
     """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    
-    with open(filepath, 'r') as file:
-        content = file.read()
-        part1_result = single_block_movement(content)
-        part2_result = whole_file_movement(content)
-        return part1_result, part2_result
+    start_time = time.time()
+    return {
+        "value": single_block_movement(content),
+        "execution_time": time.time() - start_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part2(content):
     """
-    Process all input files in the specified directory
+    Solution for Part 2: Filesystem checksum after moving whole files.
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    start_time = time.time()
+    return {
+        "value": whole_file_movement(content),
+        "execution_time": time.time() - start_time
+    }
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-    
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    for file, result in results.items():
-        if result[0]:
-            part1, part2 = result[1], result[2]
-            print(f"{Fore.BLUE}File: {file}")
-            print(f"  {Fore.YELLOW}Part 1 (Single Block): {Fore.GREEN}{part1}")
-            print(f"  {Fore.YELLOW}Part 2 (Whole File): {Fore.GREEN}{part2}\n")
-        else:
-            print(f"{Fore.RED}Error processing {file}: {result[1]}\n")
\ No newline at end of file
+    run_day(__file__)
@@ -0,0 +1,17 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2024/09: a disk map of size digits, alternating file
+lengths (1-9) and free space lengths (0-9).
+"""
+
+SIZES = (1000, 2000, 4000, 8000)
+
+
+def generate(size, rng):
+    """
+    Disk map of exactly size digits
+    """
+    digits = [str(rng.randint(1, 9)) if index % 2 == 0 else str(rng.randint(0, 9))
+              for index in range(size)]
+    return ''.join(digits) + '\n'
@@ -117,8 +117,13 @@ You're not sure how, but the reindeer seems to have crafted some tiny flags out
 '''
 
 import os
+import sys
+import time
 from colorama import init, Fore, Style
-from tqdm import tqdm
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+from aoc.output import log, DETAIL, enabled
 import inspect
 
 init(autoreset=True)
@@ -130,10 +135,10 @@ def print_processing_header(filename, function_name):
     """
     Prints a formatted header for the current processing operation
     """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Function: {Fore.YELLOW}{function_name}")
-    print(f"{Fore.CYAN}{'='*80}\n")
+    log(f"\n{Fore.CYAN}{'='*80}")
+    log(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
+    log(f"{Fore.CYAN}Function: {Fore.YELLOW}{function_name}")
+    log(f"{Fore.CYAN}{'='*80}\n")
 
 
 def create_grid(content):
@@ -147,6 +152,8 @@ def create_grid(content):
             for char in line.strip():
                 row.append(int(char))
             grid.append(row)
+            if not enabled(DETAIL):
+                continue
             # Print each row with specially colored numbers
             colored_row = []
             for num in row:
@@ -156,7 +163,7 @@ def create_grid(content):
                     colored_row.append(f"{Fore.YELLOW}{num}")
                 else:
                     colored_row.append(f"{Fore.WHITE}{num}")
-            print(' '.join(colored_row))
+            log(' '.join(colored_row), level=DETAIL)
 
     return grid
 
@@ -323,54 +330,27 @@ def trailheads_ratings(content):
     return total_rating
 
 
-def process_file(filepath):
+def part1(content):
     """
-    Process a single input file through both parts of the puzzle
+    Solution for Part 1: Sum of the scores of all trailheads.
     """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    
-    with open(filepath, 'r') as file:
-        content = file.read()
-        part1_result = trailheads_scores(content)
-        part2_result = trailheads_ratings(content)
-        return part1_result, part2_result
+    start_time = time.time()
+    return {
+        "value": trailheads_scores(content),
+        "execution_time": time.time() - start_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part2(content):
     """
-    Processes all files in the specified directory.
+    Solution for Part 2: Sum of the ratings of all trailheads.
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    start_time = time.time()
+    return {
+        "value": trailheads_ratings(content),
+        "execution_time": time.time() - start_time
+    }
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    for file, result in results.items():
-        if result[0]:  # Successfully processed
-            part1, part2 = result[1], result[2]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Trailheads Scores): {Fore.GREEN}{part1}")
-            print(f"  {Fore.YELLOW}Part 2 (Trailheads Ratings): {Fore.GREEN}{part2}")
-        else:  # Error during processing
-            print(f"{Fore.CYAN}{file}: {Fore.RED}Error - {result[1]}")
+    run_day(__file__)
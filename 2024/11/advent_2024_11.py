@@ -59,10 +59,16 @@ How many stones would you have after blinking a total of 75 times?
 '''
 
 from collections import Counter  # Used to efficiently count repeated numbers
-from typing import List, Tuple  # Used for type hints
+from typing import Dict, List  # Used for type hints
 import os  # Used for file operations
+import sys  # Used to locate the shared runner
+import time  # Used to time each part
 from colorama import init, Fore  # Used for colored terminal output
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+from aoc.output import log, DETAIL
+
 init(autoreset=True)
 
 
@@ -158,7 +164,7 @@ def simulate_blinks(initial_stones: List[int], num_blinks: int) -> int:
     zeros = pattern.zero_count
     non_zeros = total - zeros
     preview = pattern.preview()
-    print(f"{Fore.CYAN}Initial:  {Fore.GREEN}[{total:16d} stones] {Fore.YELLOW}[{zeros}/{non_zeros} z/nz] {Fore.WHITE}→ {preview}")
+    log(f"{Fore.CYAN}Initial:  {Fore.GREEN}[{total:16d} stones] {Fore.YELLOW}[{zeros}/{non_zeros} z/nz] {Fore.WHITE}→ {preview}")
     
     # Process each blink
     for i in range(num_blinks):
@@ -169,7 +175,7 @@ def simulate_blinks(initial_stones: List[int], num_blinks: int) -> int:
         non_zeros = total - zeros
         
         # Show what happened after this blink
-        print(f"{Fore.YELLOW}Blink {i+1:2d}: {Fore.GREEN}[{total:16d} stones] {Fore.YELLOW}[{zeros}/{non_zeros} z/nz] {Fore.WHITE}→ {pattern.preview()}")
+        log(f"{Fore.YELLOW}Blink {i+1:2d}: {Fore.GREEN}[{total:16d} stones] {Fore.YELLOW}[{zeros}/{non_zeros} z/nz] {Fore.WHITE}→ {pattern.preview()}", level=DETAIL)
         
         # Optimization: If we only have zeros, we can predict the future!
         # Because zeros become ones, then get multiplied by 2024 and split,
@@ -177,7 +183,7 @@ def simulate_blinks(initial_stones: List[int], num_blinks: int) -> int:
         if non_zeros == 0 and i < num_blinks - 1:
             remaining_blinks = num_blinks - i - 1
             final_count = total * (2 ** remaining_blinks)
-            print(f"{Fore.GREEN}Fast-forward {remaining_blinks} blinks → Final count: {final_count} stones")
+            log(f"{Fore.GREEN}Fast-forward {remaining_blinks} blinks → Final count: {final_count} stones")
             return final_count
             
     return pattern.total_stones()
@@ -191,54 +197,27 @@ def process_input(content: str, blinks: int) -> int:
     return simulate_blinks(initial_stones, blinks)
 
 
-def process_file(filepath: str) -> Tuple[int, int]:
+def part1(content: str) -> Dict:
     """
-    Process one input file:
-    - Part 1: Simulate 25 blinks
-    - Part 2: Simulate 75 blinks
+    Solution for Part 1: Simulate 25 blinks
     """
-    print(f"\n{Fore.CYAN}{'═' * 60}")
-    print(f"{Fore.CYAN}Processing: {os.path.basename(filepath)}")
-    print(f"{Fore.CYAN}{'═' * 60}")
-    
-    with open(filepath, 'r') as file:
-        content = file.read()
-        
-        print(f"\n{Fore.CYAN}Part 1 (25 blinks):")
-        part1_result = process_input(content, 25)
-        
-        print(f"\n{Fore.CYAN}Part 2 (75 blinks):")
-        part2_result = process_input(content, 75)
-        
-        return part1_result, part2_result
+    start_time = time.time()
+    return {
+        "value": process_input(content, 25),
+        "execution_time": time.time() - start_time
+    }
+
+
+def part2(content: str) -> Dict:
+    """
+    Solution for Part 2: Simulate 75 blinks
+    """
+    start_time = time.time()
+    return {
+        "value": process_input(content, 75),
+        "execution_time": time.time() - start_time
+    }
+
 
 if __name__ == "__main__":
-    # Directory where input files are stored
-    input_dir = "./input/"
-    results = {}
-    
-    # Process each file in the input directory
-    for filename in os.listdir(input_dir):
-        filepath = os.path.join(input_dir, filename)
-        if os.path.isfile(filepath):
-            try:
-                part1, part2 = process_file(filepath)
-                results[filename] = (True, part1, part2)
-            except Exception as e:
-                results[filename] = (False, str(e))
-    
-    # Show final results for all files
-    print(f"\n{Fore.CYAN}{'═' * 60}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'═' * 60}")
-    
-    for filename, result in results.items():
-        if result[0]:  # If processing was successful
-            part1, part2 = result[1], result[2]
-            print(f"\n{Fore.BLUE}File: {filename}")
-            print(f"{Fore.YELLOW}├─ Part 1 (25 blinks): {Fore.GREEN}{part1}")
-            print(f"{Fore.YELLOW}└─ Part 2 (75 blinks): {Fore.GREEN}{part2}")
-        else:  # If there was an error
-            print(f"\n{Fore.RED}Error in {filename}: {result[1]}")
-    
-    print(f"\n{Fore.CYAN}{'═' * 60}")
\ No newline at end of file
+    run_day(__file__)
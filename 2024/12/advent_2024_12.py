@@ -136,7 +136,13 @@ What is the new total price of fencing all regions on your map?
 #!/usr/bin/python3
 
 import os
+import sys
+import time
 from colorama import init, Fore
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+from aoc.output import log, DETAIL
 import inspect
 
 init(autoreset=True)
@@ -145,22 +151,22 @@ CURRENT_FILEPATH = ""
 
 
 def print_header(filename, part):
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing Part {part} - File: {filename}")
-    print(f"{Fore.YELLOW}{'Type':<5}{'Area':<6}{'Metric':<7}{'Price':<8} │ {'Details'}")
-    print(f"{Fore.CYAN}{'-'*35}│{'-'*14}")
+    log(f"\n{Fore.CYAN}{'='*80}")
+    log(f"{Fore.CYAN}Processing Part {part} - File: {filename}")
+    log(f"{Fore.YELLOW}{'Type':<5}{'Area':<6}{'Metric':<7}{'Price':<8} │ {'Details'}")
+    log(f"{Fore.CYAN}{'-'*35}│{'-'*14}")
 
 
 def print_region_info(plant_type, area, metric, price):
-    print(f"{Fore.GREEN}{plant_type:<5}{area:<6}{metric:<7}{price:<8} │ {area} × {metric} = {price}")
+    log(f"{Fore.GREEN}{plant_type:<5}{area:<6}{metric:<7}{price:<8} │ {area} × {metric} = {price}", level=DETAIL)
 
 
 def print_grid_info(grid, only_dimensions=False):
     if not only_dimensions:
-        print("\nGrid:")
+        log("\nGrid:", level=DETAIL)
         for row in grid:
-            print(''.join(row))
-    print(f"Size: {len(grid)}x{len(grid[0])}\n")
+            log(''.join(row), level=DETAIL)
+    log(f"Size: {len(grid)}x{len(grid[0])}\n")
     
 
 def get_neighbours(grid, row, col):
@@ -335,7 +341,7 @@ def price_by_perimeter(content):
             grid.append(list(line))
     
     if not grid:
-        print(f"{Fore.RED}Error: Empty grid")
+        log(f"{Fore.RED}Error: Empty grid")
         return 0
         
     print_grid_info(grid)
@@ -353,7 +359,7 @@ def price_by_perimeter(content):
                 total_price += price
                 print_region_info(grid[row][col], area, perimeter, price)
     
-    print(f"\n{Fore.GREEN}Total Price: {total_price}")
+    log(f"\n{Fore.GREEN}Total Price: {total_price}")
     return total_price
 
 
@@ -377,7 +383,7 @@ def price_by_sides(content):
             grid.append(list(line))
             
     if not grid:
-        print(f"{Fore.RED}Error: Empty grid")
+        log(f"{Fore.RED}Error: Empty grid")
         return 0
         
     print_grid_info(grid)
@@ -396,60 +402,31 @@ def price_by_sides(content):
                 total_price += price
                 print_region_info(grid[row][col], area, sides, price)
                 
-    print(f"\n{Fore.GREEN}Total Price: {total_price}")
+    log(f"\n{Fore.GREEN}Total Price: {total_price}")
     return total_price
 
 
-def process_file(filepath):
+def part1(content):
     """
-    Process a single input file through both parts of the puzzle
+    Solution for Part 1: Total fencing price using area * perimeter.
     """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    
-    with open(filepath, 'r') as file:
-        content = file.read()
-        part1_result = price_by_perimeter(content)
-        part2_result = price_by_sides(content)
-        return part1_result, part2_result
+    start_time = time.time()
+    return {
+        "value": price_by_perimeter(content),
+        "execution_time": time.time() - start_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part2(content):
     """
-    Processes all files in the specified directory.
+    Solution for Part 2: Total fencing price using area * number of sides.
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result = process_file(filepath)
-            results[file] = (True, part1_result, part2_result)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    start_time = time.time()
+    return {
+        "value": price_by_sides(content),
+        "execution_time": time.time() - start_time
+    }
 
 
 if __name__ == "__main__":
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Garden Groups Analysis Tool")
-    print(f"{Fore.CYAN}{'='*80}")
-    
-    results = process_directory("./input/")
-    
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}")
-    
-    for file, result in results.items():
-        if result[0]:
-            print(f"\n{Fore.BLUE}{file}:")
-            print(f"{Fore.YELLOW}Part 1 Price by PERIMETER: {Fore.GREEN}{result[1]}")
-            print(f"{Fore.YELLOW}Part 2 Price by SIDES:     {Fore.GREEN}{result[2]}")
-        else:
-            print(f"\n{Fore.RED}Error processing {file}: {result[1]}")
\ No newline at end of file
+    run_day(__file__)
@@ -74,8 +74,12 @@ Using the corrected prize coordinates, figure out how to win as many prizes as p
 #!/usr/bin/python3
 
 import os
+import sys
 from colorama import init, Fore
-from tqdm import tqdm
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+from aoc.output import log, DETAIL
 import inspect
 import time
 
@@ -83,15 +87,18 @@ init(autoreset=True)
 
 CURRENT_FILEPATH = ""
 
+MAX_PRESSES = 100  # Part 1 limit on the presses of each button
+OFFSET = 10000000000000  # 10^13, part 2 shift of every prize
+
 
 def print_processing_header(filename, function_name):
     """
     Prints a formatted header for the current processing operation
     """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Function: {Fore.YELLOW}{function_name}")
-    print(f"{Fore.CYAN}{'='*80}\n")
+    log(f"\n{Fore.CYAN}{'='*80}")
+    log(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
+    log(f"{Fore.CYAN}Function: {Fore.YELLOW}{function_name}")
+    log(f"{Fore.CYAN}{'='*80}\n")
 
 
 def tokens(file_content):
@@ -144,10 +151,10 @@ def tokens(file_content):
     total_tokens = 0
     max_attempts = 100  # Maximum number of times we can press each button
 
-    print("\nResults:")
-    print("-" * 80)
-    print(f"{'Machine':<10} {'Button A':<12} {'Button B':<12} {'Tokens':<12} {'Target X':<12} {'Target Y':<12}")
-    print("-" * 80)
+    log("\nResults:", level=DETAIL)
+    log("-" * 80, level=DETAIL)
+    log(f"{'Machine':<10} {'Button A':<12} {'Button B':<12} {'Tokens':<12} {'Target X':<12} {'Target Y':<12}", level=DETAIL)
+    log("-" * 80, level=DETAIL)
 
     # For each machine in our list
     for number, machine in enumerate(machines, 1):
@@ -176,14 +183,41 @@ def tokens(file_content):
         if found_solution:
             total_tokens += min_tokens
             presses_a, presses_b = best_solution
-            print(f"{number:<10} {presses_a:<12} {presses_b:<12} {min_tokens:<12} {machine['target_x']:<12} {machine['target_y']:<12}")
+            log(f"{number:<10} {presses_a:<12} {presses_b:<12} {min_tokens:<12} {machine['target_x']:<12} {machine['target_y']:<12}", level=DETAIL)
         else:
-            print(f"{Fore.RED}{number:<10} {'-':<12} {'-':<12} {'-':<12} {machine['target_x']:<12} {machine['target_y']:<12}")
+            log(f"{Fore.RED}{number:<10} {'-':<12} {'-':<12} {'-':<12} {machine['target_x']:<12} {machine['target_y']:<12}", level=DETAIL)
 
     execution_time = time.time() - start_time
     return total_tokens, execution_time
 
 
+def parse_machines(content, offset=0):
+    """
+    Every machine as a dict of its button moves (Ax, Ay, Bx, By) and prize
+    position (target_x, target_y), the prize shifted by offset
+    """
+    machines = []
+    current_machine = {}
+    for line in content.strip().split('\n'):
+        if not line.strip():
+            continue
+        if line.startswith('Button A:'):
+            current_machine = {}
+            x, y = line.split(':')[1].strip().split(',')
+            current_machine['Ax'] = int(x.split('+')[1])
+            current_machine['Ay'] = int(y.split('+')[1])
+        elif line.startswith('Button B:'):
+            x, y = line.split(':')[1].strip().split(',')
+            current_machine['Bx'] = int(x.split('+')[1])
+            current_machine['By'] = int(y.split('+')[1])
+        elif line.startswith('Prize:'):
+            x, y = line.split(':')[1].strip().split(',')
+            current_machine['target_x'] = int(x.split('=')[1]) + offset
+            current_machine['target_y'] = int(y.split('=')[1]) + offset
+            machines.append(current_machine)
+    return machines
+
+
 def gcd(a, b):
     """
     Calculate Greatest Common Divisor
@@ -245,12 +279,72 @@ def solve_machine_large(ax, ay, bx, by, tx, ty):
             if (n * ax + m * bx == tx and 
                 n * ay + m * by == ty):
                 return (n, m)
-    except:
+    except ArithmeticError:
         return None
         
     return None
 
 
+def solve_machine(ax, ay, bx, by, tx, ty, max_presses):
+    """
+    Cheapest (A presses, B presses) with at most max_presses of each button,
+    or None. Cramer's rule gives the only solution when the buttons move in
+    different directions; parallel buttons can have many, so every count of
+    A presses is tried and B solved from it.
+    """
+    if determinant(ax, ay, bx, by) != 0:
+        solution = solve_machine_large(ax, ay, bx, by, tx, ty)
+        if solution and max(solution) <= max_presses:
+            return solution
+        return None
+
+    best = None
+    for n in range(max_presses + 1):
+        rest_x, rest_y = tx - n * ax, ty - n * ay
+        if rest_x < 0 or rest_y < 0:
+            break
+        # B presses from whichever axis button B moves along
+        if bx:
+            m = rest_x // bx
+        elif by:
+            m = rest_y // by
+        else:
+            # B does not move the claw, so it is never worth pressing
+            m = 0
+        if m <= max_presses and m * bx == rest_x and m * by == rest_y:
+            if best is None or 3 * n + m < 3 * best[0] + best[1]:
+                best = (n, m)
+    return best
+
+
+def tokens_limited(content):
+    """
+    Calculates the minimum total tokens needed to win all possible prizes from the claw machines.
+    Solves each machine directly instead of trying every combination of presses (see tokens).
+    """
+    start_time = time.time()
+
+    filename = os.path.basename(CURRENT_FILEPATH)
+    current_func = inspect.currentframe().f_code.co_name.replace('_', ' ').title()
+    print_processing_header(filename, f"Part 1 - {current_func}")
+
+    total_tokens = 0
+    for i, machine in enumerate(parse_machines(content), 1):
+        solution = solve_machine(
+            machine['Ax'], machine['Ay'],
+            machine['Bx'], machine['By'],
+            machine['target_x'], machine['target_y'],
+            MAX_PRESSES
+        )
+        if solution:
+            a_presses, b_presses = solution
+            total_tokens += a_presses * 3 + b_presses
+            log(f"{i:<10} {a_presses:<12} {b_presses:<12} {a_presses * 3 + b_presses:<12}", level=DETAIL)
+
+    execution_time = time.time() - start_time
+    return total_tokens, execution_time
+
+
 def tokens_offset(content):
     """
     Calculates the minimum total tokens needed to win all possible prizes from the claw machines with a large offset.
@@ -262,36 +356,14 @@ def tokens_offset(content):
     current_func = inspect.currentframe().f_code.co_name.replace('_', ' ').title()
     print_processing_header(filename, f"Part 2 - {current_func}")
 
-    machines = []
-    current_machine = {}
-    OFFSET = 10000000000000  # 10^13
-    # OFFSET = 0  # For testing   
-
-    # Parse input
-    for line in content.strip().split('\n'):
-        if not line.strip():
-            continue
-        if line.startswith('Button A:'):
-            current_machine = {}
-            x, y = line.split(':')[1].strip().split(',')
-            current_machine['Ax'] = int(x.split('+')[1])
-            current_machine['Ay'] = int(y.split('+')[1])
-        elif line.startswith('Button B:'):
-            x, y = line.split(':')[1].strip().split(',')
-            current_machine['Bx'] = int(x.split('+')[1])
-            current_machine['By'] = int(y.split('+')[1])
-        elif line.startswith('Prize:'):
-            x, y = line.split(':')[1].strip().split(',')
-            current_machine['target_x'] = int(x.split('=')[1]) + OFFSET
-            current_machine['target_y'] = int(y.split('=')[1]) + OFFSET
-            machines.append(current_machine)
+    machines = parse_machines(content, OFFSET)
 
     total_tokens = 0
 
-    print("\nResults:")
-    print("-" * 80)
-    print(f"{'Machine':<10} {'A Presses':<12} {'B Presses':<12} {'Tokens':<12} {'Target X':<12} {'Target Y':<12}")
-    print("-" * 80)
+    log("\nResults:", level=DETAIL)
+    log("-" * 80, level=DETAIL)
+    log(f"{'Machine':<10} {'A Presses':<12} {'B Presses':<12} {'Tokens':<12} {'Target X':<12} {'Target Y':<12}", level=DETAIL)
+    log("-" * 80, level=DETAIL)
 
     for i, machine in enumerate(machines, 1):
         solution = solve_machine_large(
@@ -304,62 +376,52 @@ def tokens_offset(content):
             a_presses, b_presses = solution
             tokens = a_presses * 3 + b_presses * 1
             total_tokens += tokens
-            print(f"{i:<10} {a_presses:<12} {b_presses:<12} {tokens:<12} {machine['target_x']:<12} {machine['target_y']:<12}")
+            log(f"{i:<10} {a_presses:<12} {b_presses:<12} {tokens:<12} {machine['target_x']:<12} {machine['target_y']:<12}", level=DETAIL)
         else:
-            print(f"{Fore.RED}{i:<10} {'-':<12} {'-':<12} {'-':<12} {machine['target_x']:<12} {machine['target_y']:<12}")
+            log(f"{Fore.RED}{i:<10} {'-':<12} {'-':<12} {'-':<12} {machine['target_x']:<12} {machine['target_y']:<12}", level=DETAIL)
 
     execution_time = time.time() - start_time
     return total_tokens, execution_time
 
 
-def process_file(filepath):
+def part1(content):
     """
-    Process a single input file through both parts of the puzzle
+    Solution for Part 1: Fewest tokens to win all possible prizes.
     """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    
-    with open(filepath, 'r') as file:
-        content = file.read()
-        part1_result, time1 = tokens(content)
-        part2_result, time2 = tokens_offset(content)
-        return part1_result, part2_result, time1, time2
+    value, execution_time = tokens_limited(content)
+    return {
+        "value": value,
+        "execution_time": execution_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part1_reference(content):
     """
-    Processes all files in the specified directory.
+    Brute-force Part 1, the oracle part1 is fuzzed against
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result, time1, time2 = process_file(filepath)
-            results[file] = (True, part1_result, part2_result, time1, time2)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    value, execution_time = tokens(content)
+    return {
+        "value": value,
+        "execution_time": execution_time
+    }
 
 
-if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
+def part2(content):
+    """
+    Solution for Part 2: Fewest tokens with the prize positions offset.
+    """
+    value, execution_time = tokens_offset(content)
+    return {
+        "value": value,
+        "execution_time": execution_time
+    }
 
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    for file, result in results.items():
-        if result[0]:  # Successfully processed
-            part1, part2, time1, time2 = result[1], result[2], result[3], result[4]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Tokens):        {Fore.GREEN}{part1:<15}   {Fore.CYAN}Time: {time1:.3f}s")
-            print(f"  {Fore.YELLOW}Part 2 (Tokens Offset): {Fore.GREEN}{part2:<15}   {Fore.CYAN}Time: {time2:.3f}s")
-        else:  # Error during processing
-            print(f"{Fore.CYAN}{file}: {Fore.RED}Error - {result[1]}")
+
+# Straightforward implementations the optimized parts are checked against (aoc.fuzz)
+REFERENCES = {
+    "part1": part1_reference,
+}
+
+
+if __name__ == "__main__":
+    run_day(__file__)
@@ -0,0 +1,46 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2024/13: size claw machines.
+
+Most prizes are placed where some presses of both buttons land, the rest
+at random positions that may not be reachable. One machine in PARALLEL_EVERY
+has buttons moving in the same direction, which the real inputs avoid but
+part 1 still has to handle.
+"""
+
+SIZES = (100, 200, 400, 800)
+FUZZ_SIZES = (1, 2, 4, 8)
+
+PARALLEL_EVERY = 8
+
+
+def generate_machine(rng):
+    """
+    One machine: its two button lines and its prize line
+    """
+    ax, ay = rng.randint(1, 99), rng.randint(1, 99)
+    if rng.randrange(PARALLEL_EVERY) == 0:
+        scale = rng.randint(1, 4)
+        bx, by = ax * scale, ay * scale
+        if rng.random() < 0.5:
+            ax, ay, bx, by = bx, by, ax, ay
+    else:
+        bx, by = rng.randint(1, 99), rng.randint(1, 99)
+
+    if rng.random() < 0.75:
+        presses_a, presses_b = rng.randint(0, 100), rng.randint(0, 100)
+        tx, ty = presses_a * ax + presses_b * bx, presses_a * ay + presses_b * by
+    else:
+        tx, ty = rng.randint(0, 20000), rng.randint(0, 20000)
+
+    return (f"Button A: X+{ax}, Y+{ay}\n"
+            f"Button B: X+{bx}, Y+{by}\n"
+            f"Prize: X={tx}, Y={ty}\n")
+
+
+def generate(size, rng):
+    """
+    size machines separated by blank lines
+    """
+    return '\n'.join(generate_machine(rng) for _ in range(size))
@@ -123,8 +123,13 @@ What is the fewest number of seconds that must elapse for the robots to display
 #!/usr/bin/python3
 
 import os
+import sys
 from colorama import init, Fore
-from tqdm import tqdm
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import budget, progress
+from aoc.runner import run_day
+from aoc.output import log, DETAIL, enabled
 import inspect
 import time
 
@@ -137,10 +142,10 @@ def print_processing_header(filename, function_name):
     """
     Prints a formatted header for the current processing operation
     """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Function: {Fore.YELLOW}{function_name}")
-    print(f"{Fore.CYAN}{'='*80}\n")
+    log(f"\n{Fore.CYAN}{'='*80}")
+    log(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
+    log(f"{Fore.CYAN}Function: {Fore.YELLOW}{function_name}")
+    log(f"{Fore.CYAN}{'='*80}\n")
 
 
 def print_grid(robots, width, height, message="", hide_center=False):
@@ -148,9 +153,12 @@ def print_grid(robots, width, height, message="", hide_center=False):
     Visualize the current state of the robot grid for debugging purposes.
     Uses colors and coordinate frame for better visualization.
     """
-    print(f"\n{Fore.CYAN}=== Grid State {message} ===")
-    print(f"{Fore.CYAN}Grid size: {Fore.YELLOW}{width}x{height}")
-    print(f"{Fore.CYAN}Total robots: {Fore.YELLOW}{len(robots)}")
+    if not enabled(DETAIL):
+        return
+
+    log(f"\n{Fore.CYAN}=== Grid State {message} ===")
+    log(f"{Fore.CYAN}Grid size: {Fore.YELLOW}{width}x{height}")
+    log(f"{Fore.CYAN}Total robots: {Fore.YELLOW}{len(robots)}")
     
     # Create empty grid and count robots per position
     grid = [['.'] * width for _ in range(height)]
@@ -188,42 +196,42 @@ def print_grid(robots, width, height, message="", hide_center=False):
     margin_str = " " * margin
     
     # Print top border
-    print(f"{Fore.BLUE}{margin_str} ┌" + "─" * width + "┐")
+    log(f"{Fore.BLUE}{margin_str} ┌" + "─" * width + "┐")
     
     # Print column numbers (x coordinates)
-    print(f"{Fore.BLUE}{margin_str} │{Fore.YELLOW}", end="")
+    log(f"{Fore.BLUE}{margin_str} │{Fore.YELLOW}", end="")
     row1 = ""
     for x in range(width):
         tens = (x // 10) % 10
         row1 += str(tens)
-    print(row1 + f"{Fore.BLUE}│")
+    log(row1 + f"{Fore.BLUE}│")
     
     # Print ones digit of column numbers
-    print(f"{Fore.BLUE}{margin_str} │{Fore.YELLOW}", end="")
+    log(f"{Fore.BLUE}{margin_str} │{Fore.YELLOW}", end="")
     row2 = ""
     for x in range(width):
         ones = x % 10
         row2 += str(ones)
-    print(row2 + f"{Fore.BLUE}│")
+    log(row2 + f"{Fore.BLUE}│")
     
     # Print separator
-    print(f"{Fore.BLUE}{margin_str} ├" + "─" * width + "┤")
+    log(f"{Fore.BLUE}{margin_str} ├" + "─" * width + "┤")
     
     # Print grid with row numbers (y coordinates)
     for y in range(height):
-        print(f"{Fore.BLUE}{y:>{margin}} │", end="")
+        log(f"{Fore.BLUE}{y:>{margin}} │", end="")
         for x in range(width):
             cell = grid[y][x]
             if cell == ' ':  # Empty central lines
-                print(" ", end="")
+                log(" ", end="")
             elif cell == '.':
-                print(f"{cell}", end="")
+                log(f"{cell}", end="")
             else:
-                print(f"{Fore.RED}{cell}{Fore.BLUE}", end="")
-        print("│")
+                log(f"{Fore.RED}{cell}{Fore.BLUE}", end="")
+        log("│")
     
     # Print bottom border
-    print(f"{Fore.BLUE}{margin_str} └" + "─" * width + "┘")
+    log(f"{Fore.BLUE}{margin_str} └" + "─" * width + "┘")
     
     # If hiding center, print robot counts per quadrant
     if hide_center:
@@ -235,15 +243,15 @@ def print_grid(robots, width, height, message="", hide_center=False):
             quadrant_idx = (0 if x < mid_x else 1) + (0 if y < mid_y else 2)
             quadrants[quadrant_idx] += 1
             
-        print(f"\n{Fore.CYAN}Quadrant counts:")
+        log(f"\n{Fore.CYAN}Quadrant counts:")
         quadrant_names = ["Top-Left", "Top-Right", "Bottom-Left", "Bottom-Right"]
         for i, name in enumerate(quadrant_names):
-            print(f"{Fore.YELLOW}{name}: \t{Fore.RED}{quadrants[i]} robots")
+            log(f"{Fore.YELLOW}{name}: \t{Fore.RED}{quadrants[i]} robots")
         
         safety_factor = 1
         for count in quadrants:
             safety_factor *= count
-        print(f"\n{Fore.CYAN}Safety Factor: {Fore.YELLOW}{safety_factor}")
+        log(f"\n{Fore.CYAN}Safety Factor: {Fore.YELLOW}{safety_factor}")
     
 
 def safety_factor(content):
@@ -356,12 +364,12 @@ def find_easter_egg(grid, width, height):
         height = max_y - min_y + 1
         perimeter = 2 * (width + height)
         
-        print(f"\n\n{Fore.GREEN}Frame & Pattern Detection:")
-        print(f"  Frame: x({min_x},{max_x}) y({min_y},{max_y})")
-        print(f"    Width: {width}")
-        print(f"    Height: {height}")
-        print(f"    Perimeter: {perimeter}")
-        print(f"  Pattern Possitions: {len(positions)}")
+        log(f"\n\n{Fore.GREEN}Frame & Pattern Detection:")
+        log(f"  Frame: x({min_x},{max_x}) y({min_y},{max_y})")
+        log(f"    Width: {width}")
+        log(f"    Height: {height}")
+        log(f"    Perimeter: {perimeter}")
+        log(f"  Pattern Possitions: {len(positions)}")
         
         return perimeter > 100
         
@@ -477,7 +485,10 @@ def xmas_tree(content):
     # Simulate until we find a Christmas tree pattern or reach max steps
     max_steps = 10000  # I get this value from failed submited solution
     try:
-        for second in range(max_steps):
+        for second in progress.track(range(max_steps), desc="Searching for the tree",
+                                     unit="s", level=DETAIL):
+            budget.checkpoint(seconds_simulated=second)
+            
             # Create grid of current positions
             grid = [['.'] * width for _ in range(height)]
             for pos, _ in robots:
@@ -487,7 +498,7 @@ def xmas_tree(content):
             # Check for Christmas tree pattern
             pattern_found, pattern_robots = find_easter_egg(grid, width, height)
             if pattern_found:
-                print(f"\n{Fore.GREEN}Perfect Christmas tree pattern found after {second} seconds!")
+                log(f"\n{Fore.GREEN}Perfect Christmas tree pattern found after {second} seconds!")
                                 
                 print_grid(robots, width, height, f"Christmas Tree Pattern at {second} seconds")
                 execution_time = time.time() - start_time
@@ -499,70 +510,39 @@ def xmas_tree(content):
                 new_x = (pos[0] + vel[0]) % width
                 new_y = (pos[1] + vel[1]) % height
                 robots[i] = [(new_x, new_y), vel]
-            
-            # Periodic status update
-            if second % 100 == 0:
-                print(f"\r{Fore.RED}No pattern found after {second} seconds{' ' * 20}", end='', flush=True)
         
         # If we exit the loop without finding a pattern
-        print(f"\n{Fore.RED}No Christmas tree pattern found within {max_steps} seconds.")
+        log(f"\n{Fore.RED}No Christmas tree pattern found within {max_steps} seconds.")
         execution_time = time.time() - start_time
         return -1, execution_time
     
     except KeyboardInterrupt:
-        print("\nSearch interrupted by user.")
+        log("\nSearch interrupted by user.")
         execution_time = time.time() - start_time
         return -1, execution_time
 
 
-def process_file(filepath):
+def part1(content):
     """
-    Process a single input file through both parts of the puzzle
+    Solution for Part 1: Safety factor after 100 seconds.
     """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    
-    with open(filepath, 'r') as file:
-        content = file.read()
-        part1_result, time1 = safety_factor(content)
-        part2_result, time2 = xmas_tree(content)
-        return part1_result, part2_result, time1, time2
+    value, execution_time = safety_factor(content)
+    return {
+        "value": value,
+        "execution_time": execution_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part2(content):
     """
-    Processes all files in the specified directory.
+    Solution for Part 2: Fewest seconds until the robots display the Easter egg.
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        try:
-            part1_result, part2_result, time1, time2 = process_file(filepath)
-            results[file] = (True, part1_result, part2_result, time1, time2)
-        except Exception as e:
-            results[file] = (False, str(e))
-    
-    return results
+    value, execution_time = xmas_tree(content)
+    return {
+        "value": value,
+        "execution_time": execution_time
+    }
 
 
 if __name__ == "__main__":
-    input_dir = "./input/"
-    results = process_directory(input_dir)
-
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    for file, result in results.items():
-        if result[0]:  # Successfully processed
-            part1, part2, time1, time2 = result[1], result[2], result[3], result[4]
-            print(f"{Fore.BLUE}{file}:")
-            print(f"  {Fore.YELLOW}Part 1 (Safety Factor):   {Fore.GREEN}{part1:<15} {Fore.CYAN}Time: {time1:.6f}s")
-            print(f"  {Fore.YELLOW}Part 2 (Christmas Tree):  {Fore.GREEN}{part2:<15} {Fore.CYAN}Time: {time2:.6f}s")
-        else:  # Error during processing
-            print(f"{Fore.CYAN}{file}: {Fore.RED}Error - {result[1]}")
\ No newline at end of file
+    run_day(__file__)
@@ -408,7 +408,10 @@ import sys
 import os
 from functools import wraps
 from colorama import init, Fore
-from tqdm import tqdm
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+from aoc.output import log, DETAIL, enabled
 import inspect
 import time
 
@@ -429,10 +432,10 @@ def print_processing_header(filename, function_name):
     """
     Prints a formatted header for the current processing operation
     """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Function: {Fore.YELLOW}{function_name}")
-    print(f"{Fore.CYAN}{'='*80}\n")
+    log(f"\n{Fore.CYAN}{'='*80}")
+    log(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
+    log(f"{Fore.CYAN}Function: {Fore.YELLOW}{function_name}")
+    log(f"{Fore.CYAN}{'='*80}\n")
 
 
 def print_grid(grid):
@@ -441,16 +444,19 @@ def print_grid(grid):
     - Obstacles (#) in red
     - Robot position (@) in green
     """
+    if not enabled(DETAIL):
+        return
+
     for row in grid:
         for char in row:
             if char == '#':
-                print(f"{Fore.RED}{char}", end='')
+                log(f"{Fore.RED}{char}", end='')
             elif char == '@':
-                print(f"{Fore.GREEN}{char}", end='')
+                log(f"{Fore.GREEN}{char}", end='')
             else:
-                print(f"{Fore.WHITE}{char}", end='')
-        print()  # New line after each row
-    print()  
+                log(f"{Fore.WHITE}{char}", end='')
+        log()  # New line after each row
+    log()  
 
 
 def grid_find(grid, target):
@@ -682,64 +688,27 @@ def box_coords_scaled(lines: list[str]) -> tuple[int, float]:
     return result, execution_time
 
 
-def process_file(filepath: str):
+def part1(content):
     """
-    Process a single input file through both parts of the puzzle
+    Solution for Part 1: Sum of the GPS coordinates of all boxes.
     """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = [line.strip() for line in file.readlines()]
-            part1_result, time1 = box_coords(content)
-            part2_result, time2 = box_coords_scaled(content)
-            return True, (part1_result, part2_result, time1, time2)
-    except Exception as e:
-        return False, str(e)
+    value, execution_time = box_coords([line.strip() for line in content.splitlines()])
+    return {
+        "value": value,
+        "execution_time": execution_time
+    }
 
 
-def process_directory(input_dir="./input/"):
+def part2(content):
     """
-    Processes all files in the specified directory.
+    Solution for Part 2: Sum of the GPS coordinates of all boxes in the scaled warehouse.
     """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        success, result = process_file(filepath)  
-        results[file] = (success, result)  
-    
-    return results
-
-
-def main():
-    try:
-        input_dir = "./input/"
-        results = process_directory(input_dir)
-        
-        print(f"\n{Fore.CYAN}{'='*80}")
-        print(f"{Fore.CYAN}Final Results")
-        print(f"{Fore.CYAN}{'='*80}\n")
-        
-        for file, (success, result) in results.items():
-            if success:
-                part1, part2, time1, time2 = result
-                print(f"{Fore.BLUE}{file}:")
-                print(f"  {Fore.YELLOW}Part 1 BOX COORDS:        {Fore.GREEN}{part1:<15} {Fore.CYAN}Time: {time1:.6f}s")
-                print(f"  {Fore.YELLOW}Part 2 BOX COORDS SCALED: {Fore.GREEN}{part2:<15} {Fore.CYAN}Time: {time2:.6f}s")
-            else:
-                print(f"{Fore.BLUE}{file}: {Fore.RED}Error - {result}")
-                
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        sys.exit(1)
+    value, execution_time = box_coords_scaled([line.strip() for line in content.splitlines()])
+    return {
+        "value": value,
+        "execution_time": execution_time
+    }
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
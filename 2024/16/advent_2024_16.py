@@ -134,13 +134,12 @@ Analyze your map further. How many tiles are part of at least one of the best pa
 
 import sys
 import os
-from colorama import init, Fore
 import time
-from tqdm import tqdm
 
-init(autoreset=True)
-
-CURRENT_FILEPATH = ""
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import counters, progress
+from aoc.runner import run_day
+from aoc.output import log
 
 TEST_SOLUTIONS = {
     ".test_I.txt": {
@@ -158,16 +157,6 @@ TEST_SOLUTIONS = {
 }
 
 
-def print_header(filename, part):
-    """
-    Simple header printing function
-    """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """
     Parse the input content 
@@ -175,16 +164,10 @@ def parse_input(content):
     return [line.strip() for line in content.splitlines() if line.strip()]
 
 
-def part1(content):
+def find_start_end(grid):
     """
-    Find lowest possible score for reindeer to reach end
+    Positions (x, y) of the S and E tiles
     """
-    start_time = time.time()
-    
-    # Parse input
-    grid = parse_input(content)
-    
-    # Find start and end positions
     start_pos = None
     end_pos = None
     for y in range(len(grid)):
@@ -193,6 +176,25 @@ def part1(content):
                 start_pos = (x, y)
             elif grid[y][x] == 'E':
                 end_pos = (x, y)
+    return start_pos, end_pos
+
+
+def parse(content):
+    """
+    Parse stage shared by both parts: the grid with its start and end positions
+    """
+    grid = parse_input(content)
+    start_pos, end_pos = find_start_end(grid)
+    return grid, start_pos, end_pos
+
+
+def part1(maze):
+    """
+    Find lowest possible score for reindeer to reach end
+    """
+    start_time = time.time()
+    
+    grid, start_pos, end_pos = maze
     
     # Directions: 0=East, 1=South, 2=West, 3=North
     directions = [(1,0), (0,1), (-1,0), (0,-1)]
@@ -203,13 +205,19 @@ def part1(content):
     
     # Keep track of visited states and their costs
     visited = {}
+    popped = 0
     
     while queue:
         cost, (x, y, direction) = heappop(queue)
+        popped += 1
         
         # Check if we reached the end
         if (x, y) == end_pos:
-            return cost, time.time() - start_time
+            counters.add("states_popped", popped)
+            return {
+                "value": cost,
+                "execution_time": time.time() - start_time
+            }
         
         # Skip if we've seen this state with a better cost
         state = (x, y, direction)
@@ -238,29 +246,21 @@ def part1(content):
             if new_state not in visited or new_cost < visited[new_state]:
                 heappush(queue, (new_cost, new_state))
     
-    return -1, time.time() - start_time  # No path found
+    # No path found
+    counters.add("states_popped", popped)
+    return {
+        "value": -1,
+        "execution_time": time.time() - start_time
+    }
 
 
-def part2(content):
+def part2(maze):
     """
     Find number of tiles that are part of any optimal path
     """
-    from tqdm import tqdm
     start_time = time.time()
     
-    # Parse input
-    grid = parse_input(content)
-    total_cells = len(grid) * len(grid[0])  # Total number of cells for progress estimation
-    
-    # Find start and end positions
-    start_pos = None
-    end_pos = None
-    for y in range(len(grid)):
-        for x in range(len(grid[y])):
-            if grid[y][x] == 'S':
-                start_pos = (x, y)
-            elif grid[y][x] == 'E':
-                end_pos = (x, y)
+    grid, start_pos, end_pos = maze
     
     # Directions: 0=East, 1=South, 2=West, 3=North
     directions = [(1,0), (0,1), (-1,0), (0,-1)]
@@ -269,22 +269,19 @@ def part2(content):
     from heapq import heappush, heappop
     forward_costs = {}  # (x, y, dir) -> cost
     forward_queue = [(0, (start_pos[0], start_pos[1], 0))]  # Start facing East
+    popped = 0
     
-    print("Performing forward search...")
-    with tqdm(total=total_cells, desc="Forward search") as pbar:
-        visited_positions = set()
+    log("Performing forward search...")
+    with progress.bar(desc="Forward search", unit="states") as bar:
         while forward_queue:
             cost, (x, y, direction) = heappop(forward_queue)
+            popped += 1
             state = (x, y, direction)
-            pos = (x, y)
-            
-            if pos not in visited_positions:
-                visited_positions.add(pos)
-                pbar.update(1)
             
             if state in forward_costs and forward_costs[state] <= cost:
                 continue
             forward_costs[state] = cost
+            bar.update()
             
             # Try turning
             for turn in [-1, 1]:
@@ -312,21 +309,17 @@ def part2(content):
     for dir in range(4):
         heappush(backward_queue, (0, (end_pos[0], end_pos[1], dir)))
     
-    print("\nPerforming backward search...")
-    with tqdm(total=total_cells, desc="Backward search") as pbar:
-        visited_positions = set()
+    log("\nPerforming backward search...")
+    with progress.bar(desc="Backward search", unit="states") as bar:
         while backward_queue:
             cost, (x, y, direction) = heappop(backward_queue)
+            popped += 1
             state = (x, y, direction)
-            pos = (x, y)
-            
-            if pos not in visited_positions:
-                visited_positions.add(pos)
-                pbar.update(1)
             
             if state in backward_costs and backward_costs[state] <= cost:
                 continue
             backward_costs[state] = cost
+            bar.update()
             
             # Try turning
             for turn in [-1, 1]:
@@ -347,10 +340,11 @@ def part2(content):
                 if new_state not in backward_costs or new_cost < backward_costs[new_state]:
                     heappush(backward_queue, (new_cost, new_state))
     
-    print("\nFinding optimal paths...")
+    counters.add("states_popped", popped)
+    log("\nFinding optimal paths...")
     # Find minimum total cost
     min_total_cost = float('inf')
-    for state, forward_cost in tqdm(forward_costs.items(), desc="Finding min cost"):
+    for state, forward_cost in forward_costs.items():
         x, y, dir = state
         if (x, y) == end_pos:
             min_total_cost = min(min_total_cost, forward_cost)
@@ -358,7 +352,7 @@ def part2(content):
     # Find all tiles that are part of an optimal path
     optimal_tiles = set()
     total_combinations = len(forward_costs) * len(backward_costs)
-    with tqdm(total=total_combinations, desc="Finding optimal tiles") as pbar:
+    with progress.bar(total=total_combinations, desc="Finding optimal tiles", unit="pairs") as bar:
         for state, forward_cost in forward_costs.items():
             x, y, forward_dir = state
             for backward_state, backward_cost in backward_costs.items():
@@ -366,115 +360,14 @@ def part2(content):
                 if (x, y) == (bx, by):
                     if forward_cost + backward_cost == min_total_cost:
                         optimal_tiles.add((x, y))
-                pbar.update(1)
-    
-    print(f"\nFound {len(optimal_tiles)} optimal tiles")
-    return len(optimal_tiles), time.time() - start_time
-
-
-def process_file(filepath):
-    """Process a single file and validate results against test solutions"""
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result, time1 = part1(content)
-            
-            print_header(filename, 2)
-            part2_result, time2 = part2(content)
-            
-            # Validate against test solutions if available
-            test_results = {
-                "part1": {
-                    "result": part1_result,
-                    "time": time1,
-                    "passed": None
-                },
-                "part2": {
-                    "result": part2_result,
-                    "time": time2,
-                    "passed": None
-                }
-            }
-            
-            if filename in TEST_SOLUTIONS:
-                test_results["part1"]["passed"] = part1_result == TEST_SOLUTIONS[filename]["part1"]
-                test_results["part2"]["passed"] = part2_result == TEST_SOLUTIONS[filename]["part2"]
-            
-            return True, test_results
-            
-    except Exception as e:
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with test validation"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
+            bar.update(len(backward_costs))
     
-    for file, (success, result) in results.items():
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            # Part 1 results
-            part1_info = result["part1"]
-            status = ""
-            if part1_info["passed"] is not None:
-                status = (f"{Fore.GREEN}[PASSED]" if part1_info["passed"] 
-                         else f"{Fore.RED}[FAILED]")
-                if not part1_info["passed"]:
-                    status += f" (Expected: {TEST_SOLUTIONS[file]['part1']})"
-            
-            print(f"  {Fore.YELLOW}Part 1: {Fore.GREEN}{part1_info['result']:<15} {status}  "
-                  f"{Fore.CYAN}Time: {part1_info['time']:.6f}s")
-            
-            # Part 2 results
-            part2_info = result["part2"]
-            status = ""
-            if part2_info["passed"] is not None:
-                status = (f"{Fore.GREEN}[PASSED]" if part2_info["passed"] 
-                         else f"{Fore.RED}[FAILED]")
-                if not part2_info["passed"]:
-                    status += f" (Expected: {TEST_SOLUTIONS[file]['part2']})"
-            
-            print(f"  {Fore.YELLOW}Part 2: {Fore.GREEN}{part2_info['result']:<15} {status}  "
-                  f"{Fore.CYAN}Time: {part2_info['time']:.6f}s")
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-
-
-def main():
-    try:
-        input_dir = "./input/"
-        results = process_directory(input_dir)
-        print_results(results)
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        sys.exit(1)
+    log(f"\nFound {len(optimal_tiles)} optimal tiles")
+    return {
+        "value": len(optimal_tiles),
+        "execution_time": time.time() - start_time
+    }
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
@@ -76,27 +76,10 @@ What is the lowest positive initial value for register A that causes the program
 
 import sys
 import os
-from colorama import init, Fore
 import time
-from tqdm import tqdm
 
-init(autoreset=True)
-
-CURRENT_FILEPATH = ""
-
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
 
 TEST_SOLUTIONS = {
     ".test_I.txt": {
@@ -122,16 +105,6 @@ TEST_SOLUTIONS = {
 }
 
 
-def print_header(filename, part):
-    """
-    Simple header printing function
-    """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """Parse the input to get register values and program"""
     lines = [line.strip() for line in content.splitlines() if line.strip()]
@@ -161,11 +134,18 @@ def get_combo_value(operand, registers):
     return 0  # operand 7 is reserved
 
 
-def part1(content):
+def parse(content):
+    """Parse stage shared by both parts: initial registers and program"""
+    return parse_input(content)
+
+
+def part1(computer):
     """Simulate the 3-bit computer and return comma-separated output"""
     start_time = time.time()
     
-    registers, program = parse_input(content)
+    initial_registers, program = computer
+    # The parsed registers are shared with part 2, simulate on a copy
+    registers = dict(initial_registers)
     output = []
     ip = 0  # instruction pointer
     
@@ -212,7 +192,7 @@ def part1(content):
     }
 
 
-def part2(content):
+def part2(computer):
     """
     Find the lowest positive initial value for register A that causes the program 
     to output a copy of itself.
@@ -221,15 +201,14 @@ def part2(content):
     3 bits at a time, ensuring each step produces the desired program sequence.
 
     Args:
-        content (str): Input string containing register values and program
+        computer (tuple): Parsed (registers, program) from parse()
 
     Returns:
         dict: Dictionary containing the result value and execution time
     """
     start_time = time.time()
     
-    # Parse input to get registers and program
-    registers, program = parse_input(content)
+    registers, program = computer
     
     # Initialize variables for instruction pattern matching
     v1 = program[3]  # First XOR operand after initial sequence
@@ -296,120 +275,5 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected_solution):
-    """
-    Determine the test status based on the result and expected value
-    """
-    if not expected_solution["verified"]:
-        if expected_solution["value"] == 0:
-            return TEST_STATUS["IN_PROGRESS"]
-        return TEST_STATUS["UNKNOWN"]
-    
-    if result["value"] == expected_solution["value"]:
-        return TEST_STATUS["PASSED"]
-    return TEST_STATUS["FAILED"]
-
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            verified = test_solution.get("verified", False)
-            
-            # Add status to results
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", {"value": 0, "verified": False})
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", {"value": 0, "verified": False})
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    for file, (success, result) in results.items():
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                # Add expected value for FAILED status
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    status_text += f" (Expected: {TEST_SOLUTIONS[file][part_name]['value']})"
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{part_result['value']:<15} "
-                      f"{status_color}{status_text}  "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-
-
-def main():
-    try:
-        input_dir = "./input/"
-        results = process_directory(input_dir)
-        print_results(results)
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
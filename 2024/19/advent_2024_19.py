@@ -79,26 +79,10 @@ They'll let you into the onsen as soon as you have the list. What do you get if
 
 import sys
 import os
-from colorama import init, Fore
 import time
 
-init(autoreset=True)
-
-CURRENT_FILEPATH = ""
-
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
 
 TEST_SOLUTIONS = {
     ".test_I.txt": {
@@ -114,16 +98,6 @@ TEST_SOLUTIONS = {
 }
 
 
-def print_header(filename, part):
-    """
-    Simple header printing function
-    """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """
     Parse the input content into patterns and designs
@@ -167,14 +141,20 @@ def can_make_design(design, patterns, memo=None):
     return False
 
 
-def part1(content):
+def parse(content):
+    """
+    Parse stage shared by both parts: towel patterns and designs
+    """
+    return parse_input(content)
+
+
+def part1(towels):
     """
     Solution for Part 1 - count how many designs are possible
     """
     start_time = time.time()
     
-    # Parse input
-    patterns, designs = parse_input(content)
+    patterns, designs = towels
     
     # Count possible designs
     possible_count = sum(1 for design in designs if can_make_design(design, patterns))
@@ -216,14 +196,13 @@ def count_ways(design, patterns, memo=None):
     return total_ways
 
 
-def part2(content):
+def part2(towels):
     """
     Solution for Part 2 - sum up all different ways to make each possible design
     """
     start_time = time.time()
     
-    # Parse input
-    patterns, designs = parse_input(content)
+    patterns, designs = towels
     
     # For each design that's possible, count all different ways it can be made
     total_ways = 0
@@ -241,122 +220,5 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected, verified):
-    """
-    Determine the test status based on the result and expected value
-    """
-    if not verified:
-        if expected == 0:
-            return TEST_STATUS["IN_PROGRESS"]
-        return TEST_STATUS["UNKNOWN"]
-    
-    if result["value"] == expected:
-        return TEST_STATUS["PASSED"]
-    return TEST_STATUS["FAILED"]
-
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            verified = test_solution.get("verified", False)
-            
-            # Add status to results
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", 0),
-                verified
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", 0),
-                verified
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    for file, (success, result) in results.items():
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                # Add expected value for FAILED status
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    status_text += f" (Expected: {TEST_SOLUTIONS[file][part_name]})"
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{part_result['value']:<15} "
-                      f"{status_color}{status_text}  "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-
-
-def main():
-    try:
-        input_dir = "./input/"
-        results = process_directory(input_dir)
-        print_results(results)
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
@@ -179,26 +179,11 @@ Find the best cheats using the updated cheating rules. How many cheats would sav
 
 import sys
 import os
-from colorama import init, Fore
 import time
 
-init(autoreset=True)
-
-CURRENT_FILEPATH = ""
-
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+from aoc.output import log
 
 TEST_SOLUTIONS = {
     ".test_I.txt": {
@@ -211,16 +196,6 @@ TEST_SOLUTIONS = {
     }
 }
 
-def print_header(filename, part):
-    """
-    Simple header printing function
-    """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """
     Parse the input content 
@@ -342,8 +317,8 @@ def part1(content):
     # Count cheats that save >= 100 steps
     result = sum(count for saving, count in time_savings.items() if saving >= 100)
     
-    print(f"\nFound cheats with savings:", dict(time_savings))
-    print(f"Found {result} cheats that save at least 100 picoseconds")
+    log(f"\nFound cheats with savings:", dict(time_savings))
+    log(f"Found {result} cheats that save at least 100 picoseconds")
     
     return {
         "value": result,
@@ -407,8 +382,8 @@ def part2(content):
     # Count cheats that save >= 100 steps
     result = sum(count for saving, count in time_savings.items() if saving >= 100)
     
-    print(f"\nFound cheats with savings:", dict(time_savings))
-    print(f"Found {result} cheats that save at least 100 picoseconds")
+    log(f"\nFound cheats with savings:", dict(time_savings))
+    log(f"Found {result} cheats that save at least 100 picoseconds")
     
     return {
         "value": result,
@@ -416,137 +391,5 @@ def part2(content):
     }
 
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-def determine_test_status(result, expected):
-    """
-    Determine the test status based on the result and expected value.
-    IN_PROGRESS solo cuando es N/A.
-    Soporta comparaciones entre int, float y string.
-    """
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    # Convert both values to strings for comparison to handle mixed types
-    result_str = str(result["value"])
-    expected_str = str(expected)
-    
-    if result_str == expected_str:
-        return TEST_STATUS["PASSED"]
-    return TEST_STATUS["FAILED"]
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            # Add status to results
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", 0)
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", 0)
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        return False, str(e)
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    for file, (success, result) in results.items():
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                # Add expected value for FAILED status
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    status_text += f" (Expected: {TEST_SOLUTIONS[file][part_name]})"
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{part_result['value']:<15} "
-                      f"{status_color}{status_text}  "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-
-def main():
-    try:
-        input_dir = "./input/"
-        results = process_directory(input_dir)
-        print_results(results)
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        sys.exit(1)
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
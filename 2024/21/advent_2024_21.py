@@ -105,31 +105,15 @@ Find the fewest number of button presses you'll need to perform in order to caus
 '''
 
 
-
-
 #!/usr/bin/python3
 
 import sys
 import os
-from colorama import init, Fore
 import time
 import functools
 
-init(autoreset=True)
-
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
 
 TEST_SOLUTIONS = {
     ".test_I.txt": {
@@ -158,16 +142,6 @@ DIRECTIONAL_KEYPAD = {
 }
 
 
-def print_header(filename, part):
-    """
-    Simple header printing function
-    """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """
     Parse the input content 
@@ -292,6 +266,18 @@ def direction_command(code, n):
     return total_moves
 
 
+def warm():
+    """
+    Fill movement_cache for every move between two numeric keys with the
+    robot counts of both parts, so batches of codes only look costs up
+    """
+    keys = [key for key in NUMERIC_KEYPAD if key != "X"]
+    for n in (2, 25):
+        for first in keys:
+            for second in keys:
+                keyboard_command(first + second, n)
+
+
 def keyboard_command(code, n):
     """
     Calculate the number of button presses needed to type the numeric code with n robots
@@ -360,16 +346,20 @@ def calculate_complexity(code, num_robots):
     return complexity
 
 
-def part1(content):
+def parse(content):
+    """
+    Parse stage shared by both parts: the door codes
+    """
+    return parse_input(content)
+
+
+def part1(codes):
     """
     Solve part 1: Calculate sum of complexities with 2 robots
     """
     # Record start time
     start_time = time.time()
     
-    # Get list of codes from input
-    codes = parse_input(content)
-    
     # Calculate total complexity
     total = 0
     for code in codes:
@@ -385,16 +375,13 @@ def part1(content):
     }
 
 
-def part2(content):
+def part2(codes):
     """
     Solve part 2: Calculate sum of complexities with 25 robots
     """
     # Record start time
     start_time = time.time()
     
-    # Get list of codes from input
-    codes = parse_input(content)
-    
     # Calculate total complexity
     total = 0
     for code in codes:
@@ -410,125 +397,5 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected):
-    """
-    Determine the test status based on the result and expected value.
-    """
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    # Convert both values to strings for comparison to handle mixed types
-    result_str = str(result["value"])
-    expected_str = str(expected)
-    
-    if result_str == expected_str:
-        return TEST_STATUS["PASSED"]
-    return TEST_STATUS["FAILED"]
-
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            # Add status to results
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", 0)
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", 0)
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """
-    Process all files in the specified directory
-    """
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """
-    Print results with enhanced status display
-    """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    for file, (success, result) in results.items():
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                # Add expected value for FAILED status
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    status_text += f" (Expected: {TEST_SOLUTIONS[file][part_name]})"
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{part_result['value']:<15} "
-                      f"{status_color}{status_text}  "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-
-
-def main():
-    try:
-        input_dir = "./input/"
-        results = process_directory(input_dir)
-        print_results(results)
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
@@ -118,27 +118,14 @@ import sys
 import os
 from colorama import init, Fore
 import time
-from tqdm import tqdm
-from multiprocessing import Pool, cpu_count
 from itertools import product
 
-init(autoreset=True)
-
-CURRENT_FILEPATH = ""
-
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import progress
+from aoc.runner import run_day
+from aoc.output import log, DETAIL
 
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
+init(autoreset=True)
 
 TEST_SOLUTIONS = {
     ".test_I.txt": {
@@ -156,16 +143,6 @@ TEST_SOLUTIONS = {
 }
 
 
-def print_header(filename, part):
-    """
-    Simple header printing function
-    """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """
     Parse the input content removing empty lines and whitespace
@@ -181,8 +158,6 @@ def parse_input(content):
     return result
 
 
-
-
 def generate_next_secret(secret):
     """
     Generate the next secret number based on the rules:
@@ -251,8 +226,6 @@ def part1(content):
     return result
 
 
-
-
 def generate_price_sequence(initial, count):
     """Generate a sequence of prices (ones digits) from an initial secret"""
     prices = []
@@ -304,17 +277,18 @@ def part2(content):
     """
     Solution for Part 2 with optimization and progress bars
     """
+    from multiprocessing import Pool, cpu_count
     start_time = time.time()
-    print(f"{Fore.CYAN}Starting Part 2 solution...")
+    log(f"{Fore.CYAN}Starting Part 2 solution...")
     
     # Parse input
     data = parse_input(content)
     initial_numbers = [int(x) for x in data]
     
     # Generate price sequences for all buyers with progress bar
-    print(f"{Fore.YELLOW}Generating price sequences...")
+    log(f"{Fore.YELLOW}Generating price sequences...")
     sequences = []
-    for num in tqdm(initial_numbers, desc="Generating sequences"):
+    for num in progress.track(initial_numbers, desc="Generating sequences", unit="buyers"):
         sequences.append(generate_price_sequence(num, 2000))
     
     # Generate all possible change sequences
@@ -333,24 +307,25 @@ def part2(content):
     pool_args = [(batch, sequences) for batch in sequence_batches]
     
     # Process sequences in parallel with progress bar
-    print(f"{Fore.YELLOW}Evaluating sequences using {num_cores} cores...")
+    log(f"{Fore.YELLOW}Evaluating sequences using {num_cores} cores...")
     max_bananas = 0
     best_sequence = None
     
     with Pool(num_cores) as pool:
         results = []
-        with tqdm(total=len(sequence_batches), desc="Processing batches") as pbar:
+        with progress.bar(total=len(sequence_batches), desc="Processing batches",
+                          unit="batches") as bar:
             for batch_results in pool.imap_unordered(evaluate_sequence_batch, pool_args):
                 for sequence, bananas in batch_results:
                     if bananas > max_bananas:
                         max_bananas = bananas
                         best_sequence = sequence
-                        print(f"\n{Fore.GREEN}New best sequence found: {sequence} → {bananas} bananas")
-                pbar.update(1)
+                        log(f"\n{Fore.GREEN}New best sequence found: {sequence} → {bananas} bananas", level=DETAIL)
+                bar.update()
     
-    print(f"\n{Fore.GREEN}Best sequence found: {best_sequence}")
-    print(f"{Fore.GREEN}Maximum bananas: {max_bananas}")
-    print(f"{Fore.CYAN}Execution time: {time.time() - start_time:.2f} seconds")
+    log(f"\n{Fore.GREEN}Best sequence found: {best_sequence}")
+    log(f"{Fore.GREEN}Maximum bananas: {max_bananas}")
+    log(f"{Fore.CYAN}Execution time: {time.time() - start_time:.2f} seconds")
     
     return {
         "value": max_bananas,
@@ -358,126 +333,5 @@ def part2(content):
     }
 
 
-
-
-def determine_test_status(result, expected):
-    """
-    Determine the test status based on the result and expected value.
-    """
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    # Convert both values to strings for comparison to handle mixed types
-    result_str = str(result["value"])
-    expected_str = str(expected)
-    
-    if result_str == expected_str:
-        return TEST_STATUS["PASSED"]
-    return TEST_STATUS["FAILED"]
-
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            # Add status to results
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", 0)
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", 0)
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    files = []
-    for f in os.listdir(input_dir):
-        if os.path.isfile(os.path.join(input_dir, f)):
-            files.append(f)
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    for file, (success, result) in results.items():
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                # Add expected value for FAILED status
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    status_text += f" (Expected: {TEST_SOLUTIONS[file][part_name]})"
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{part_result['value']:<15} "
-                      f"{status_color}{status_text}  "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-
-
-def main():
-    try:
-        input_dir = "./input/"
-        results = process_directory(input_dir)
-        print_results(results)
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
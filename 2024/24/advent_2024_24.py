@@ -191,31 +191,11 @@ Your system of gates and wires has four pairs of gates which need their output w
 
 import sys
 import os
-from colorama import init, Fore
 import time
 
-import typer
-app = typer.Typer()
-
-from graphviz import Digraph
-
-init(autoreset=True)
-
-CURRENT_FILEPATH = ""
-
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+from aoc.output import DETAIL, enabled
 
 TEST_SOLUTIONS = {
     ".test_I.txt": {
@@ -237,16 +217,6 @@ TEST_SOLUTIONS = {
 }
 
 
-def print_header(filename, part):
-    """
-    Simple header printing function
-    """
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """
     Parse the input content removing empty lines and whitespace
@@ -262,7 +232,41 @@ def parse_input(content):
     return result
 
 
+def parse_circuit(lines):
+    """
+    Split the input lines into the initial wire values {wire: 0/1} and the
+    gates as (input1, operation, input2, output) tuples
+    """
+    wires = {}
+    gates = []
+    
+    for line in lines:
+        if ':' in line:  # Initial wire value
+            wire, value = line.split(':')
+            wires[wire.strip()] = int(value.strip())
+        elif '->' in line:  # Gate definition
+            parts = line.split()
+            op_index = -1
+            for i, part in enumerate(parts):
+                if part in ['AND', 'OR', 'XOR']:
+                    op_index = i
+                    break
+            if op_index == -1:
+                raise ValueError(f"Unknown gate type in: {line}")
+            gates.append((parts[op_index-1], parts[op_index], parts[op_index+1], parts[op_index+3]))
+    
+    return wires, gates
+
+
+def parse(content):
+    """
+    Parse stage shared by both parts: initial wire values and gates
+    """
+    return parse_circuit(parse_input(content))
+
+
 def create_circuit_graph(gates, filename="logic_circuit_part1", highlight_nodes=None):
+    from graphviz import Digraph
     graph = Digraph(format="png")
     graph.attr(rankdir="TB", bgcolor='lightgray')
     
@@ -317,45 +321,22 @@ def create_circuit_graph(gates, filename="logic_circuit_part1", highlight_nodes=
     graph.render(filename, cleanup=True)
 
 
-def part1(content):
+def part1(circuit):
     """
     Simulate the system of gates and wires to determine the decimal number output
     """
     start_time = time.time()
     
-    # Initialize variables
-    wires = {}  # Store wire values
-    gates = []  # Store gate operations
-    
-    # Parse input
-    data = parse_input(content)
+    initial_wires, circuit_gates = circuit
     
-    # Process each line
-    for line in data:
-        if ':' in line:  # Initial wire value
-            wire, value = line.split(':')
-            wires[wire.strip()] = bool(int(value.strip()))
-        else:  # Gate definition
-            inputs_str, output = line.split(' -> ')
-            inputs = inputs_str.split()
-            
-            # Determine gate type
-            if 'AND' in inputs:
-                gate_type = 'AND'
-                inputs.remove('AND')
-            elif 'OR' in inputs:
-                gate_type = 'OR'
-                inputs.remove('OR')
-            elif 'XOR' in inputs:
-                gate_type = 'XOR'
-                inputs.remove('XOR')
-            else:
-                raise ValueError(f"Unknown gate type in: {line}")
-                
-            gates.append((inputs, gate_type, output.strip()))
+    # Wire values as booleans, on a copy since the parsed model is shared
+    wires = {wire: bool(value) for wire, value in initial_wires.items()}
+    # Gate operations as ([input1, input2], gate_type, output)
+    gates = [([in1, in2], op, out) for in1, op, in2, out in circuit_gates]
     
     # Create visualization
-    create_circuit_graph(gates)
+    if enabled(DETAIL):
+        create_circuit_graph(gates)
 
     # Simulate gates until no more changes
     while True:
@@ -428,30 +409,13 @@ def part1(content):
     }
 
 
-def part2(content):
+def part2(circuit):
     """
     Simulate the system of gates and wires to determine the names of the wires that are erroneously set
     """
     start_time = time.time()
-    data = parse_input(content)
-    
-    # Parse initial wires and gates
-    wires = {}
-    gates = []
     
-    for line in data:
-        if ':' in line:
-            wire, value = line.split(':')
-            wires[wire.strip()] = int(value.strip())
-        elif '->' in line:
-            parts = line.split(' ')
-            op_index = -1
-            for i, part in enumerate(parts):
-                if part in ['AND', 'OR', 'XOR']:
-                    op_index = i
-                    break
-            if op_index != -1:
-                gates.append((parts[op_index-1], parts[op_index], parts[op_index+1], parts[op_index+3]))
+    wires, gates = circuit
 
     erroneous_gates = set()
     for in1, op, in2, out in gates:
@@ -475,7 +439,8 @@ def part2(content):
                     erroneous_gates.add(out)
 
     # Create visualization with highlighted erroneous gates
-    create_circuit_graph(gates, "logic_circuit_part2", erroneous_gates)
+    if enabled(DETAIL):
+        create_circuit_graph(gates, "logic_circuit_part2", erroneous_gates)
 
     result = ','.join(sorted(erroneous_gates))
     return {
@@ -484,125 +449,12 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected):
-    """
-    Determine the test status based on the result and expected value.
-    """
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    # Convert both values to strings for comparison to handle mixed types
-    result_str = str(result["value"])
-    expected_str = str(expected)
-    
-    if result_str == expected_str:
-        return TEST_STATUS["PASSED"]
-    return TEST_STATUS["FAILED"]
-
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    global CURRENT_FILEPATH
-    CURRENT_FILEPATH = filepath
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            # Add status to results
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", 0)
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", 0)
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    files = []
-    for f in os.listdir(input_dir):
-        if os.path.isfile(os.path.join(input_dir, f)):
-            files.append(f)
-        results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    for file, (success, result) in results.items():
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                # Add expected value for FAILED status
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    status_text += f" (Expected: {TEST_SOLUTIONS[file][part_name]})"
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{part_result['value']:<15} "
-                      f"{status_color}{status_text}  "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-
-@app.command()
-def main():
-    try:
-        input_dir = "./input/"
-        results = process_directory(input_dir)
-        print_results(results)
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        sys.exit(1)
+if __name__ == "__main__":
+    import typer
+    app = typer.Typer()
 
+    @app.command()
+    def main():
+        run_day(__file__)
 
-if __name__ == "__main__":
-    app()   
-    # main()
+    app()
@@ -0,0 +1,15 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2025/01: size dial rotations.
+"""
+
+SIZES = (1000, 10000, 100000)
+FUZZ_SIZES = (1, 2, 5, 10)
+
+
+def generate(size, rng):
+    """
+    size lines of L or R followed by a distance of 1-999
+    """
+    return ''.join(f"{rng.choice('LR')}{rng.randint(1, 999)}\n" for _ in range(size))
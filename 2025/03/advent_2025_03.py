@@ -59,8 +59,16 @@ import sys
 import time
 from colorama import init, Fore   
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import inputs
+from aoc.runner import run_day
+from aoc.output import log, DETAIL
+
 init(autoreset=True)
 
+# The input is streamed from disk instead of being read into one string
+STREAM_INPUT = True
+
 TEST_SOLUTIONS = {
     "test_I.txt": {
         "part1": "357",
@@ -72,36 +80,13 @@ TEST_SOLUTIONS = {
     }
 }
 
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
-
-
-def print_header(filename, part):
-    """Simple header printing function"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
-def parse_input(content):
+def parse_input(source):
     """
-    Parse the input content into battery banks.
+    Parse the input into battery banks.
     Each line represents a bank of batteries with digits as joltages.
+    Banks are streamed one at a time on every pass over the input.
     """
-    lines = content.strip().split('\n')
-    return [line.strip() for line in lines if line.strip()]
+    return inputs.Records(source)
 
 
 def find_max_joltage_part1(bank):
@@ -164,26 +149,35 @@ def find_max_joltage_part2(bank):
     return int(''.join(result))
 
 
-def part1(content):
+def parse(source):
+    """
+    Parse stage shared by both parts: the battery banks
+    """
+    return parse_input(source)
+
+
+def part1(banks):
     """
     Solution for Part 1: Find the sum of maximum joltages from each battery bank.
     Select exactly 2 digits from each bank.
     """
     start_time = time.time()
     
-    banks = parse_input(content)
     total_sum = 0
+    bank_count = 0
     
-    print(f"{Fore.YELLOW}Processing Part 1 with {len(banks)} battery banks...")
-    print(f"{Fore.YELLOW}Selecting exactly 2 digits from each bank")
+    log(f"{Fore.YELLOW}Processing Part 1...")
+    log(f"{Fore.YELLOW}Selecting exactly 2 digits from each bank")
     
     for idx, bank in enumerate(banks):
         max_joltage = find_max_joltage_part1(bank)
         total_sum += max_joltage
-        print(f"{Fore.CYAN}  Bank {idx + 1}: {bank}")
-        print(f"{Fore.GREEN}    Max joltage: {max_joltage}")
+        bank_count += 1
+        log(f"{Fore.CYAN}  Bank {idx + 1}: {bank}", level=DETAIL)
+        log(f"{Fore.GREEN}    Max joltage: {max_joltage}", level=DETAIL)
     
-    print(f"{Fore.YELLOW}Total output joltage: {total_sum}")
+    log(f"{Fore.YELLOW}Processed {bank_count} battery banks")
+    log(f"{Fore.YELLOW}Total output joltage: {total_sum}")
     
     return {
         "value": total_sum,
@@ -191,26 +185,28 @@ def part1(content):
     }
 
 
-def part2(content):
+def part2(banks):
     """
     Solution for Part 2: Find the sum of maximum joltages from each battery bank.
     Select exactly 12 digits from each bank.
     """
     start_time = time.time()
     
-    banks = parse_input(content)
     total_sum = 0
+    bank_count = 0
     
-    print(f"{Fore.YELLOW}Processing Part 2 with {len(banks)} battery banks...")
-    print(f"{Fore.YELLOW}Selecting exactly 12 digits from each bank")
+    log(f"{Fore.YELLOW}Processing Part 2...")
+    log(f"{Fore.YELLOW}Selecting exactly 12 digits from each bank")
     
     for idx, bank in enumerate(banks):
         max_joltage = find_max_joltage_part2(bank)
         total_sum += max_joltage
-        print(f"{Fore.CYAN}  Bank {idx + 1}: {bank}")
-        print(f"{Fore.GREEN}    Max joltage: {max_joltage}")
+        bank_count += 1
+        log(f"{Fore.CYAN}  Bank {idx + 1}: {bank}", level=DETAIL)
+        log(f"{Fore.GREEN}    Max joltage: {max_joltage}", level=DETAIL)
     
-    print(f"{Fore.YELLOW}Total output joltage: {total_sum}")
+    log(f"{Fore.YELLOW}Processed {bank_count} battery banks")
+    log(f"{Fore.YELLOW}Total output joltage: {total_sum}")
     
     return {
         "value": total_sum,
@@ -218,178 +214,5 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected, filename, part_name):
-    """
-    Determine the test status based on the result and expected value.
-    """
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    try:
-        result_value = result["value"]
-        expected_value = int(expected)
-        
-        if result_value == expected_value:
-            return TEST_STATUS["PASSED"]
-        else:
-            print(f"{Fore.RED}TEST FAILED for {filename} {part_name}")
-            print(f"{Fore.RED}  Expected: {expected_value}")
-            print(f"{Fore.RED}  Got: {result_value}")
-            return TEST_STATUS["FAILED"]
-    except ValueError:
-        return TEST_STATUS["UNKNOWN"]
-
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            # Add status to results with detailed checking
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", "N/A"),
-                filename,
-                "Part 1"
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", "N/A"),
-                filename, 
-                "Part 2"
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        print(f"{Fore.RED}Error processing {filename}: {str(e)}")
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory, tests first"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    
-    # Get all files and sort them to process test files first
-    files = []
-    for f in os.listdir(input_dir):
-        if os.path.isfile(os.path.join(input_dir, f)):
-            files.append(f)
-    
-    # Sort files: test files first, then input files
-    def sort_key(filename):
-        if filename.startswith('test'):
-            return (0, filename)
-        elif filename.startswith('input'):
-            return (1, filename)
-        else:
-            return (2, filename)
-    
-    files.sort(key=sort_key)
-    
-    print(f"{Fore.CYAN}Processing order: {', '.join(files)}")
-    
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    # Print test files first, then input files
-    sorted_files = sorted(results.keys(), key=lambda x: (0 if x.startswith('test') else 1, x))
-    
-    all_tests_passed = True
-    
-    for file in sorted_files:
-        success, result = results[file]
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                # Add expected value for FAILED status
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    expected_value = TEST_SOLUTIONS.get(file, {}).get(part_name, "N/A")
-                    status_text += f" (Expected: {expected_value})"
-                    all_tests_passed = False
-                elif part_result["status"] == TEST_STATUS["PASSED"]:
-                    # Only count test files for overall pass/fail
-                    if file.startswith('test'):
-                        print(f"{Fore.GREEN}✓ Test {part_name} passed!")
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{part_result['value']:<15} "
-                      f"{status_color}{status_text}  "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-            all_tests_passed = False
-    
-    # Print overall test summary
-    print(f"\n{Fore.CYAN}{'='*80}")
-    if all_tests_passed:
-        print(f"{Fore.GREEN}🎉 ALL TESTS PASSED! 🎉")
-    else:
-        print(f"{Fore.RED}❌ SOME TESTS FAILED")
-    print(f"{Fore.CYAN}{'='*80}")
-
-
-def main():
-    """
-    Main function with improved error handling and command line support
-    """
-    try:
-        # Allow specifying input directory via command line
-        input_dir = "./input/"
-        if len(sys.argv) > 1:
-            input_dir = sys.argv[1]
-        
-        results = process_directory(input_dir)
-        print_results(results)
-        
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
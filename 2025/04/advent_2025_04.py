@@ -179,6 +179,10 @@ import sys
 import time
 from colorama import init, Fore    # type: ignore
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+from aoc.output import log, DETAIL, enabled
+
 init(autoreset=True)
 
 TEST_SOLUTIONS = {
@@ -192,29 +196,6 @@ TEST_SOLUTIONS = {
     }
 }
 
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
-
-
-def print_header(filename, part):
-    """Simple header printing function"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """
     Parse the input content into a grid.
@@ -314,30 +295,38 @@ def create_visual_grid(grid, accessible_positions, removed_positions):
     return visual_str
 
 
-def part1(content):
+def parse(content):
+    """
+    Parse stage shared by both parts: the grid of paper rolls
+    """
+    return parse_input(content)
+
+
+def part1(grid):
     """
     Solution for Part 1: Count rolls of paper accessible by forklifts.
     A roll is accessible if it has fewer than 4 adjacent rolls (@) in the 8 positions around it.
     """
     start_time = time.time()
     
-    grid = parse_input(content)
     
-    print(f"{Fore.YELLOW}Part 1: Finding accessible rolls of paper...")
-    print(f"{Fore.YELLOW}A roll is accessible if it has fewer than 4 adjacent rolls (@)")
+    log(f"{Fore.YELLOW}Part 1: Finding accessible rolls of paper...")
+    log(f"{Fore.YELLOW}A roll is accessible if it has fewer than 4 adjacent rolls (@)")
     
     accessible = find_accessible_rolls(grid)
     accessible_count = len(accessible)
     
     # Create visualization
-    visual_grid = create_visual_grid(grid, accessible, set())
-    
-    print(f"\n{Fore.CYAN}Grid visualization (accessible rolls marked with 'x'):")
-    print(f"{Fore.CYAN}{'='*40}")
-    print(visual_grid)
-    print(f"{Fore.CYAN}{'='*40}")
+    visual_grid = None
+    if enabled(DETAIL):
+        visual_grid = create_visual_grid(grid, accessible, set())
+        
+        log(f"\n{Fore.CYAN}Grid visualization (accessible rolls marked with 'x'):", level=DETAIL)
+        log(f"{Fore.CYAN}{'='*40}", level=DETAIL)
+        log(visual_grid, level=DETAIL)
+        log(f"{Fore.CYAN}{'='*40}", level=DETAIL)
     
-    print(f"\n{Fore.GREEN}Total accessible rolls: {accessible_count}")
+    log(f"\n{Fore.GREEN}Total accessible rolls: {accessible_count}")
     
     return {
         "value": accessible_count,
@@ -363,14 +352,14 @@ def simulate_removal_process(grid):
     iterations = []
     iteration_number = 1
     
-    print(f"\n{Fore.YELLOW}Starting iterative removal process...")
+    log(f"\n{Fore.YELLOW}Starting iterative removal process...")
     
     while True:
         # Find accessible rolls in current grid
         accessible = find_accessible_rolls(current_grid)
         
         if not accessible:
-            print(f"{Fore.CYAN}No more accessible rolls. Process complete.")
+            log(f"{Fore.CYAN}No more accessible rolls. Process complete.")
             break
         
         # Remove accessible rolls
@@ -382,13 +371,15 @@ def simulate_removal_process(grid):
         total_removed += removed_this_iteration
         
         # Create visualization for this iteration
-        removed_set = set()
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] == '@' and current_grid[r][c] == '.':
-                    removed_set.add((r, c))
-        
-        visual = create_visual_grid(grid, accessible, removed_set)
+        visual = None
+        if enabled(DETAIL):
+            removed_set = set()
+            for r in range(rows):
+                for c in range(cols):
+                    if grid[r][c] == '@' and current_grid[r][c] == '.':
+                        removed_set.add((r, c))
+            
+            visual = create_visual_grid(grid, accessible, removed_set)
         
         iterations.append({
             "iteration": iteration_number,
@@ -397,15 +388,15 @@ def simulate_removal_process(grid):
             "visualization": visual
         })
         
-        print(f"{Fore.CYAN}Iteration {iteration_number}: Removed {removed_this_iteration} rolls "
-              f"(Total: {total_removed})")
+        log(f"{Fore.CYAN}Iteration {iteration_number}: Removed {removed_this_iteration} rolls "
+              f"(Total: {total_removed})", level=DETAIL)
         
         iteration_number += 1
     
     return total_removed, iterations
 
 
-def part2(content):
+def part2(grid):
     """
     Solution for Part 2: Simulate iterative removal process.
     Keep removing accessible rolls until no more can be removed.
@@ -413,32 +404,31 @@ def part2(content):
     """
     start_time = time.time()
     
-    grid = parse_input(content)
     
-    print(f"{Fore.YELLOW}Part 2: Simulating iterative removal process...")
-    print(f"{Fore.YELLOW}Each iteration: remove accessible rolls, then check again")
+    log(f"{Fore.YELLOW}Part 2: Simulating iterative removal process...")
+    log(f"{Fore.YELLOW}Each iteration: remove accessible rolls, then check again")
     
     total_removed, iterations = simulate_removal_process(grid)
     
     # Print summary of iterations
-    print(f"\n{Fore.CYAN}{'='*40}")
-    print(f"{Fore.CYAN}Iteration Summary:")
-    print(f"{Fore.CYAN}{'='*40}")
+    log(f"\n{Fore.CYAN}{'='*40}", level=DETAIL)
+    log(f"{Fore.CYAN}Iteration Summary:", level=DETAIL)
+    log(f"{Fore.CYAN}{'='*40}", level=DETAIL)
     
     for i, iteration in enumerate(iterations[:]): 
-        print(f"\n{Fore.YELLOW}Iteration {iteration['iteration']}:")
-        print(f"{Fore.GREEN}  Removed: {iteration['removed']}")
-        print(f"{Fore.GREEN}  Total so far: {iteration['total_removed']}")
+        log(f"\n{Fore.YELLOW}Iteration {iteration['iteration']}:", level=DETAIL)
+        log(f"{Fore.GREEN}  Removed: {iteration['removed']}", level=DETAIL)
+        log(f"{Fore.GREEN}  Total so far: {iteration['total_removed']}", level=DETAIL)
         if i < 2:  # Show visuals for first 2 iterations
-            print(f"{Fore.CYAN}  Visualization:")
-            print(iteration['visualization'])
+            log(f"{Fore.CYAN}  Visualization:", level=DETAIL)
+            log(iteration['visualization'], level=DETAIL)
     
-    if iterations:
+    if iterations and enabled(DETAIL):
         last_iteration = iterations[-1]
-        print(f"\n{Fore.CYAN}Final state:")
-        print(last_iteration['visualization'])
+        log(f"\n{Fore.CYAN}Final state:", level=DETAIL)
+        log(last_iteration['visualization'], level=DETAIL)
     
-    print(f"\n{Fore.GREEN}Total rolls removed: {total_removed}")
+    log(f"\n{Fore.GREEN}Total rolls removed: {total_removed}")
     
     return {
         "value": total_removed,
@@ -448,185 +438,5 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected, filename, part_name):
-    """
-    Determine the test status based on the result and expected value.
-    """
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    try:
-        result_value = result["value"]
-        if isinstance(result_value, str) and result_value == 'N/A':
-            return TEST_STATUS["IN_PROGRESS"]
-        
-        expected_value = int(expected)
-        
-        if result_value == expected_value:
-            return TEST_STATUS["PASSED"]
-        else:
-            print(f"{Fore.RED}TEST FAILED for {filename} {part_name}")
-            print(f"{Fore.RED}  Expected: {expected_value}")
-            print(f"{Fore.RED}  Got: {result_value}")
-            return TEST_STATUS["FAILED"]
-    except ValueError:
-        return TEST_STATUS["UNKNOWN"]
-
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            # Add status to results with detailed checking
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", "N/A"),
-                filename,
-                "Part 1"
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", "N/A"),
-                filename, 
-                "Part 2"
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        print(f"{Fore.RED}Error processing {filename}: {str(e)}")
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory, tests first"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    
-    # Get all files and sort them to process test files first
-    files = []
-    for f in os.listdir(input_dir):
-        if os.path.isfile(os.path.join(input_dir, f)):
-            files.append(f)
-    
-    # Sort files: test files first, then input files
-    def sort_key(filename):
-        if filename.startswith('test'):
-            return (0, filename)
-        elif filename.startswith('input'):
-            return (1, filename)
-        else:
-            return (2, filename)
-    
-    files.sort(key=sort_key)
-    
-    print(f"{Fore.CYAN}Processing order: {', '.join(files)}")
-    
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    # Print test files first, then input files
-    sorted_files = sorted(results.keys(), key=lambda x: (0 if x.startswith('test') else 1, x))
-    
-    all_tests_passed = True
-    
-    for file in sorted_files:
-        success, result = results[file]
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                # Add expected value for FAILED status
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    expected_value = TEST_SOLUTIONS.get(file, {}).get(part_name, "N/A")
-                    status_text += f" (Expected: {expected_value})"
-                    all_tests_passed = False
-                elif part_result["status"] == TEST_STATUS["PASSED"]:
-                    # Only count test files for overall pass/fail
-                    if file.startswith('test'):
-                        print(f"{Fore.GREEN}✓ Test {part_name} passed!")
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{part_result['value']:<15} "
-                      f"{status_color}{status_text}  "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-                
-                # Print additional info for part2
-                if part_name == "part2" and "iterations" in part_result:
-                    print(f"     {Fore.CYAN}Iterations: {part_result['iterations']}")
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-            all_tests_passed = False
-    
-    # Print overall test summary
-    print(f"\n{Fore.CYAN}{'='*80}")
-    if all_tests_passed:
-        print(f"{Fore.GREEN}🎉 ALL TESTS PASSED! 🎉")
-    else:
-        print(f"{Fore.RED}❌ SOME TESTS FAILED")
-    print(f"{Fore.CYAN}{'='*80}")
-
-
-def main():
-    """
-    Main function with improved error handling and command line support
-    """
-    try:
-        # Allow specifying input directory via command line
-        input_dir = "./input/"
-        if len(sys.argv) > 1:
-            input_dir = sys.argv[1]
-        
-        results = process_directory(input_dir)
-        print_results(results)
-        
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
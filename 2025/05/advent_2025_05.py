@@ -61,8 +61,16 @@ import sys
 import time
 from colorama import init, Fore    # type: ignore
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import inputs
+from aoc.runner import run_day
+from aoc.output import log, enabled, DETAIL
+
 init(autoreset=True)
 
+# The input is streamed from disk instead of being read into one string
+STREAM_INPUT = True
+
 TEST_SOLUTIONS = {
     "test_I.txt": {
         "part1": 3,
@@ -74,72 +82,48 @@ TEST_SOLUTIONS = {
     }
 }
 
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
+def parse_range(line):
+    """
+    Parse one fresh range "start-end" into a (start, end) tuple.
+    """
+    parts = line.split('-')
+    return int(parts[0].strip()), int(parts[1].strip())
 
 
-def print_header(filename, part):
-    """Simple header printing function"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
+def parse_ingredient_id(line):
+    """
+    Parse one available ingredient ID, or None if the line is not a number.
+    """
+    try:
+        return int(line)
+    except ValueError:
+        return None
 
 
-def parse_input(content, include_ids=True):
+def parse_input(source):
     """
-    Parse the input content into ranges and optionally ingredient IDs.
+    Parse the input into ranges and ingredient IDs.
     Format: ranges, blank line, then IDs.
+    The ranges are kept in a list. The IDs, which are most of the input, are
+    streamed from the line after the blank one on every pass over the input.
     """
-    # First, try to split by double newline
-    sections = content.strip().split('\n\n')
-    
-    if len(sections) >= 2:
-        # We have a clear separation with double newline
-        ranges_section = sections[0].strip()
-        ids_section = sections[1].strip() if include_ids and len(sections) > 1 else ""
-    
-    # Parse ranges
     ranges = []
-    for line in ranges_section.split('\n'):
+    header_lines = 0
+    
+    for line in inputs.lines(source):
+        header_lines += 1
         line = line.strip()
         if not line:
+            if ranges:
+                break  # End of the ranges section
             continue
         if '-' in line:
-            parts = line.split('-')
             try:
-                start = int(parts[0].strip())
-                end = int(parts[1].strip())
-                ranges.append((start, end))
+                ranges.append(parse_range(line))
             except ValueError:
                 continue
-        elif include_ids:
-            continue
     
-    # Parse ingredient IDs 
-    ingredient_ids = []
-    if include_ids and ids_section:
-        for line in ids_section.split('\n'):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                ingredient_ids.append(int(line))
-            except ValueError:
-                continue
-    
-    return ranges, ingredient_ids
+    return ranges, inputs.Records(source, parse_ingredient_id, skip=header_lines)
 
 
 def is_id_fresh(ingredient_id, ranges):
@@ -195,61 +179,73 @@ def count_fresh_ids_from_ranges(ranges):
     return total
 
 
-def part1(content):
+def parse(source):
+    """
+    Parse stage shared by both parts: the fresh ranges and the available IDs
+    """
+    return parse_input(source)
+
+
+def part1(inventory):
     """
     Solution for Part 1: Count how many available ingredient IDs are fresh.
     """
     start_time = time.time()
     
-    ranges, ingredient_ids = parse_input(content, include_ids=True)
+    ranges, ingredient_ids = inventory
     
-    print(f"{Fore.YELLOW}Part 1: Counting fresh ingredient IDs...")
-    print(f"{Fore.YELLOW}Number of ranges: {len(ranges)}")
-    print(f"{Fore.YELLOW}Number of ingredient IDs to check: {len(ingredient_ids)}")
+    log(f"{Fore.YELLOW}Part 1: Counting fresh ingredient IDs...")
+    log(f"{Fore.YELLOW}Number of ranges: {len(ranges)}")
     
-    # Count fresh IDs
+    # Count fresh IDs, the ID lists are only kept when they will be printed
+    ids_count = 0
     fresh_count = 0
+    keep_ids = enabled(DETAIL)
     fresh_ids = []
     spoiled_ids = []
     
     for ingredient_id in ingredient_ids:
+        ids_count += 1
         if is_id_fresh(ingredient_id, ranges):
             fresh_count += 1
-            fresh_ids.append(ingredient_id)
-        else:
+            if keep_ids:
+                fresh_ids.append(ingredient_id)
+        elif keep_ids:
             spoiled_ids.append(ingredient_id)
     
+    log(f"{Fore.YELLOW}Number of ingredient IDs checked: {ids_count}")
+    
     # Print detailed results
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Detailed Results:")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}", level=DETAIL)
+    log(f"{Fore.CYAN}Detailed Results:", level=DETAIL)
+    log(f"{Fore.CYAN}{'-'*60}", level=DETAIL)
     
     if fresh_ids:
-        print(f"{Fore.GREEN}✓ Fresh IDs ({len(fresh_ids)}):")
+        log(f"{Fore.GREEN}✓ Fresh IDs ({len(fresh_ids)}):", level=DETAIL)
         # Show in groups of 10 for readability
         for i in range(0, len(fresh_ids), 10):
-            print(f"  {', '.join(map(str, fresh_ids[i:i+10]))}")
+            log(f"  {', '.join(map(str, fresh_ids[i:i+10]))}", level=DETAIL)
     
     if spoiled_ids:
-        print(f"{Fore.RED}✗ Spoiled IDs ({len(spoiled_ids)}):")
+        log(f"{Fore.RED}✗ Spoiled IDs ({len(spoiled_ids)}):", level=DETAIL)
         for i in range(0, len(spoiled_ids), 10):
-            print(f"  {', '.join(map(str, spoiled_ids[i:i+10]))}")
+            log(f"  {', '.join(map(str, spoiled_ids[i:i+10]))}", level=DETAIL)
     
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Total fresh ingredients: {fresh_count}")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Total fresh ingredients: {fresh_count}")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": fresh_count,
         "execution_time": time.time() - start_time,
         "ranges_count": len(ranges),
-        "ids_count": len(ingredient_ids),
-        "fresh_ids_count": len(fresh_ids),
-        "spoiled_ids_count": len(spoiled_ids)
+        "ids_count": ids_count,
+        "fresh_ids_count": fresh_count,
+        "spoiled_ids_count": ids_count - fresh_count
     }
 
 
-def part2(content):
+def part2(inventory):
     """
     Solution for Part 2: Count all ingredient IDs considered fresh by the ranges.
     Ignores the available ingredient IDs list.
@@ -257,33 +253,33 @@ def part2(content):
     start_time = time.time()
     
     # For part 2, we only need the ranges
-    ranges, _ = parse_input(content, include_ids=False)
+    ranges, _ = inventory
     
-    print(f"{Fore.YELLOW}Part 2: Counting all fresh ingredient IDs from ranges...")
-    print(f"{Fore.YELLOW}Number of ranges: {len(ranges)}")
+    log(f"{Fore.YELLOW}Part 2: Counting all fresh ingredient IDs from ranges...")
+    log(f"{Fore.YELLOW}Number of ranges: {len(ranges)}")
     
     # Merge ranges for efficiency
     merged_ranges = merge_ranges(ranges)
     
-    print(f"{Fore.YELLOW}Number of merged ranges: {len(merged_ranges)}")
+    log(f"{Fore.YELLOW}Number of merged ranges: {len(merged_ranges)}")
     
     # Count all unique IDs in ranges
     total_fresh = count_fresh_ids_from_ranges(ranges)
     
     # Print detailed results
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Ranges Analysis:")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}", level=DETAIL)
+    log(f"{Fore.CYAN}Ranges Analysis:", level=DETAIL)
+    log(f"{Fore.CYAN}{'-'*60}", level=DETAIL)
     
     if merged_ranges:
-        print(f"{Fore.GREEN}Merged ranges ({len(merged_ranges)}):")
+        log(f"{Fore.GREEN}Merged ranges ({len(merged_ranges)}):", level=DETAIL)
         for i, (start, end) in enumerate(merged_ranges):
             range_size = end - start + 1
-            print(f"  {i+1:3d}. {start:,}-{end:,} ({range_size:,} IDs)")
+            log(f"  {i+1:3d}. {start:,}-{end:,} ({range_size:,} IDs)", level=DETAIL)
     
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Total fresh ingredient IDs from all ranges: {total_fresh:,}")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Total fresh ingredient IDs from all ranges: {total_fresh:,}")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": total_fresh,
@@ -293,191 +289,5 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected, filename, part_name):
-    """
-    Determine the test status based on the result and expected value.
-    """
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    try:
-        result_value = result["value"]
-        if isinstance(result_value, str) and result_value == 'N/A':
-            return TEST_STATUS["IN_PROGRESS"]
-        
-        expected_value = int(expected)
-        
-        if result_value == expected_value:
-            return TEST_STATUS["PASSED"]
-        else:
-            print(f"{Fore.RED}✗ TEST FAILED for {filename} {part_name}")
-            print(f"{Fore.RED}  Expected: {expected_value:,}")
-            print(f"{Fore.RED}  Got: {result_value:,}")
-            
-            # Show more details for failed tests
-            if "fresh_ids_count" in result:
-                print(f"{Fore.RED}  Fresh IDs count: {result['fresh_ids_count']}")
-                print(f"{Fore.RED}  Spoiled IDs count: {result['spoiled_ids_count']}")
-            
-            return TEST_STATUS["FAILED"]
-    except ValueError:
-        return TEST_STATUS["UNKNOWN"]
-
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            # Add status to results with detailed checking
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", "N/A"),
-                filename,
-                "Part 1"
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", "N/A"),
-                filename, 
-                "Part 2"
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        print(f"{Fore.RED}Error processing {filename}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory, tests first"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    
-    # Get all files and sort them to process test files first
-    files = []
-    for f in os.listdir(input_dir):
-        if os.path.isfile(os.path.join(input_dir, f)):
-            files.append(f)
-    
-    # Sort files: test files first, then input files
-    def sort_key(filename):
-        if filename.startswith('test'):
-            return (0, filename)
-        elif filename.startswith('input'):
-            return (1, filename)
-        else:
-            return (2, filename)
-    
-    files.sort(key=sort_key)
-    
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        print(f"\n{Fore.YELLOW}Processing: {file}")
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    # Print test files first, then input files
-    sorted_files = sorted(results.keys(), key=lambda x: (0 if x.startswith('test') else 1, x))
-    
-    all_tests_passed = True
-    
-    for file in sorted_files:
-        success, result = results[file]
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                # Mostrar números sin comas
-                value_str = str(part_result['value'])
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{value_str:<20} "
-                      f"{status_color}{status_text:<20} "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-                
-                # Solo mostrar información adicional si el test falló
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    expected_value = TEST_SOLUTIONS.get(file, {}).get(part_name, "N/A")
-                    expected_str = str(expected_value)
-                    print(f"       {Fore.RED}Expected: {expected_str}")
-                    all_tests_passed = False
-
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-            all_tests_passed = False
-    
-    # Print overall test summary
-    print(f"\n{Fore.CYAN}{'='*80}")
-    if all_tests_passed:
-        print(f"{Fore.GREEN}🎉 ALL TESTS PASSED! 🎉")
-    else:
-        print(f"{Fore.RED}❌ SOME TESTS FAILED")
-    print(f"{Fore.CYAN}{'='*80}")
-
-
-def main():
-    """
-    Main function with improved error handling and command line support
-    """
-    try:
-        # Allow specifying input directory via command line
-        input_dir = "./input/"
-        if len(sys.argv) > 1:
-            input_dir = sys.argv[1]
-        
-        results = process_directory(input_dir)
-        print_results(results)
-        
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
@@ -209,6 +209,10 @@ import sys
 import time
 from colorama import init, Fore    # type: ignore
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc.runner import run_day
+from aoc.output import log, DETAIL, enabled
+
 init(autoreset=True)
 
 TEST_SOLUTIONS = {
@@ -222,29 +226,6 @@ TEST_SOLUTIONS = {
     }
 }
 
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
-
-
-def print_header(filename, part):
-    """Simple header printing function"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """
     Parse the tachyon manifold diagram.
@@ -353,10 +334,11 @@ def count_timelines_part2(grid, start_pos, rows, cols):
     # Sum all timelines in the last row (where beams exit)
     total_timelines = sum(dp[rows - 1])
 
-    print(f"{Fore.YELLOW}DP Table of timelines (final):")
-    for r in range(rows):
-        row_str = ''.join(f"{dp[r][c]:5}" for c in range(cols))
-        print(f"{Fore.YELLOW}{row_str}")
+    if enabled(DETAIL):
+        log(f"{Fore.YELLOW}DP Table of timelines (final):", level=DETAIL)
+        for r in range(rows):
+            row_str = ''.join(f"{dp[r][c]:5}" for c in range(cols))
+            log(f"{Fore.YELLOW}{row_str}", level=DETAIL)
     
     return total_timelines
 
@@ -367,13 +349,13 @@ def part1(content):
     """
     start_time = time.time()
     
-    print(f"{Fore.YELLOW}Part 1: Simulating tachyon beam splitting...")
+    log(f"{Fore.YELLOW}Part 1: Simulating tachyon beam splitting...")
     
     # Parse the manifold diagram
     grid, start_pos, rows, cols = parse_input(content)
     
     if not start_pos:
-        print(f"{Fore.RED}No starting position 'S' found!")
+        log(f"{Fore.RED}No starting position 'S' found!")
         return {
             "value": 0,
             "execution_time": time.time() - start_time,
@@ -381,18 +363,18 @@ def part1(content):
             "results": []
         }
     
-    print(f"{Fore.YELLOW}Grid size: {rows} x {cols}")
-    print(f"{Fore.YELLOW}Start position: {start_pos}")
+    log(f"{Fore.YELLOW}Grid size: {rows} x {cols}")
+    log(f"{Fore.YELLOW}Start position: {start_pos}")
     
     # Simulate beam propagation
     total_splits = simulate_beam_part1(grid, start_pos, rows, cols)
     
     # Print summary
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Tachyon Beam Simulation Summary (Part 1):")
-    print(f"{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Total beam splits: {total_splits}")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}Tachyon Beam Simulation Summary (Part 1):")
+    log(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Total beam splits: {total_splits}")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": total_splits,
@@ -408,13 +390,13 @@ def part2(content):
     """
     start_time = time.time()
     
-    print(f"{Fore.YELLOW}Part 2: Counting quantum tachyon timelines...")
+    log(f"{Fore.YELLOW}Part 2: Counting quantum tachyon timelines...")
     
     # Parse the manifold diagram
     grid, start_pos, rows, cols = parse_input(content)
     
     if not start_pos:
-        print(f"{Fore.RED}No starting position 'S' found!")
+        log(f"{Fore.RED}No starting position 'S' found!")
         return {
             "value": 0,
             "execution_time": time.time() - start_time,
@@ -422,18 +404,18 @@ def part2(content):
             "results": []
         }
     
-    print(f"{Fore.YELLOW}Grid size: {rows} x {cols}")
-    print(f"{Fore.YELLOW}Start position: {start_pos}")
+    log(f"{Fore.YELLOW}Grid size: {rows} x {cols}")
+    log(f"{Fore.YELLOW}Start position: {start_pos}")
     
     # Count total timelines
     total_timelines = count_timelines_part2(grid, start_pos, rows, cols)
     
     # Print summary
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Quantum Tachyon Timeline Summary (Part 2):")
-    print(f"{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Total timelines: {total_timelines}")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}Quantum Tachyon Timeline Summary (Part 2):")
+    log(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Total timelines: {total_timelines}")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": total_timelines,
@@ -443,188 +425,5 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected, filename, part_name):
-    """
-    Determine the test status based on the result and expected value.
-    """
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    try:
-        result_value = result["value"]
-        if isinstance(result_value, str) and result_value == 'N/A':
-            return TEST_STATUS["IN_PROGRESS"]
-        
-        expected_value = int(expected)
-        
-        if result_value == expected_value:
-            return TEST_STATUS["PASSED"]
-        else:
-            print(f"{Fore.RED}✗ TEST FAILED for {filename} {part_name}")
-            print(f"{Fore.RED}  Expected: {expected_value}")
-            print(f"{Fore.RED}  Got: {result_value}")
-            
-            if "problems_count" in result:
-                print(f"{Fore.RED}  Problems count: {result['problems_count']}")
-            
-            return TEST_STATUS["FAILED"]
-    except ValueError:
-        return TEST_STATUS["UNKNOWN"]
-
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            # Add status to results with detailed checking
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", "N/A"),
-                filename,
-                "Part 1"
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", "N/A"),
-                filename, 
-                "Part 2"
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        print(f"{Fore.RED}Error processing {filename}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory, tests first"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    
-    # Get all files and sort them to process test files first
-    files = []
-    for f in os.listdir(input_dir):
-        if os.path.isfile(os.path.join(input_dir, f)):
-            files.append(f)
-    
-    # Sort files: test files first, then input files
-    def sort_key(filename):
-        if filename.startswith('test'):
-            return (0, filename)
-        elif filename.startswith('input'):
-            return (1, filename)
-        else:
-            return (2, filename)
-    
-    files.sort(key=sort_key)
-    
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        print(f"\n{Fore.YELLOW}Processing: {file}")
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    # Print test files first, then input files
-    sorted_files = sorted(results.keys(), key=lambda x: (0 if x.startswith('test') else 1, x))
-    
-    all_tests_passed = True
-    
-    for file in sorted_files:
-        success, result = results[file]
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                value = part_result['value']
-                value_str = str(value)
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{value_str:<20} "
-                      f"{status_color}{status_text:<20} "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-                
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    expected_value = TEST_SOLUTIONS.get(file, {}).get(part_name, "N/A")
-                    expected_str = str(expected_value)
-                    print(f"       {Fore.RED}Expected: {expected_str}")
-                    all_tests_passed = False
-
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-            all_tests_passed = False
-    
-    # Print overall test summary
-    print(f"\n{Fore.CYAN}{'='*80}")
-    if all_tests_passed:
-        print(f"{Fore.GREEN}🎉 ALL TESTS PASSED! 🎉")
-    else:
-        print(f"{Fore.RED}❌ SOME TESTS FAILED")
-    print(f"{Fore.CYAN}{'='*80}")
-
-
-def main():
-    """
-    Main function with improved error handling and command line support
-    """
-    try:
-        # Allow specifying input directory via command line
-        input_dir = "./input/"
-        if len(sys.argv) > 1:
-            input_dir = sys.argv[1]
-        
-        results = process_directory(input_dir)
-        print_results(results)
-        
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2025/08: size junction boxes at distinct random
+positions in a 100000-wide cube.
+"""
+
+SIZES = (250, 500, 1000, 2000)
+
+SPACE = 100000
+
+
+def generate(size, rng):
+    """
+    size lines of "x,y,z"
+    """
+    positions = []
+    seen = set()
+    while len(positions) < size:
+        position = (rng.randrange(SPACE), rng.randrange(SPACE), rng.randrange(SPACE))
+        if position not in seen:
+            seen.add(position)
+            positions.append(position)
+    return ''.join(f"{x},{y},{z}\n" for x, y, z in positions)
@@ -161,6 +161,11 @@ import sys
 import time
 from colorama import init, Fore    # type: ignore
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import budget, counters, progress
+from aoc.runner import run_day
+from aoc.output import log, DETAIL
+
 init(autoreset=True)
 
 TEST_SOLUTIONS = {
@@ -174,29 +179,6 @@ TEST_SOLUTIONS = {
     }
 }
 
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
-
-
-def print_header(filename, part):
-    """Simple header printing function"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """
     Parse red tile positions.
@@ -358,8 +340,8 @@ def solve_part2(positions):
     poly_bbox_area = (max_poly_x - min_poly_x + 1) * (max_poly_y - min_poly_y + 1)
     
     # Build list of all candidate rectangles with their areas
-    print(f"{Fore.CYAN}Building candidate rectangles...")
-    print(f"{Fore.CYAN}Polygon bounding box area: {poly_bbox_area}")
+    log(f"{Fore.CYAN}Building candidate rectangles...")
+    log(f"{Fore.CYAN}Polygon bounding box area: {poly_bbox_area}")
     rectangles = []
     skipped_too_large = 0
     
@@ -388,18 +370,17 @@ def solve_part2(positions):
             rectangles.append((area, min_x, max_x, min_y, max_y, i, j))
     
     if skipped_too_large > 0:
-        print(f"{Fore.CYAN}Skipped {skipped_too_large} rectangles larger than polygon bounding box")
+        log(f"{Fore.CYAN}Skipped {skipped_too_large} rectangles larger than polygon bounding box")
     
     # Sort by area descending - largest first
     rectangles.sort(reverse=True)
     total_rects = len(rectangles)
     
-    print(f"{Fore.CYAN}Total candidate rectangles: {total_rects}")
-    print(f"{Fore.CYAN}Checking rectangles (largest first)...")
+    log(f"{Fore.CYAN}Total candidate rectangles: {total_rects}")
+    log(f"{Fore.CYAN}Checking rectangles (largest first)...")
     
     max_area = 0
     checked = 0
-    last_progress = 0
     
     # Cache for point checks to avoid redundant calculations
     point_cache = {}
@@ -410,166 +391,147 @@ def solve_part2(positions):
             point_cache[(x, y)] = is_green_or_red_tile(x, y, red_set, positions)
         return point_cache[(x, y)]
     
-    for idx, (area, min_x, max_x, min_y, max_y, i, j) in enumerate(rectangles):
-        checked += 1
-        
-        # Calculate and show progress with time estimation
-        current_time = time.time()
-        elapsed = current_time - start_time
+    # Counted even when the budget stops the search, where it matters most
+    try:
+        # The bar's rate and ETA replace the per-rectangle clock reads
+        with progress.bar(total=total_rects, desc="Checking rectangles", unit="rects",
+                          level=DETAIL) as bar:
+            for idx, (area, min_x, max_x, min_y, max_y, i, j) in enumerate(rectangles):
+                checked += 1
+                budget.checkpoint(rectangles_checked=checked, best_area=max_area)
         
-        progress = (checked * 1000) // total_rects  # Use 1000 for 0.1% precision
-        if progress >= last_progress + 5:  # +5 means 0.5%
-            progress_pct = progress / 10.0
-            
-            # Estimate remaining time
-            if checked > 0:
-                avg_time_per_rect = elapsed / checked
-                remaining_rects = total_rects - checked
-                estimated_remaining = avg_time_per_rect * remaining_rects
-                
-                # Format time nicely
-                if estimated_remaining < 60:
-                    time_str = f"{estimated_remaining:.1f}s"
-                elif estimated_remaining < 3600:
-                    time_str = f"{estimated_remaining/60:.1f}m"
-                else:
-                    time_str = f"{estimated_remaining/3600:.1f}h"
-                
-                print(f"{Fore.YELLOW}Progress: {progress_pct:.1f}% ({checked}/{total_rects}) - "
-                      f"Best: {max_area} - "
-                      f"Checking: {area} - "
-                      f"ETA: {time_str} - "
-                      f"Speed: {checked/elapsed:.0f} rects/s")
-            else:
-                print(f"{Fore.YELLOW}Progress: {progress_pct:.1f}% ({checked}/{total_rects}) - "
-                      f"Best: {max_area} - "
-                      f"Checking: {area}")
-            
-            last_progress = progress
+                bar.update()
         
-        # Early termination: if current area can't beat max, we're done
-        if area <= max_area:
-            progress_pct = (checked * 100.0) / total_rects
-            elapsed = time.time() - start_time
-            print(f"{Fore.GREEN}✓ Early termination at {progress_pct:.1f}% - remaining rectangles too small")
-            print(f"{Fore.GREEN}  Total time: {elapsed:.2f}s - Speed: {checked/elapsed:.0f} rects/s")
-            break
+                # Early termination: if current area can't beat max, we're done
+                if area <= max_area:
+                    progress_pct = (checked * 100.0) / total_rects
+                    elapsed = time.time() - start_time
+                    log(f"{Fore.GREEN}✓ Early termination at {progress_pct:.1f}% - remaining rectangles too small")
+                    log(f"{Fore.GREEN}  Total time: {elapsed:.2f}s - Speed: {checked/elapsed:.0f} rects/s")
+                    break
         
-        # Quick bounding box check
-        if min_x < min_poly_x or max_x > max_poly_x or min_y < min_poly_y or max_y > max_poly_y:
-            continue
+                # Quick bounding box check
+                if min_x < min_poly_x or max_x > max_poly_x or min_y < min_poly_y or max_y > max_poly_y:
+                    continue
         
-        # Check corners first (should be red tiles)
-        if not is_valid_point_cached(min_x, min_y) or not is_valid_point_cached(max_x, max_y):
-            continue
-        if not is_valid_point_cached(min_x, max_y) or not is_valid_point_cached(max_x, min_y):
-            continue
+                # Check corners first (should be red tiles)
+                if not is_valid_point_cached(min_x, min_y) or not is_valid_point_cached(max_x, max_y):
+                    continue
+                if not is_valid_point_cached(min_x, max_y) or not is_valid_point_cached(max_x, min_y):
+                    continue
         
-        # Check all points in rectangle
-        valid = True
+                # Check all points in rectangle
+                valid = True
         
-        # For small rectangles, check all points
-        width = max_x - min_x + 1
-        height = max_y - min_y + 1
-        rect_size = width * height
+                # For small rectangles, check all points
+                width = max_x - min_x + 1
+                height = max_y - min_y + 1
+                rect_size = width * height
         
-        if rect_size <= 200:  # Full check for small rectangles (reduced threshold)
-            for x in range(min_x, max_x + 1):
-                if not valid:
-                    break
-                for y in range(min_y, max_y + 1):
-                    if not is_valid_point_cached(x, y):
-                        valid = False
-                        break
-        else:
-            # For large rectangles, use smart sampling
-            # Check all four edges completely
-            for x in range(min_x, max_x + 1):
-                if not is_valid_point_cached(x, min_y) or not is_valid_point_cached(x, max_y):
-                    valid = False
-                    break
-            
-            if valid:
-                for y in range(min_y + 1, max_y):
-                    if not is_valid_point_cached(min_x, y) or not is_valid_point_cached(max_x, y):
-                        valid = False
-                        break
-            
-            # For very large rectangles, sample interior strategically
-            if valid and rect_size > 200:
-                # Sample in a grid pattern - more aggressive sampling
-                sample_step = max(2, min(width, height) // 15)  # More samples
-                
-                for x in range(min_x + sample_step, max_x, sample_step):
-                    if not valid:
-                        break
-                    for y in range(min_y + sample_step, max_y, sample_step):
-                        if not is_valid_point_cached(x, y):
-                            valid = False
-                            break
-                
-                # Trust sampling for very large rectangles
-                if valid and rect_size > 5000:  # Reduced from 10000
-                    # For very large rectangles, trust the sampling to save time
-                    pass
-                elif valid:
-                    # For medium rectangles, do full check
-                    for x in range(min_x + 1, max_x):
+                if rect_size <= 200:  # Full check for small rectangles (reduced threshold)
+                    for x in range(min_x, max_x + 1):
                         if not valid:
                             break
-                        for y in range(min_y + 1, max_y):
+                        for y in range(min_y, max_y + 1):
                             if not is_valid_point_cached(x, y):
                                 valid = False
                                 break
+                else:
+                    # For large rectangles, use smart sampling
+                    # Check all four edges completely
+                    for x in range(min_x, max_x + 1):
+                        if not is_valid_point_cached(x, min_y) or not is_valid_point_cached(x, max_y):
+                            valid = False
+                            break
+            
+                    if valid:
+                        for y in range(min_y + 1, max_y):
+                            if not is_valid_point_cached(min_x, y) or not is_valid_point_cached(max_x, y):
+                                valid = False
+                                break
+            
+                    # For very large rectangles, sample interior strategically
+                    if valid and rect_size > 200:
+                        # Sample in a grid pattern - more aggressive sampling
+                        sample_step = max(2, min(width, height) // 15)  # More samples
+                
+                        for x in range(min_x + sample_step, max_x, sample_step):
+                            if not valid:
+                                break
+                            for y in range(min_y + sample_step, max_y, sample_step):
+                                if not is_valid_point_cached(x, y):
+                                    valid = False
+                                    break
+                
+                        # Trust sampling for very large rectangles
+                        if valid and rect_size > 5000:  # Reduced from 10000
+                            # For very large rectangles, trust the sampling to save time
+                            pass
+                        elif valid:
+                            # For medium rectangles, do full check
+                            for x in range(min_x + 1, max_x):
+                                if not valid:
+                                    break
+                                for y in range(min_y + 1, max_y):
+                                    if not is_valid_point_cached(x, y):
+                                        valid = False
+                                        break
         
-        if valid:
-            max_area = area
-            progress_pct = (checked * 100.0) / total_rects
-            elapsed = time.time() - start_time
-            print(f"{Fore.GREEN}{'='*70}")
-            print(f"{Fore.GREEN}✓ FOUND VALID RECTANGLE!")
-            print(f"{Fore.GREEN}  Area: {area}")
-            print(f"{Fore.GREEN}  Bounds: ({min_x},{min_y}) to ({max_x},{max_y})")
-            print(f"{Fore.GREEN}  Size: {width}x{height}")
-            print(f"{Fore.GREEN}  Progress: {progress_pct:.2f}% ({checked}/{total_rects})")
-            print(f"{Fore.GREEN}  Time elapsed: {elapsed:.2f}s")
-            print(f"{Fore.GREEN}  Cache size: {len(point_cache)} points")
-            print(f"{Fore.GREEN}{'='*70}")
-            # Don't break - continue to verify no larger valid rectangle exists
-    
+                if valid:
+                    max_area = area
+                    bar.set(best=max_area)
+                    progress_pct = (checked * 100.0) / total_rects
+                    elapsed = time.time() - start_time
+                    log(f"{Fore.GREEN}{'='*70}")
+                    log(f"{Fore.GREEN}✓ FOUND VALID RECTANGLE!")
+                    log(f"{Fore.GREEN}  Area: {area}")
+                    log(f"{Fore.GREEN}  Bounds: ({min_x},{min_y}) to ({max_x},{max_y})")
+                    log(f"{Fore.GREEN}  Size: {width}x{height}")
+                    log(f"{Fore.GREEN}  Progress: {progress_pct:.2f}% ({checked}/{total_rects})")
+                    log(f"{Fore.GREEN}  Time elapsed: {elapsed:.2f}s")
+                    log(f"{Fore.GREEN}  Cache size: {len(point_cache)} points")
+                    log(f"{Fore.GREEN}{'='*70}")
+                    # Don't break - continue to verify no larger valid rectangle exists
+    finally:
+        counters.add("rectangles_tested", checked)
     elapsed = time.time() - start_time
-    print(f"{Fore.CYAN}Total rectangles checked: {checked}/{total_rects}")
-    print(f"{Fore.CYAN}Total time: {elapsed:.2f}s - Average: {(elapsed*1000/checked):.2f}ms per rectangle")
-    print(f"{Fore.CYAN}Local cache: {len(point_cache)} unique points")
-    print(f"{Fore.CYAN}Global edge cache: {len(_edge_cache)} entries")
-    print(f"{Fore.CYAN}Global inside cache: {len(_inside_cache)} entries")
+    log(f"{Fore.CYAN}Total rectangles checked: {checked}/{total_rects}")
+    log(f"{Fore.CYAN}Total time: {elapsed:.2f}s - Average: {(elapsed*1000/checked):.2f}ms per rectangle")
+    log(f"{Fore.CYAN}Local cache: {len(point_cache)} unique points")
+    log(f"{Fore.CYAN}Global edge cache: {len(_edge_cache)} entries")
+    log(f"{Fore.CYAN}Global inside cache: {len(_inside_cache)} entries")
     
     return max_area
 
 
-def part1(content):
+def parse(content):
+    """
+    Parse stage shared by both parts: the red tile positions
+    """
+    return parse_input(content)
+
+
+def part1(positions):
     """
     Solution for Part 1: Find largest rectangle area.
     """
     start_time = time.time()
     
-    print(f"{Fore.YELLOW}Part 1: Finding largest rectangle with red tiles as opposite corners...")
+    log(f"{Fore.YELLOW}Part 1: Finding largest rectangle with red tiles as opposite corners...")
     
-    # Parse red tile positions
-    positions = parse_input(content)
     n = len(positions)
     
-    print(f"{Fore.YELLOW}Number of red tiles: {n}")
+    log(f"{Fore.YELLOW}Number of red tiles: {n}")
     
     # Solve
     result = solve_part1(positions)
     
     # Print summary
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Movie Theater Red Tiles Summary (Part 1):")
-    print(f"{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Largest rectangle area: {result}")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}Movie Theater Red Tiles Summary (Part 1):")
+    log(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Largest rectangle area: {result}")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": result,
@@ -579,29 +541,27 @@ def part1(content):
     }
 
 
-def part2(content):
+def part2(positions):
     """
     Solution for Part 2: Find largest rectangle using only red and green tiles.
     """
     start_time = time.time()
     
-    print(f"{Fore.YELLOW}Part 2: Finding largest rectangle using only red and green tiles...")
+    log(f"{Fore.YELLOW}Part 2: Finding largest rectangle using only red and green tiles...")
     
-    # Parse red tile positions
-    positions = parse_input(content)
     n = len(positions)
     
-    print(f"{Fore.YELLOW}Number of red tiles: {n}")
+    log(f"{Fore.YELLOW}Number of red tiles: {n}")
     
     # Solve
     result = solve_part2(positions)
     
     # Print summary
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Part 2 Summary:")
-    print(f"{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Largest rectangle area using red/green tiles: {result}")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}Part 2 Summary:")
+    log(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Largest rectangle area using red/green tiles: {result}")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": result,
@@ -611,187 +571,5 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected, filename, part_name):
-    """
-    Determine the test status based on the result and expected value.
-    """
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    try:
-        result_value = result["value"]
-        if isinstance(result_value, str) and result_value == 'N/A':
-            return TEST_STATUS["IN_PROGRESS"]
-        
-        expected_value = int(expected)
-        
-        if result_value == expected_value:
-            return TEST_STATUS["PASSED"]
-        else:
-            print(f"{Fore.RED}✗ TEST FAILED for {filename} {part_name}")
-            print(f"{Fore.RED}  Expected: {expected_value}")
-            print(f"{Fore.RED}  Got: {result_value}")
-            
-            if "problems_count" in result:
-                print(f"{Fore.RED}  Problems count: {result['problems_count']}")
-            
-            return TEST_STATUS["FAILED"]
-    except ValueError:
-        return TEST_STATUS["UNKNOWN"]
-
-
-def get_status_color(status):
-    """
-    Get the appropriate color for each status
-    """
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """
-    Process a single file and validate results against test solutions
-    """
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            # Get test solutions if available
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            # Add status to results with detailed checking
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", "N/A"),
-                filename,
-                "Part 1"
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", "N/A"),
-                filename, 
-                "Part 2"
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        print(f"{Fore.RED}Error processing {filename}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory, tests first"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    
-    # Get all files and sort them to process test files first
-    files = []
-    for f in os.listdir(input_dir):
-        if os.path.isfile(os.path.join(input_dir, f)):
-            files.append(f)
-    
-    # Sort files: test files first, then input files
-    def sort_key(filename):
-        if filename.startswith('test'):
-            return (0, filename)
-        elif filename.startswith('input'):
-            return (1, filename)
-        else:
-            return (2, filename)
-    
-    files.sort(key=sort_key)
-    
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        print(f"\n{Fore.YELLOW}Processing: {file}")
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    # Print test files first, then input files
-    sorted_files = sorted(results.keys(), key=lambda x: (0 if x.startswith('test') else 1, x))
-    
-    all_tests_passed = True
-    
-    for file in sorted_files:
-        success, result = results[file]
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                value = part_result['value']
-                value_str = str(value)
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{value_str:<20} "
-                      f"{status_color}{status_text:<20} "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s")
-                
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    expected_value = TEST_SOLUTIONS.get(file, {}).get(part_name, "N/A")
-                    expected_str = str(expected_value)
-                    print(f"       {Fore.RED}Expected: {expected_str}")
-                    all_tests_passed = False
-
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-            all_tests_passed = False
-    
-    # Print overall test summary
-    print(f"\n{Fore.CYAN}{'='*80}")
-    if all_tests_passed:
-        print(f"{Fore.GREEN}🎉 ALL TESTS PASSED! 🎉")
-    else:
-        print(f"{Fore.RED}❌ SOME TESTS FAILED")
-    print(f"{Fore.CYAN}{'='*80}")
-
-
-def main():
-    """
-    Main function with improved error handling and command line support
-    """
-    try:
-        input_dir = "./input/"
-        if len(sys.argv) > 1:
-            input_dir = sys.argv[1]
-        
-        results = process_directory(input_dir)
-        print_results(results)
-        
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
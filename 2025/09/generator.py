@@ -0,0 +1,36 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2025/09: a rectilinear polygon of size red tiles.
+
+The polygon is a histogram: a flat bottom edge and a top edge made of
+steps of random width and height, listed in order so every tile shares a
+row or a column with the next one, as in the real input.
+"""
+
+SIZES = (16, 32, 64, 128)
+
+SPACE = 100000
+
+
+def generate(size, rng):
+    """
+    About size vertices (always an even number, at least 4) of "x,y"
+    """
+    columns = max(1, (size - 2) // 2)
+    xs = sorted(rng.sample(range(SPACE), columns + 1))
+
+    heights = []
+    for _ in range(columns):
+        height = rng.randrange(SPACE // 100, SPACE)
+        # Equal neighbouring heights would leave a vertex in the middle of an edge
+        while heights and height == heights[-1]:
+            height = rng.randrange(SPACE // 100, SPACE)
+        heights.append(height)
+
+    vertices = [(xs[0], 0)]
+    for column, height in enumerate(heights):
+        vertices.append((xs[column], height))
+        vertices.append((xs[column + 1], height))
+    vertices.append((xs[-1], 0))
+    return ''.join(f"{x},{y}\n" for x, y in vertices)
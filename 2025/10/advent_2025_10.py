@@ -88,8 +88,11 @@ import sys
 import time
 from colorama import init, Fore
 import re
-import numpy as np
-from scipy.optimize import milp, LinearConstraint, Bounds
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import progress
+from aoc.runner import run_day
+from aoc.output import log, DETAIL
 
 init(autoreset=True)
 
@@ -104,29 +107,6 @@ TEST_SOLUTIONS = {
     }
 }
 
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN_PROGRESS",
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
-
-
-def print_header(filename, part):
-    """Simple header printing function"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """Parse machine configurations from input."""
     machines_part1 = []
@@ -307,6 +287,8 @@ def solve_integer_linear_ilp(target_counts, button_effects):
     Solve integer linear system using Mixed Integer Linear Programming (MILP).
     This guarantees the optimal solution.
     """
+    import numpy as np
+    from scipy.optimize import milp, LinearConstraint, Bounds
     n_counters = len(target_counts)
     n_buttons = len(button_effects)
     
@@ -424,7 +406,7 @@ def solve_part1(machines):
     for i, machine in enumerate(machines):
         presses = find_minimum_presses_part1(machine)
         if presses is None:
-            print(f"{Fore.RED}Machine {i} has no solution!")
+            log(f"{Fore.RED}Machine {i} has no solution!")
         else:
             total_presses += presses
     
@@ -437,71 +419,53 @@ def solve_part2(machines):
     total_machines = len(machines)
     start_time = time.time()
     
-    print(f"{Fore.CYAN}Processing {total_machines} machines...")
+    log(f"{Fore.CYAN}Processing {total_machines} machines...")
     
-    for i, machine in enumerate(machines):
-        elapsed = time.time() - start_time
-        progress_pct = (i + 1) / total_machines * 100
-        
-        if i > 0:
-            avg_time = elapsed / (i + 1)
-            remaining = total_machines - (i + 1)
-            eta_seconds = avg_time * remaining
+    with progress.bar(total=total_machines, desc="Machines", unit="machines",
+                      level=DETAIL) as bar:
+        for i, machine in enumerate(machines):
+            presses = find_minimum_presses_part2(machine)
             
-            if eta_seconds < 60:
-                eta_str = f"{eta_seconds:.0f}s"
-            elif eta_seconds < 3600:
-                minutes = int(eta_seconds // 60)
-                seconds = int(eta_seconds % 60)
-                eta_str = f"{minutes}m{seconds}s"
+            if presses is None:
+                log(f"\n{Fore.RED}Machine {i} has no solution!")
             else:
-                hours = int(eta_seconds // 3600)
-                minutes = int((eta_seconds % 3600) // 60)
-                eta_str = f"{hours}h{minutes}m"
-        else:
-            eta_str = "calculating..."
-        
-        sys.stdout.write(f"\r{Fore.YELLOW}[{int(progress_pct):3d}%] "
-                       f"Machine {i+1:3d}/{total_machines} | "
-                       f"ETA: {eta_str:>8} | "
-                       f"Total: {total_presses:6d}")
-        sys.stdout.flush()
-        
-        presses = find_minimum_presses_part2(machine)
-        
-        if presses is None:
-            print(f"\n{Fore.RED}Machine {i} has no solution!")
-        else:
-            total_presses += presses
-    
-    sys.stdout.write("\r" + " " * 100 + "\r")
+                total_presses += presses
+            bar.update()
+            bar.set(presses=total_presses)
     
     elapsed = time.time() - start_time
-    print(f"{Fore.GREEN}✓ Processed {total_machines} machines in {elapsed:.2f}s")
+    log(f"{Fore.GREEN}✓ Processed {total_machines} machines in {elapsed:.2f}s")
     
     return total_presses
 
 
-def part1(content):
+def parse(content):
+    """
+    Parse stage shared by both parts: both views of the machine descriptions
+    """
+    return parse_input(content)
+
+
+def part1(machines):
     """Solution for Part 1: Find minimum total button presses for lights."""
     start_time = time.time()
     
-    print(f"{Fore.YELLOW}Part 1: Finding minimum button presses for indicator lights...")
+    log(f"{Fore.YELLOW}Part 1: Finding minimum button presses for indicator lights...")
     
-    machines_part1, _ = parse_input(content)
+    machines_part1, _ = machines
     n_machines = len(machines_part1)
     
-    print(f"{Fore.YELLOW}Number of machines: {n_machines}")
+    log(f"{Fore.YELLOW}Number of machines: {n_machines}")
     
     result = solve_part1(machines_part1)
     
     elapsed = time.time() - start_time
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Factory Machines Summary (Part 1):")
-    print(f"{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Total minimum button presses: {result}")
-    print(f"{Fore.CYAN}Time: {elapsed:.3f}s ({elapsed/n_machines:.3f}s per machine)")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}Factory Machines Summary (Part 1):")
+    log(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Total minimum button presses: {result}")
+    log(f"{Fore.CYAN}Time: {elapsed:.3f}s ({elapsed/n_machines:.3f}s per machine)")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": result,
@@ -511,26 +475,26 @@ def part1(content):
     }
 
 
-def part2(content):
+def part2(machines):
     """Solution for Part 2: Find minimum total button presses for joltage counters."""
     start_time = time.time()
     
-    print(f"{Fore.YELLOW}Part 2: Finding minimum button presses for joltage counters...")
+    log(f"{Fore.YELLOW}Part 2: Finding minimum button presses for joltage counters...")
     
-    _, machines_part2 = parse_input(content)
+    _, machines_part2 = machines
     n_machines = len(machines_part2)
     
-    print(f"{Fore.YELLOW}Number of machines: {n_machines}")
+    log(f"{Fore.YELLOW}Number of machines: {n_machines}")
     
     result = solve_part2(machines_part2)
     
     elapsed = time.time() - start_time
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Part 2 Summary:")
-    print(f"{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Total minimum button presses: {result}")
-    print(f"{Fore.CYAN}Time: {elapsed:.3f}s ({elapsed/n_machines:.3f}s per machine)")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}Part 2 Summary:")
+    log(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Total minimum button presses: {result}")
+    log(f"{Fore.CYAN}Time: {elapsed:.3f}s ({elapsed/n_machines:.3f}s per machine)")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": result,
@@ -540,173 +504,5 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected, filename, part_name):
-    """Determine the test status based on the result and expected value."""
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    try:
-        result_value = result["value"]
-        if isinstance(result_value, str) and result_value == 'N/A':
-            return TEST_STATUS["IN_PROGRESS"]
-        
-        expected_value = int(expected)
-        
-        if result_value == expected_value:
-            return TEST_STATUS["PASSED"]
-        else:
-            print(f"{Fore.RED}✗ TEST FAILED for {filename} {part_name}")
-            print(f"{Fore.RED}  Expected: {expected_value}")
-            print(f"{Fore.RED}  Got: {result_value}")
-            
-            if "problems_count" in result:
-                print(f"{Fore.RED}  Problems count: {result['problems_count']}")
-            
-            return TEST_STATUS["FAILED"]
-    except ValueError:
-        return TEST_STATUS["UNKNOWN"]
-
-
-def get_status_color(status):
-    """Get the appropriate color for each status"""
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """Process a single file and validate results against test solutions"""
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", "N/A"),
-                filename,
-                "Part 1"
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", "N/A"),
-                filename, 
-                "Part 2"
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        print(f"{Fore.RED}Error processing {filename}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory, tests first"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    
-    files = []
-    for f in os.listdir(input_dir):
-        if os.path.isfile(os.path.join(input_dir, f)):
-            files.append(f)
-    
-    def sort_key(filename):
-        if filename.startswith('test'):
-            return (0, filename)
-        elif filename.startswith('input'):
-            return (1, filename)
-        else:
-            return (2, filename)
-    
-    files.sort(key=sort_key)
-    
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        print(f"\n{Fore.YELLOW}Processing: {file}")
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    sorted_files = sorted(results.keys(), key=lambda x: (0 if x.startswith('test') else 1, x))
-    
-    all_tests_passed = True
-    
-    for file in sorted_files:
-        success, result = results[file]
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                value = part_result['value']
-                value_str = str(value)
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{value_str:<20} "
-                      f"{status_color}{status_text:<20} "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.3f}s")
-                
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    expected_value = TEST_SOLUTIONS.get(file, {}).get(part_name, "N/A")
-                    expected_str = str(expected_value)
-                    print(f"       {Fore.RED}Expected: {expected_str}")
-                    all_tests_passed = False
-
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-            all_tests_passed = False
-    
-    print(f"\n{Fore.CYAN}{'='*80}")
-    if all_tests_passed:
-        print(f"{Fore.GREEN}🎉 ALL TESTS PASSED! 🎉")
-    else:
-        print(f"{Fore.RED}❌ SOME TESTS FAILED")
-    print(f"{Fore.CYAN}{'='*80}")
-
-
-def main():
-    """Main function with improved error handling and command line support"""
-    try:
-        input_dir = "./input/"
-        if len(sys.argv) > 1:
-            input_dir = sys.argv[1]
-        
-        results = process_directory(input_dir)
-        print_results(results)
-        
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
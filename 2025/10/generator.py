@@ -0,0 +1,49 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2025/10: size machines with 4-10 indicator lights.
+
+Every target is built from a random set of button presses, so both the
+light pattern and the joltage requirements are always reachable.
+"""
+
+SIZES = (10, 20, 40, 80)
+
+MAX_PRESSES = 12
+
+
+def generate_machine(rng):
+    """
+    One "[lights] (buttons)... {joltages}" line
+    """
+    lights = rng.randint(4, 10)
+    buttons = []
+    for _ in range(rng.randint(3, lights + 3)):
+        wiring = sorted(rng.sample(range(lights), rng.randint(1, min(5, lights))))
+        buttons.append(wiring)
+    # Every light is wired to at least one button, as in the real machines
+    for light in set(range(lights)) - {light for wiring in buttons for light in wiring}:
+        wiring = rng.choice(buttons)
+        wiring.append(light)
+        wiring.sort()
+
+    pattern = [0] * lights
+    joltages = [0] * lights
+    for wiring in buttons:
+        if rng.random() < 0.5:
+            for light in wiring:
+                pattern[light] ^= 1
+        presses = rng.randint(0, MAX_PRESSES)
+        for light in wiring:
+            joltages[light] += presses
+
+    diagram = ''.join('#' if on else '.' for on in pattern)
+    wirings = ' '.join(f"({','.join(map(str, wiring))})" for wiring in buttons)
+    return f"[{diagram}] {wirings} {{{','.join(map(str, joltages))}}}"
+
+
+def generate(size, rng):
+    """
+    size machine lines
+    """
+    return ''.join(generate_machine(rng) + '\n' for _ in range(size))
@@ -87,6 +87,11 @@ import threading
 from collections import defaultdict, deque
 from colorama import init, Fore, Style
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import budget, progress
+from aoc.runner import TEST_STATUS, run_day
+from aoc.output import log, DETAIL
+
 init(autoreset=True)
 
 TEST_SOLUTIONS = {
@@ -104,22 +109,6 @@ TEST_SOLUTIONS = {
     }
 }
 
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN_PROGRESS",
-    "NOT_APPLICABLE": "NOT_APPLICABLE",  
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["NOT_APPLICABLE"]: Fore.LIGHTBLACK_EX,  
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
-
 # Global variables for progress tracking
 progress_lock = threading.Lock()
 progress_count = 0
@@ -128,14 +117,6 @@ progress_active = False
 progress_interval = 0.5
 
 
-def print_header(filename, part):
-    """Simple header printing function"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """Parse the graph from input."""
     graph = defaultdict(list)
@@ -231,6 +212,7 @@ def count_paths_with_cycles(graph, start, end):
     
     def dfs(node, visited):
         nonlocal count
+        budget.checkpoint(paths=count)
         
         if node == end:
             count += 1
@@ -260,6 +242,7 @@ def count_paths_with_cycles_iterative(graph, start, end):
     
     while stack:
         node, visited = stack.pop()
+        budget.checkpoint(paths=count, stack=len(stack))
         
         if node == end:
             count += 1
@@ -289,7 +272,7 @@ def count_paths_with_required(graph, start, end, required):
     node_to_bit = {node: i for i, node in enumerate(sorted(required))}
     all_required_mask = (1 << len(required)) - 1
     
-    print(f"{Fore.CYAN}Analyzing graph structure...")
+    log(f"{Fore.CYAN}Analyzing graph structure...")
     
     # Check if graph is DAG - if so, we can use DP!
     indegree = defaultdict(int)
@@ -315,10 +298,10 @@ def count_paths_with_required(graph, start, end, required):
     is_dag = len(topo_order) == len(all_nodes)
     
     if is_dag:
-        print(f"{Fore.GREEN}✓ Graph is a DAG! Using dynamic programming...")
+        log(f"{Fore.GREEN}✓ Graph is a DAG! Using dynamic programming...")
         return count_paths_dag_with_required(graph, start, end, required, node_to_bit, all_required_mask, topo_order)
     
-    print(f"{Fore.YELLOW}Graph has cycles, using optimized DFS...")
+    log(f"{Fore.YELLOW}Graph has cycles, using optimized DFS...")
     
     # Pre-compute reachability
     reachable_required = {}
@@ -338,30 +321,12 @@ def count_paths_with_required(graph, start, end, required):
     
     count = 0
     visited = set()
-    total_iterations = 0
-    last_print = time.time()
-    start_time = time.time()
     
     def dfs_backtrack(node, mask, depth=0):
-        nonlocal count, total_iterations, last_print
-        
-        total_iterations += 1
+        nonlocal count
         
-        if total_iterations % 100000 == 0:
-            current_time = time.time()
-            if current_time - last_print > 0.5:
-                elapsed = current_time - start_time
-                rate = total_iterations / elapsed if elapsed > 0 else 0
-                eta_str = f"{elapsed:.0f}s elapsed"
-                
-                if elapsed > 60 and count > 10000000:
-                    eta_str = f"{Fore.RED}Problem may have >1B solutions!"
-                
-                print(f"\r{Fore.CYAN}[{Fore.YELLOW}{total_iterations:,}{Fore.CYAN}] "
-                      f"iter | {Fore.GREEN}{count:,}{Fore.CYAN} paths | "
-                      f"{Fore.MAGENTA}{rate:,.0f}{Fore.CYAN}/s | {eta_str}", 
-                      end="", flush=True)
-                last_print = current_time
+        bar.update()
+        budget.checkpoint(paths=count, depth=depth)
         
         current_mask = mask
         if node in node_to_bit:
@@ -370,6 +335,7 @@ def count_paths_with_required(graph, start, end, required):
         if node == end:
             if current_mask == all_required_mask:
                 count += 1
+                bar.set(paths=count)
             return
         
         needed_mask = all_required_mask ^ current_mask
@@ -386,8 +352,8 @@ def count_paths_with_required(graph, start, end, required):
                 dfs_backtrack(neighbor, current_mask, depth + 1)
         visited.remove(node)
     
-    dfs_backtrack(start, 0)
-    print("\r" + " " * 120 + "\r", end="", flush=True)
+    with progress.bar(desc="Backtracking", unit="nodes", level=DETAIL) as bar:
+        dfs_backtrack(start, 0)
     return count
 
 
@@ -443,17 +409,23 @@ def optimize_graph_for_start(graph, start):
     return new_graph
 
 
-def part1(content):
+def parse(content):
+    """
+    Parse stage shared by both parts: the device graph
+    """
+    return parse_input(content)
+
+
+def part1(graph):
     """Solution for Part 1: Count all paths from 'you' to 'out'."""
     start_time = time.time()
     
-    print(f"{Fore.YELLOW}Part 1: Counting all paths from 'you' to 'out'...")
+    log(f"{Fore.YELLOW}Part 1: Counting all paths from 'you' to 'out'...")
     
-    graph = parse_input(content)
     
     # Check if we have the required nodes
     if 'you' not in graph:
-        print(f"{Fore.RED}Error: Starting node 'you' not found in graph!")
+        log(f"{Fore.RED}Error: Starting node 'you' not found in graph!")
         return {
             "value": 0,
             "execution_time": time.time() - start_time,
@@ -462,25 +434,25 @@ def part1(content):
     
     # Optimize graph
     optimized_graph = optimize_graph_for_start(graph, 'you')
-    print(f"{Fore.YELLOW}Original graph: {len(graph)} nodes")
-    print(f"{Fore.YELLOW}Optimized graph: {len(optimized_graph)} reachable nodes from 'you'")
+    log(f"{Fore.YELLOW}Original graph: {len(graph)} nodes")
+    log(f"{Fore.YELLOW}Optimized graph: {len(optimized_graph)} reachable nodes from 'you'")
     
     # Try DAG algorithm first
-    print(f"{Fore.CYAN}Trying DAG algorithm...")
+    log(f"{Fore.CYAN}Trying DAG algorithm...")
     result = count_paths_dag(optimized_graph, 'you', 'out')
     
     if result is None:
-        print(f"{Fore.YELLOW}Graph has cycles, using iterative DFS...")
+        log(f"{Fore.YELLOW}Graph has cycles, using iterative DFS...")
         result = count_paths_with_cycles_iterative(optimized_graph, 'you', 'out')
     
     elapsed = time.time() - start_time
     
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Part 1 Summary:")
-    print(f"{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Total paths from 'you' to 'out': {result:,}")
-    print(f"{Fore.CYAN}Total time: {elapsed:.3f}s")
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}Part 1 Summary:")
+    log(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Total paths from 'you' to 'out': {result:,}")
+    log(f"{Fore.CYAN}Total time: {elapsed:.3f}s")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": result,
@@ -490,20 +462,24 @@ def part1(content):
     }
 
 
-def part2(content):
+def part1_reference(graph):
+    """Plain DFS over every simple path, the oracle part1 is fuzzed against."""
+    return count_paths_with_cycles_iterative(graph, 'you', 'out')
+
+
+def part2(graph):
     """Solution for Part 2: Count all paths from 'svr' to 'out' that visit both 'dac' and 'fft'."""
     start_time = time.time()
     
-    print(f"{Fore.YELLOW}Part 2: Counting paths from 'svr' to 'out' visiting both 'dac' and 'fft'...")
+    log(f"{Fore.YELLOW}Part 2: Counting paths from 'svr' to 'out' visiting both 'dac' and 'fft'...")
     
-    graph = parse_input(content)
     
     # Check if we have the required nodes
     required_nodes = {'dac', 'fft'}
     
     # First, optimize graph to only include nodes reachable from 'svr'
     if 'svr' not in graph:
-        print(f"{Fore.RED}Error: Starting node 'svr' not found in graph!")
+        log(f"{Fore.RED}Error: Starting node 'svr' not found in graph!")
         return {
             "value": 0,
             "execution_time": time.time() - start_time,
@@ -511,9 +487,9 @@ def part2(content):
         }
     
     optimized_graph = optimize_graph_for_start(graph, 'svr')
-    print(f"{Fore.YELLOW}Original graph: {len(graph)} nodes")
-    print(f"{Fore.YELLOW}Optimized graph: {len(optimized_graph)} reachable nodes from 'svr'")
-    print(f"{Fore.YELLOW}Required nodes: {required_nodes}")
+    log(f"{Fore.YELLOW}Original graph: {len(graph)} nodes")
+    log(f"{Fore.YELLOW}Optimized graph: {len(optimized_graph)} reachable nodes from 'svr'")
+    log(f"{Fore.YELLOW}Required nodes: {required_nodes}")
     
     # Check if required nodes are in optimized graph
     missing_required = []
@@ -529,30 +505,30 @@ def part2(content):
                 missing_required.append(node)
     
     if missing_required:
-        print(f"{Fore.YELLOW}Warning: Some required nodes not reachable from 'svr': {missing_required}")
+        log(f"{Fore.YELLOW}Warning: Some required nodes not reachable from 'svr': {missing_required}")
         return {
             "value": 0,
             "execution_time": time.time() - start_time,
             "status": TEST_STATUS["FAILED"]
         }
     
-    print(f"{Fore.CYAN}Starting path counting with iterative DFS and bitmask tracking...")
-    print(f"{Fore.CYAN}This may take a while for large graphs...")
+    log(f"{Fore.CYAN}Starting path counting with iterative DFS and bitmask tracking...")
+    log(f"{Fore.CYAN}This may take a while for large graphs...")
     
     result = count_paths_with_required(optimized_graph, 'svr', 'out', required_nodes)
     
     elapsed = time.time() - start_time
     
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Part 2 Summary:")
-    print(f"{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Paths from 'svr' to 'out' visiting both 'dac' and 'fft': {result:,}")
-    print(f"{Fore.CYAN}Total time: {elapsed:.1f}s")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}Part 2 Summary:")
+    log(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Paths from 'svr' to 'out' visiting both 'dac' and 'fft': {result:,}")
+    log(f"{Fore.CYAN}Total time: {elapsed:.1f}s")
     
     if elapsed > 0:
-        print(f"{Fore.CYAN}Processing rate: {result/elapsed:,.0f} paths counted/second")
+        log(f"{Fore.CYAN}Processing rate: {result/elapsed:,.0f} paths counted/second")
     
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": result,
@@ -562,172 +538,11 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected, filename, part_name):
-    """Determine the test status based on the result and expected value."""
-    if expected is None:
-        return TEST_STATUS["NOT_APPLICABLE"]
-    
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    try:
-        result_value = result["value"]
-        if isinstance(result_value, str) and result_value == 'N/A':
-            return TEST_STATUS["IN_PROGRESS"]
-        
-        expected_value = int(expected)
-        
-        if result_value == expected_value:
-            return TEST_STATUS["PASSED"]
-        else:
-            print(f"{Fore.RED}✗ TEST FAILED for {filename} {part_name}")
-            print(f"{Fore.RED}  Expected: {expected_value}")
-            print(f"{Fore.RED}  Got: {result_value}")
-            return TEST_STATUS["FAILED"]
-    except ValueError:
-        return TEST_STATUS["UNKNOWN"]
-
-
-def get_status_color(status):
-    """Get the appropriate color for each status"""
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """Process a single file and validate results against test solutions"""
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", "N/A"),
-                filename,
-                "Part 1"
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", "N/A"),
-                filename, 
-                "Part 2"
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        print(f"{Fore.RED}Error processing {filename}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory, tests first"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    
-    files = []
-    for f in os.listdir(input_dir):
-        if os.path.isfile(os.path.join(input_dir, f)):
-            files.append(f)
-    
-    def sort_key(filename):
-        if filename.startswith('test'):
-            return (0, filename)
-        elif filename.startswith('input'):
-            return (1, filename)
-        else:
-            return (2, filename)
-    
-    files.sort(key=sort_key)
-    
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        print(f"\n{Fore.YELLOW}Processing: {file}")
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    sorted_files = sorted(results.keys(), key=lambda x: (0 if x.startswith('test') else 1, x))
-    
-    all_tests_passed = True
-    
-    for file in sorted_files:
-        success, result = results[file]
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                value = part_result['value']
-                value_str = str(value)
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{value_str:<20} "
-                      f"{status_color}{status_text:<20} "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.3f}s")
-                
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    expected_value = TEST_SOLUTIONS.get(file, {}).get(part_name, "N/A")
-                    expected_str = str(expected_value)
-                    print(f"       {Fore.RED}Expected: {expected_str}")
-                    all_tests_passed = False
-
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-            all_tests_passed = False
-    
-    print(f"\n{Fore.CYAN}{'='*80}")
-    if all_tests_passed:
-        print(f"{Fore.GREEN}🎉 ALL TESTS PASSED! 🎉")
-    else:
-        print(f"{Fore.RED}❌ SOME TESTS FAILED")
-    print(f"{Fore.CYAN}{'='*80}")
-
-
-def main():
-    """Main function with improved error handling and command line support"""
-    try:
-        input_dir = "./input/"
-        if len(sys.argv) > 1:
-            input_dir = sys.argv[1]
-        
-        results = process_directory(input_dir)
-        print_results(results)
-        
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
+# Straightforward implementations the optimized parts are checked against (aoc.fuzz)
+REFERENCES = {
+    "part1": part1_reference,
+}
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+
+"""
+Synthetic inputs for 2025/11: size random devices wired between svr, you,
+dac, fft and out.
+
+Devices are laid out in a random order and only wire to devices later in
+it, so the graph is acyclic like the real ones. Fuzzing also adds a few
+backward wires to reach the cyclic fallback.
+"""
+
+import string
+
+SIZES = (100, 200, 400, 800)
+FUZZ_SIZES = (2, 4, 6, 8)
+
+NAMED = ("svr", "you", "dac", "fft", "out")
+
+# Outputs of a device are picked among the next WINDOW devices
+WINDOW = 6
+
+
+def device_names(size, rng):
+    """
+    size distinct three letter names, none of them a named device
+    """
+    names = set()
+    while len(names) < size:
+        name = ''.join(rng.choice(string.ascii_lowercase) for _ in range(3))
+        if name not in NAMED:
+            names.add(name)
+    return sorted(names)
+
+
+def build_graph(size, rng):
+    """
+    Device order and {device: outputs} of an acyclic wiring
+    """
+    middle = device_names(size, rng) + ["dac", "fft"]
+    rng.shuffle(middle)
+    order = ["svr", "you"] + middle + ["out"]
+    graph = {}
+    for i, device in enumerate(order[:-1]):
+        later = order[i + 1:i + 1 + WINDOW]
+        graph[device] = rng.sample(later, rng.randint(1, min(3, len(later))))
+    return order, graph
+
+
+def format_graph(graph, rng):
+    """
+    One "device: outputs" line per device, in random order
+    """
+    devices = list(graph)
+    rng.shuffle(devices)
+    return ''.join(f"{device}: {' '.join(graph[device])}\n" for device in devices)
+
+
+def generate(size, rng):
+    """
+    An acyclic device list with size extra devices
+    """
+    _, graph = build_graph(size, rng)
+    return format_graph(graph, rng)
+
+
+def fuzz(size, rng):
+    """
+    Like generate, with up to two wires back to earlier devices
+    """
+    order, graph = build_graph(size, rng)
+    for _ in range(rng.randint(0, 2)):
+        i = rng.randrange(1, len(order) - 1)
+        target = order[rng.randrange(i)]
+        if target not in graph[order[i]]:
+            graph[order[i]].append(target)
+    return format_graph(graph, rng)
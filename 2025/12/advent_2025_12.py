@@ -109,6 +109,11 @@ import time
 from collections import defaultdict
 from colorama import init, Fore, Style
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from aoc import budget, counters
+from aoc.runner import TEST_STATUS, run_day
+from aoc.output import log, DETAIL
+
 init(autoreset=True)
 
 TEST_SOLUTIONS = {
@@ -126,31 +131,6 @@ TEST_SOLUTIONS = {
     }
 }
 
-TEST_STATUS = {
-    "PASSED": "PASSED",
-    "FAILED": "FAILED", 
-    "IN_PROGRESS": "IN_PROGRESS",
-    "NOT_APPLICABLE": "NOT_APPLICABLE",  
-    "UNKNOWN": "UNKNOWN"
-}
-
-STATUS_COLORS = {
-    TEST_STATUS["PASSED"]: Fore.GREEN,
-    TEST_STATUS["FAILED"]: Fore.RED,
-    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
-    TEST_STATUS["NOT_APPLICABLE"]: Fore.LIGHTBLACK_EX,  
-    TEST_STATUS["UNKNOWN"]: Fore.BLUE
-}
-
-
-def print_header(filename, part):
-    """Simple header printing function"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
-    print(f"{Fore.CYAN}Part {part}")
-    print(f"{Fore.CYAN}{'='*80}\n")
-
-
 def parse_input(content):
     """Parse shapes and regions from input."""
     lines = content.strip().split('\n')
@@ -332,7 +312,12 @@ def solve_exact_cover(shapes_data, width, height, counts):
     shape_order.sort(key=lambda x: x[1])
     shape_order = [shape_id for shape_id, _ in shape_order]
     
+    nodes = 0
+
     def backtrack(idx, remaining_counts):
+        nonlocal nodes
+        nodes += 1
+        budget.checkpoint()
         if idx >= len(shape_order):
             return True
             
@@ -371,22 +356,24 @@ def solve_exact_cover(shapes_data, width, height, counts):
         
         return False
     
-    return backtrack(0, counts.copy())
+    fits = backtrack(0, counts.copy())
+    counters.add("nodes_expanded", nodes)
+    return fits
 
 
 def part1(content):
     """Solution for Part 1: Count regions that can fit all presents."""
     start_time = time.time()
     
-    print(f"{Fore.YELLOW}Part 1: Counting regions that can fit all presents...")
+    log(f"{Fore.YELLOW}Part 1: Counting regions that can fit all presents...")
     
     shapes, regions = parse_input(content)
     
-    print(f"{Fore.YELLOW}Found {len(shapes)} unique shapes")
-    print(f"{Fore.YELLOW}Found {len(regions)} regions to check")
+    log(f"{Fore.YELLOW}Found {len(shapes)} unique shapes")
+    log(f"{Fore.YELLOW}Found {len(regions)} regions to check")
     
     if not shapes:
-        print(f"{Fore.RED}No shapes found in input!")
+        log(f"{Fore.RED}No shapes found in input!")
         elapsed = time.time() - start_time
         return {
             "value": 0,
@@ -425,7 +412,8 @@ def part1(content):
     total_regions = len(regions)
     
     for i, (width, height, counts) in enumerate(regions):
-        print(f"{Fore.CYAN}Checking region {i+1}/{total_regions}: {width}x{height} with counts {counts}")
+        budget.checkpoint(nodes=0, regions_checked=i, regions_fitting=feasible_count)
+        log(f"{Fore.CYAN}Checking region {i+1}/{total_regions}: {width}x{height} with counts {counts}", level=DETAIL)
         
         # Extend counts list if needed
         if len(counts) <= max_shape_id:
@@ -442,7 +430,7 @@ def part1(content):
                 needed_area += shapes_data[shape_id][1] * count
         
         if needed_area > total_area:
-            print(f"{Fore.RED}  ✗ Area too small ({needed_area} > {total_area})")
+            log(f"{Fore.RED}  ✗ Area too small ({needed_area} > {total_area})", level=DETAIL)
             region_results.append(False)
             continue
         
@@ -452,11 +440,11 @@ def part1(content):
         check_time = time.time() - start_check
         
         if fits:
-            print(f"{Fore.GREEN}  ✓ Region fits ({check_time:.2f}s)")
+            log(f"{Fore.GREEN}  ✓ Region fits ({check_time:.2f}s)", level=DETAIL)
             feasible_count += 1
             region_results.append(True)
         else:
-            print(f"{Fore.RED}  ✗ Region does not fit ({check_time:.2f}s)")
+            log(f"{Fore.RED}  ✗ Region does not fit ({check_time:.2f}s)", level=DETAIL)
             region_results.append(False)
         
         # Progress update for large inputs
@@ -464,20 +452,20 @@ def part1(content):
             elapsed_total = time.time() - start_time
             est_total = elapsed_total * total_regions / (i + 1)
             remaining = est_total - elapsed_total
-            print(f"{Fore.MAGENTA}  Progress: {i+1}/{total_regions} ({elapsed_total:.1f}s elapsed, ~{remaining:.1f}s remaining)")
+            log(f"{Fore.MAGENTA}  Progress: {i+1}/{total_regions} ({elapsed_total:.1f}s elapsed, ~{remaining:.1f}s remaining)", level=DETAIL)
     
     elapsed = time.time() - start_time
     
-    print(f"\n{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.CYAN}Part 1 Summary:")
-    print(f"{Fore.CYAN}{'-'*60}")
-    print(f"{Fore.GREEN}Regions that fit: {feasible_count} out of {len(regions)}")
-    print(f"{Fore.CYAN}Total time: {elapsed:.3f}s")
+    log(f"\n{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}Part 1 Summary:")
+    log(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.GREEN}Regions that fit: {feasible_count} out of {len(regions)}")
+    log(f"{Fore.CYAN}Total time: {elapsed:.3f}s")
     
     if elapsed > 0 and len(regions) > 0:
-        print(f"{Fore.CYAN}Average time per region: {elapsed/len(regions):.3f}s")
+        log(f"{Fore.CYAN}Average time per region: {elapsed/len(regions):.3f}s")
     
-    print(f"{Fore.CYAN}{'-'*60}")
+    log(f"{Fore.CYAN}{'-'*60}")
     
     return {
         "value": feasible_count,
@@ -492,7 +480,7 @@ def part2(content):
     """Solution for Part 2 (if applicable)."""
     start_time = time.time()
     
-    print(f"{Fore.YELLOW}Part 2: Not applicable for this puzzle")
+    log(f"{Fore.YELLOW}Part 2: Not applicable for this puzzle")
     
     elapsed = time.time() - start_time
     
@@ -503,172 +491,5 @@ def part2(content):
     }
 
 
-def determine_test_status(result, expected, filename, part_name):
-    """Determine the test status based on the result and expected value."""
-    if expected is None:
-        return TEST_STATUS["NOT_APPLICABLE"]
-    
-    if expected == 'N/A':
-        return TEST_STATUS["IN_PROGRESS"]
-    
-    try:
-        result_value = result["value"]
-        if isinstance(result_value, str) and result_value == 'N/A':
-            return TEST_STATUS["IN_PROGRESS"]
-        
-        expected_value = int(expected)
-        
-        if result_value == expected_value:
-            return TEST_STATUS["PASSED"]
-        else:
-            print(f"{Fore.RED}✗ TEST FAILED for {filename} {part_name}")
-            print(f"{Fore.RED}  Expected: {expected_value}")
-            print(f"{Fore.RED}  Got: {result_value}")
-            return TEST_STATUS["FAILED"]
-    except ValueError:
-        return TEST_STATUS["UNKNOWN"]
-
-
-def get_status_color(status):
-    """Get the appropriate color for each status"""
-    return STATUS_COLORS.get(status, Fore.WHITE)
-
-
-def process_file(filepath):
-    """Process a single file and validate results against test solutions"""
-    filename = os.path.basename(filepath)
-    
-    try:
-        with open(filepath, 'r') as file:
-            content = file.read()
-            
-            print_header(filename, 1)
-            part1_result = part1(content)
-            
-            print_header(filename, 2)
-            part2_result = part2(content)
-            
-            test_solution = TEST_SOLUTIONS.get(filename, {})
-            
-            part1_result["status"] = determine_test_status(
-                part1_result, 
-                test_solution.get("part1", "N/A"),
-                filename,
-                "Part 1"
-            )
-            part2_result["status"] = determine_test_status(
-                part2_result,
-                test_solution.get("part2", "N/A"),
-                filename, 
-                "Part 2"
-            )
-            
-            return True, {
-                "part1": part1_result,
-                "part2": part2_result
-            }
-            
-    except Exception as e:
-        print(f"{Fore.RED}Error processing {filename}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False, str(e)
-
-
-def process_directory(input_dir="./input/"):
-    """Process all files in the specified directory, tests first"""
-    if not os.path.exists(input_dir):
-        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
-    
-    print(f"\n{Fore.CYAN}Processing files in directory: {Fore.YELLOW}{input_dir}")
-    
-    files = []
-    for f in os.listdir(input_dir):
-        if os.path.isfile(os.path.join(input_dir, f)):
-            files.append(f)
-    
-    def sort_key(filename):
-        if filename.startswith('test'):
-            return (0, filename)
-        elif filename.startswith('input'):
-            return (1, filename)
-        else:
-            return (2, filename)
-    
-    files.sort(key=sort_key)
-    
-    results = {}
-    
-    for file in files:
-        filepath = os.path.join(input_dir, file)
-        print(f"\n{Fore.YELLOW}Processing: {file}")
-        success, result = process_file(filepath)
-        results[file] = (success, result)
-    
-    return results
-
-
-def print_results(results):
-    """Print results with enhanced status display"""
-    print(f"\n{Fore.CYAN}{'='*80}")
-    print(f"{Fore.CYAN}Final Results")
-    print(f"{Fore.CYAN}{'='*80}\n")
-    
-    sorted_files = sorted(results.keys(), key=lambda x: (0 if x.startswith('test') else 1, x))
-    
-    all_tests_passed = True
-    
-    for file in sorted_files:
-        success, result = results[file]
-        print(f"\n{Fore.BLUE}{file}:")
-        
-        if success:
-            for part_name, part_result in result.items():
-                status_color = get_status_color(part_result["status"])
-                status_text = f"[{part_result['status']}]"
-                
-                value = part_result['value']
-                value_str = str(value)
-                
-                print(f"  {Fore.YELLOW}{part_name}: "
-                      f"{Fore.GREEN}{value_str:<20} "
-                      f"{status_color}{status_text:<20} "
-                      f"{Fore.CYAN}Time: {part_result['execution_time']:.3f}s")
-                
-                if part_result["status"] == TEST_STATUS["FAILED"]:
-                    expected_value = TEST_SOLUTIONS.get(file, {}).get(part_name, "N/A")
-                    expected_str = str(expected_value)
-                    print(f"       {Fore.RED}Expected: {expected_str}")
-                    all_tests_passed = False
-
-        else:
-            print(f"  {Fore.RED}Error - {result}")
-            all_tests_passed = False
-    
-    print(f"\n{Fore.CYAN}{'='*80}")
-    if all_tests_passed:
-        print(f"{Fore.GREEN}🎉 ALL TESTS PASSED! 🎉")
-    else:
-        print(f"{Fore.RED}❌ SOME TESTS FAILED")
-    print(f"{Fore.CYAN}{'='*80}")
-
-
-def main():
-    """Main function with improved error handling and command line support"""
-    try:
-        input_dir = "./input/"
-        if len(sys.argv) > 1:
-            input_dir = sys.argv[1]
-        
-        results = process_directory(input_dir)
-        print_results(results)
-        
-    except Exception as e:
-        print(f"{Fore.RED}Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        sys.exit(1)
-
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_day(__file__)
@@ -0,0 +1,8 @@
+"""
+Shared tooling for the Advent of Code solutions in this repository.
+
+Every day under YEAR/DD/advent_YEAR_DD.py exposes part1(content) and
+part2(content). The modules in this package discover those entry points and
+take care of everything around them: reading the input files, validating the
+answers against the TEST_SOLUTIONS of each day and reporting the results.
+"""
@@ -0,0 +1,212 @@
+#!/usr/bin/python3
+
+"""
+Batch mode: one day solved on many inputs.
+
+The inputs come from a directory (every file below it) or a tar archive
+(.tar, .tar.gz, ...), and are parsed and solved on a process pool. Each
+worker imports the day once when it starts and keeps it for every input it
+is handed, so compiled regexes, module level tables and memo caches (such
+as 2024/21's movement_cache) stay warm from one input to the next. A day
+can also define
+
+    warm()      called once per worker before its first input, to build
+                tables every input would otherwise pay for
+
+Inputs are submitted in chunks to keep the pool overhead low. Nothing is
+validated or cached: user inputs have no known answers. Each input's
+latency is the time its worker spent reading, parsing and solving it; the
+report gives their percentiles, and the throughput over the wall time of
+the whole batch, in batch.json.
+"""
+
+import os
+import sys
+import json
+import time
+import tarfile
+import platform
+import statistics
+from colorama import Fore
+
+from aoc import bench, progress, runner
+from aoc.output import QUIET, set_verbosity
+
+WARM = "warm"
+DEFAULT_OUTPUT = "batch.json"
+PERCENTILES = (50, 90, 99)
+
+# Inputs handed to a worker at once, at most
+MAX_CHUNK = 64
+
+# Day and limits of the batch, set in each worker by start_worker
+_worker = {}
+
+
+def iter_inputs(source):
+    """
+    (name, path, text) of every input of a directory or tar archive, in
+    name order. Directory inputs are read by the workers (text is None),
+    archive members are read here (path is None).
+    """
+    if os.path.isdir(source):
+        for directory, subdirs, filenames in os.walk(source):
+            subdirs[:] = sorted(name for name in subdirs if not name.startswith('.'))
+            for filename in sorted(filenames):
+                if not filename.startswith('.'):
+                    path = os.path.join(directory, filename)
+                    yield os.path.relpath(path, source), path, None
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source, "r:*") as archive:
+            members = sorted((member for member in archive if member.isfile()),
+                             key=lambda member: member.name)
+            for member in members:
+                text = archive.extractfile(member).read().decode()
+                yield member.name, None, text
+    else:
+        raise FileNotFoundError(f"{source} is neither a directory nor a tar archive.")
+
+
+def start_worker(day_path, limits):
+    """
+    Pool initializer: import the day and warm it up once per worker
+    """
+    _worker["day_path"] = day_path
+    _worker["limits"] = limits
+    module = runner.load_day(day_path)
+    if hasattr(module, WARM):
+        with bench.silenced():
+            getattr(module, WARM)()
+
+
+def solve_input(item):
+    """
+    Parse and solve one input in a warm worker.
+    Returns its record: values, per part seconds and work counters, latency
+    and any error.
+    """
+    name, path, text = item
+    module = runner.load_day(_worker["day_path"])
+    record = {"input": name, "worker": os.getpid(), "ok": True, "values": {}, "seconds": {}}
+
+    start_ns = time.perf_counter_ns()
+    try:
+        with bench.silenced():
+            content = runner.read_input(module, path) if path else text
+            data, record["parse_seconds"] = runner.parse_content(module, content)
+            for part_name, _ in runner.get_parts(module):
+                result = runner.run_part(module, part_name, data, name, limits=_worker["limits"])
+                record["values"][part_name] = result.get("value")
+                record["seconds"][part_name] = result["execution_time"]
+                if "counters" in result:
+                    record.setdefault("counters", {})[part_name] = result["counters"]
+                if "timeout" in result:
+                    record["ok"] = False
+                    record["error"] = f"{part_name}: {result['timeout']}"
+                    break
+    except Exception as e:
+        record["ok"] = False
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["latency_ns"] = time.perf_counter_ns() - start_ns
+    return record
+
+
+def run_batch(day_path, items, workers=None, limits=None):
+    """
+    Solve every (name, path, text) item with the given day.
+    Returns the records in item order and the wall time in ns.
+    """
+    workers = workers or os.cpu_count() or 1
+    start_ns = time.perf_counter_ns()
+    with progress.bar(total=len(items), desc=runner.day_label(day_path), unit="inputs",
+                      level=QUIET) as bar:
+        if workers == 1:
+            start_worker(day_path, limits)
+            records = []
+            for item in items:
+                records.append(solve_input(item))
+                bar.update()
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            chunksize = max(1, min(MAX_CHUNK, len(items) // (workers * 4)))
+            with ProcessPoolExecutor(max_workers=workers, initializer=start_worker,
+                                     initargs=(day_path, limits)) as pool:
+                records = []
+                for record in pool.map(solve_input, items, chunksize=chunksize):
+                    records.append(record)
+                    bar.update()
+    return records, time.perf_counter_ns() - start_ns
+
+
+def summarize(records, wall_ns, workers):
+    """
+    Throughput and latency percentiles of a batch
+    """
+    latencies = [record["latency_ns"] for record in records]
+    summary = {
+        "inputs": len(records),
+        "failed": sum(not record["ok"] for record in records),
+        "workers": workers,
+        "wall_ns": wall_ns,
+        "inputs_per_second": len(records) / (wall_ns / 1e9) if wall_ns else None,
+    }
+    if latencies:
+        summary["latency_ns"] = {
+            "min": min(latencies),
+            "mean": int(statistics.fmean(latencies)),
+            **{f"p{pct}": bench.percentile(latencies, pct) for pct in PERCENTILES},
+            "max": max(latencies),
+        }
+    return summary
+
+
+def print_summary(label, summary, records):
+    """
+    Throughput, latency percentiles and the failed inputs
+    """
+    print(f"\n{Fore.MAGENTA}{label}  {Fore.CYAN}{summary['inputs']} input(s) on "
+          f"{summary['workers']} worker(s) in {bench.format_ns(summary['wall_ns'])}: "
+          f"{Fore.GREEN}{summary['inputs_per_second']:,.1f} inputs/s")
+    if "latency_ns" in summary:
+        latency = summary["latency_ns"]
+        print(f"  {Fore.YELLOW}latency  " + '  '.join(
+            f"{Fore.CYAN}{name} {Fore.WHITE}{bench.format_ns(latency[name])}"
+            for name in ("min", *(f"p{pct}" for pct in PERCENTILES), "max")))
+    for record in records:
+        if not record["ok"]:
+            print(f"  {Fore.RED}{record['input']}: {record['error']}")
+
+
+def main(day_path, source, workers=None, limits=None, output=DEFAULT_OUTPUT):
+    """
+    Solve every input of source with one day, print the throughput summary
+    and write the JSON report. Returns True if every input was solved.
+    """
+    # Set before the pool starts so the workers inherit it: the solvers'
+    # own logs and bars stay off
+    set_verbosity(QUIET)
+    items = list(iter_inputs(source))
+    label = runner.day_label(day_path)
+    workers = workers or os.cpu_count() or 1
+    print(f"{Fore.CYAN}Batch {label}: {Fore.YELLOW}{len(items)} input(s) from {source}")
+
+    records, wall_ns = run_batch(day_path, items, workers, limits)
+    summary = summarize(records, wall_ns, workers)
+    print_summary(label, summary, records)
+
+    with open(output, 'w') as file:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "day": label,
+            "source": os.path.abspath(source),
+            "summary": summary,
+            "records": records,
+        }, file, indent=2, default=str)
+    print(f"\n{Fore.GREEN}Batch report written to {output}")
+    return summary["failed"] == 0
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(runner.discover_days(sys.argv[1:2])[0], sys.argv[2]) else 1)
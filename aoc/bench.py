@@ -0,0 +1,282 @@
+#!/usr/bin/python3
+
+"""
+Statistical benchmarks for the daily solutions.
+
+Every part of every input file is run a few times to warm up (imports,
+caches, branch predictors) and then N more times, each one timed with
+time.perf_counter_ns. The samples are reduced to min/median/p95/stdev and
+written as flat JSON records, one per (day, input file, part). Days with a
+parse stage get an extra "parse" record and their parts are timed on the
+parsed model.
+
+Each day is also loaded once in a fresh interpreter with -X importtime, so
+the report shows how much of a cold start goes to imports and which
+packages are responsible.
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import platform
+import statistics
+import contextlib
+import subprocess
+from colorama import Fore
+
+from aoc import counters, progress, runner
+from aoc.output import QUIET, set_verbosity
+
+DEFAULT_REPEAT = 10
+DEFAULT_WARMUP = 2
+DEFAULT_OUTPUT = "benchmark.json"
+IMPORT_REPORT_TOP = 5
+
+# "import time: self [us] | cumulative | imported package" lines of -X importtime
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+@contextlib.contextmanager
+def silenced():
+    """
+    Discard everything the solvers print while they are being timed
+    """
+    with open(os.devnull, 'w') as devnull:
+        with contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            yield
+
+
+def percentile(samples, pct):
+    """
+    Nearest-rank percentile of a list of samples
+    """
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples_ns):
+    """
+    Reduce a list of timings in nanoseconds to the reported statistics
+    """
+    return {
+        "runs": len(samples_ns),
+        "min_ns": min(samples_ns),
+        "median_ns": int(statistics.median(samples_ns)),
+        "p95_ns": percentile(samples_ns, 95),
+        "stdev_ns": int(statistics.stdev(samples_ns)) if len(samples_ns) > 1 else 0,
+    }
+
+
+def benchmark_part(module, part_name, content, filepath, repeat, warmup):
+    """
+    Time one part of a day: warmup runs first, then repeat timed runs
+    """
+    if hasattr(module, "CURRENT_FILEPATH"):
+        module.CURRENT_FILEPATH = filepath
+    part = getattr(module, part_name)
+
+    with silenced():
+        for _ in range(warmup):
+            part(content)
+
+        samples_ns = []
+        for _ in range(repeat):
+            counters.reset()
+            start_ns = time.perf_counter_ns()
+            result = part(content)
+            samples_ns.append(time.perf_counter_ns() - start_ns)
+
+    stats = summarize(samples_ns)
+    if part_name == runner.PARSE:
+        # The parsed model is not an answer, keep it out of the report
+        stats["value"] = None
+    else:
+        stats["value"] = result["value"] if isinstance(result, dict) else result
+    stats["peak_rss_bytes"] = runner.peak_rss_bytes()
+    # Work done by one run, the same for every run of a deterministic part
+    stats["counters"] = counters.totals()
+    stats["samples_ns"] = samples_ns
+    return stats
+
+
+def benchmark_file(day_path, filepath, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP):
+    """
+    Benchmark every part of a day on one input file.
+    Returns (success, {part_name: stats}) or (False, error message).
+    """
+    try:
+        module = runner.load_day(day_path)
+        content = runner.read_input(module, filepath)
+
+        results = {}
+        data = content
+        if hasattr(module, runner.PARSE):
+            results[runner.PARSE] = benchmark_part(module, runner.PARSE, content, filepath, repeat, warmup)
+            data, _ = runner.parse_content(module, content)
+
+        for part_name, _ in runner.get_parts(module):
+            results[part_name] = benchmark_part(module, part_name, data, filepath, repeat, warmup)
+        return True, results
+
+    except Exception as e:
+        return False, str(e)
+
+
+def run_benchmarks(day_paths, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP, workers=1):
+    """
+    Benchmark every input file of every day.
+    Runs serially by default so concurrent jobs do not skew the timings.
+    """
+    jobs = runner.collect_jobs(day_paths)
+    return runner.run_jobs(jobs, benchmark_file, args=(repeat, warmup), workers=workers)
+
+
+def import_profile(day_path, top=IMPORT_REPORT_TOP):
+    """
+    Load a day in a fresh interpreter with -X importtime.
+    Returns the wall time from interpreter start until the day is loaded, the
+    time spent importing, and the top-level packages that took the longest.
+    """
+    code = (f"import sys; sys.path.insert(0, {runner.REPO_ROOT!r}); "
+            f"from aoc.runner import load_day; load_day({os.path.abspath(day_path)!r})")
+    start_ns = time.perf_counter_ns()
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                               capture_output=True, text=True,
+                               env=dict(os.environ, AOC_VERBOSITY="0"))
+    startup_ns = time.perf_counter_ns() - start_ns
+
+    packages = {}
+    for line in completed.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            package = match.group(4).split('.')[0]
+            packages[package] = packages.get(package, 0) + int(match.group(1)) * 1000
+
+    heaviest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return {
+        "startup_ns": startup_ns,
+        "import_ns": sum(packages.values()),
+        "packages": [{"package": name, "import_ns": ns} for name, ns in heaviest],
+        "error": completed.stderr.strip().splitlines()[-1] if completed.returncode else None,
+    }
+
+
+def profile_imports(day_paths):
+    """
+    Import profile of every day, keyed by day label
+    """
+    return {runner.day_label(path): import_profile(path) for path in day_paths}
+
+
+def to_records(results):
+    """
+    Flatten benchmark results into one record per (day, input, part)
+    """
+    records = []
+    for label, day_results in results.items():
+        year, day = label.split('/')
+        for filename, (success, result) in day_results.items():
+            if not success:
+                records.append({"year": year, "day": day, "input": filename,
+                                "part": None, "error": result})
+                continue
+            for part_name, stats in result.items():
+                record = {"year": year, "day": day, "input": filename, "part": part_name}
+                record.update(stats)
+                records.append(record)
+    return records
+
+
+def write_report(results, output, repeat, warmup, imports=None):
+    """
+    Write the benchmark records, import profiles and run metadata to a JSON file
+    """
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "records": to_records(results),
+        "imports": imports or {},
+    }
+    with open(output, 'w') as file:
+        json.dump(report, file, indent=2, default=str)
+    return report
+
+
+def format_ns(value_ns):
+    """
+    Human friendly duration
+    """
+    if value_ns >= 1e9:
+        return f"{value_ns / 1e9:.3f}s"
+    if value_ns >= 1e6:
+        return f"{value_ns / 1e6:.3f}ms"
+    return f"{value_ns / 1e3:.1f}µs"
+
+
+def print_benchmarks(results):
+    """
+    Print a min/median/p95/stdev table per day, input file and part
+    """
+    print(f"\n{Fore.CYAN}{'='*80}")
+    print(f"{Fore.CYAN}Benchmark Results")
+    print(f"{Fore.CYAN}{'='*80}")
+
+    for label, day_results in results.items():
+        print(f"\n{Fore.MAGENTA}{label}")
+        for filename, (success, result) in day_results.items():
+            if not success:
+                print(f"  {Fore.BLUE}{filename}: {Fore.RED}Error - {result}")
+                continue
+            for part_name, stats in result.items():
+                print(f"  {Fore.BLUE}{filename:<15} {Fore.YELLOW}{part_name}  "
+                      f"{Fore.CYAN}min {format_ns(stats['min_ns']):>10}  "
+                      f"median {format_ns(stats['median_ns']):>10}  "
+                      f"p95 {format_ns(stats['p95_ns']):>10}  "
+                      f"stdev {format_ns(stats['stdev_ns']):>10}")
+
+
+def print_imports(imports):
+    """
+    Print the cold start time of every day and its heaviest imports
+    """
+    print(f"\n{Fore.CYAN}{'='*80}")
+    print(f"{Fore.CYAN}Startup and Import Times")
+    print(f"{Fore.CYAN}{'='*80}")
+
+    for label, profile in imports.items():
+        if profile["error"]:
+            print(f"  {Fore.MAGENTA}{label}  {Fore.RED}Error - {profile['error']}")
+            continue
+        heaviest = ', '.join(f"{entry['package']} {format_ns(entry['import_ns'])}"
+                             for entry in profile["packages"])
+        print(f"  {Fore.MAGENTA}{label}  {Fore.CYAN}startup {format_ns(profile['startup_ns']):>10}  "
+              f"imports {format_ns(profile['import_ns']):>10}  {Fore.WHITE}{heaviest}")
+
+
+def main(day_paths, repeat=DEFAULT_REPEAT, warmup=DEFAULT_WARMUP, output=DEFAULT_OUTPUT, workers=1):
+    """
+    Benchmark the given days, print the summary and write the JSON report
+    """
+    # Solver messages are dropped at the source instead of timed into devnull
+    set_verbosity(QUIET)
+    progress.disable()
+    print(f"{Fore.CYAN}Benchmarking {len(day_paths)} day(s): "
+          f"{Fore.YELLOW}{warmup} warmup + {repeat} timed run(s) per part")
+    results = run_benchmarks(day_paths, repeat, warmup, workers)
+    imports = profile_imports(day_paths)
+    print_benchmarks(results)
+    print_imports(imports)
+    write_report(results, output, repeat, warmup, imports)
+    print(f"\n{Fore.GREEN}Benchmark report written to {output}")
+    return results
+
+
+if __name__ == "__main__":
+    main(runner.discover_days(sys.argv[1:]))
@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+
+"""
+Per-part time and work budgets.
+
+The runner opens a budget around every part call. Long searches call
+checkpoint() once per node they expand, optionally with progress counters:
+
+    from aoc import budget
+    ...
+    budget.checkpoint(paths=count, depth=depth)
+
+checkpoint() counts the expansions, keeps the latest counters and raises
+BudgetExceeded once the node or time budget is spent, which unwinds the
+search and lets the runner report TIMEOUT with the counters it has. Time is
+only read every CLOCK_EVERY checkpoints so the call stays cheap.
+
+Parts that never call checkpoint() are still stopped on time: on platforms
+with SIGALRM the runner also arms a timer that raises BudgetExceeded between
+two bytecodes of whatever the main thread is running.
+"""
+
+import time
+import signal
+import threading
+import contextlib
+
+# Checkpoints between two reads of the clock
+CLOCK_EVERY = 1024
+
+_deadline = None
+_node_limit = None
+_nodes = 0
+_until_clock = CLOCK_EVERY
+_started = 0.0
+_progress = {}
+
+
+class BudgetExceeded(BaseException):
+    """
+    Raised inside a part when its budget is spent. Like KeyboardInterrupt it
+    is not an Exception, so a solver's own `except Exception` fallbacks let
+    it through to the runner.
+    """
+
+    def __init__(self, reason, progress):
+        super().__init__(reason)
+        self.reason = reason
+        self.progress = progress
+
+
+def progress():
+    """
+    Counters of the running part: nodes expanded, seconds elapsed and the
+    latest values passed to checkpoint()
+    """
+    counters = {"nodes": _nodes, "elapsed": round(time.perf_counter() - _started, 3)}
+    counters.update(_progress)
+    return counters
+
+
+def _exceeded(reason):
+    return BudgetExceeded(reason, progress())
+
+
+def checkpoint(nodes=1, **counters):
+    """
+    Count node expansions and record progress counters. Raises
+    BudgetExceeded when the part is over its node or time budget.
+    """
+    global _nodes, _until_clock
+    _nodes += nodes
+    if counters:
+        _progress.update(counters)
+
+    if _node_limit is not None and _nodes > _node_limit:
+        raise _exceeded(f"node budget of {_node_limit:,} exceeded")
+
+    _until_clock -= nodes
+    if _until_clock <= 0:
+        _until_clock = CLOCK_EVERY
+        if _deadline is not None and time.perf_counter() > _deadline:
+            raise _exceeded(f"time budget of {_deadline - _started:g}s exceeded")
+
+
+def _on_alarm(signum, frame):
+    raise _exceeded(f"time budget of {_deadline - _started:g}s exceeded")
+
+
+def _can_use_alarm():
+    return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+
+@contextlib.contextmanager
+def limit(seconds=None, nodes=None):
+    """
+    Run the body under a budget of seconds and/or node expansions.
+    Without limits checkpoint() only counts.
+    """
+    global _deadline, _node_limit, _nodes, _until_clock, _started
+    _started = time.perf_counter()
+    _deadline = _started + seconds if seconds else None
+    _node_limit = nodes
+    _nodes = 0
+    _until_clock = CLOCK_EVERY
+    _progress.clear()
+
+    alarm = bool(seconds) and _can_use_alarm()
+    if alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+        _deadline = None
+        _node_limit = None
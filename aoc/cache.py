@@ -0,0 +1,143 @@
+#!/usr/bin/python3
+
+"""
+Content-addressed on-disk cache.
+
+Entries are pickled objects stored as <key>.pickle in a cache directory.
+Keys are SHA-256 digests of everything the cached object depends on, here
+the input text, the solver source and the part name, so a changed input or
+solver simply misses and stale entries are never read back.
+
+The directory is bounded in size: every hit refreshes the entry's mtime and
+when a store pushes the total over the limit the least recently used
+entries are deleted first.
+"""
+
+import os
+import pickle
+import hashlib
+
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".aoc_cache")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+ENTRY_SUFFIX = ".pickle"
+
+# Solver source digests already computed in this process, keyed by path
+_SOURCE_DIGESTS = {}
+
+
+def source_digest(path):
+    """
+    SHA-256 of a source file, computed once per process
+    """
+    path = os.path.abspath(path)
+    if path not in _SOURCE_DIGESTS:
+        with open(path, 'rb') as file:
+            _SOURCE_DIGESTS[path] = hashlib.sha256(file.read()).hexdigest()
+    return _SOURCE_DIGESTS[path]
+
+
+def make_key(*parts):
+    """
+    Cache key for a sequence of str/bytes parts
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode()
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+def result_key(content, day_path, part_name):
+    """
+    Key of one part's result: input text, solver source and part name
+    """
+    return make_key(content, source_digest(day_path), part_name)
+
+
+def entry_path(key, cache_dir=DEFAULT_DIR):
+    """
+    File that holds a cache entry
+    """
+    return os.path.join(cache_dir, key + ENTRY_SUFFIX)
+
+
+def load(key, cache_dir=DEFAULT_DIR):
+    """
+    Return the cached object for a key, or None on a miss.
+    A hit marks the entry as recently used.
+    """
+    path = entry_path(key, cache_dir)
+    try:
+        with open(path, 'rb') as file:
+            value = pickle.load(file)
+        os.utime(path)
+        return value
+    except FileNotFoundError:
+        return None
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # Unreadable or truncated entry: treat as a miss, it will be rewritten
+        return None
+
+
+def store(key, value, cache_dir=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Save an object under a key, then evict old entries if the cache is too big
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    path = entry_path(key, cache_dir)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, 'wb') as file:
+        pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+    # Atomic so concurrent workers never read half-written entries
+    os.replace(temporary, path)
+    evict(cache_dir, max_bytes)
+
+
+def list_entries(cache_dir=DEFAULT_DIR):
+    """
+    (last access, size, path) of every entry, least recently used first
+    """
+    if not os.path.isdir(cache_dir):
+        return []
+
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith(ENTRY_SUFFIX):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return sorted(entries)
+
+
+def evict(cache_dir=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Delete least recently used entries until the cache fits in max_bytes.
+    Returns the number of entries removed.
+    """
+    entries = list_entries(cache_dir)
+    total = sum(size for _, size, _ in entries)
+
+    removed = 0
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            removed += 1
+        except FileNotFoundError:
+            pass
+        total -= size
+    return removed
+
+
+def clear(cache_dir=DEFAULT_DIR):
+    """
+    Delete every entry. Returns the number of entries removed.
+    """
+    return evict(cache_dir, max_bytes=-1)
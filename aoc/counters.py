@@ -0,0 +1,62 @@
+#!/usr/bin/python3
+
+"""
+Work counters for the solvers' hot paths.
+
+Wall time moves with the machine; the amount of work an algorithm does does
+not. Solvers report it under a name of their choosing:
+
+    from aoc import counters
+    ...
+    counters.add("states_popped", popped)
+
+Totals are summed per name from the start of every part call. The runner
+puts them in the part's result dict under "counters" (next to
+execution_time) and the benchmarks in their records. Inner loops should
+count in a local int and add it once per call or per outer iteration, so
+the loop itself pays a single integer increment.
+
+With AOC_COUNTERS=0 in the environment add() is a function that does
+nothing and result dicts carry no counters.
+"""
+
+import os
+
+ENABLED = os.environ.get("AOC_COUNTERS", "1") != "0"
+
+_totals = {}
+
+
+if ENABLED:
+    def add(name, n=1):
+        """
+        Count n more units of work under name
+        """
+        _totals[name] = _totals.get(name, 0) + n
+else:
+    def add(name, n=1):
+        """
+        Counting is off: nothing to do
+        """
+
+
+def reset():
+    """
+    Start counting from zero, before a part runs
+    """
+    _totals.clear()
+
+
+def totals():
+    """
+    Counts added since the last reset, by name
+    """
+    return dict(_totals)
+
+
+def format_counters(counts):
+    """
+    "name=value" pairs for the report lines
+    """
+    return ', '.join(f"{name}={value:,}" if isinstance(value, int) else f"{name}={value}"
+                     for name, value in counts.items())
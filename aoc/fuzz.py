@@ -0,0 +1,221 @@
+#!/usr/bin/python3
+
+"""
+Differential fuzzing of the optimized parts against reference implementations.
+
+A day that keeps a straightforward implementation of a part next to its
+optimized one lists it in the script:
+
+    REFERENCES = {"part1": part1_reference}
+
+where the reference takes the same (parsed) input as the part and returns
+a result dict or a bare value. Its generator.py (see aoc.scaling) provides
+the random inputs, plus two optional names for fuzzing:
+
+    FUZZ_SIZES            small sizes, so slow references stay quick
+    fuzz(size, rng)       inputs for fuzzing, when they should reach cases
+                          generate() avoids (generate() otherwise)
+
+Run i of a day draws its input from random.Random(seed + i) at size
+FUZZ_SIZES[i % len(FUZZ_SIZES)] and feeds it to both implementations of
+every listed part. The first run where the answers differ, or where the
+part fails and its reference does not, stops that part: its input is then
+shrunk by removing records (blank-line separated blocks, or lines) as long
+as the mismatch remains, and reported with the seed that reproduces it.
+"""
+
+import sys
+import json
+import time
+import random
+import platform
+from colorama import Fore
+
+from aoc import budget, progress, runner, scaling
+from aoc.output import QUIET, set_verbosity
+
+REFERENCES = "REFERENCES"
+DEFAULT_RUNS = 200
+DEFAULT_SIZES = (1, 2, 4, 8)
+DEFAULT_BUDGET = 10.0
+DEFAULT_OUTPUT = "fuzz.json"
+
+
+def value_of(result):
+    """
+    The answer of a part or reference call
+    """
+    return result.get("value") if isinstance(result, dict) else result
+
+
+def call(module, func, content, seconds):
+    """
+    Parse content and run func on it under the time budget.
+    Returns ("ok", value), ("error", message) or ("timeout", None).
+    """
+    if hasattr(module, "CURRENT_FILEPATH"):
+        module.CURRENT_FILEPATH = "fuzz.txt"
+    try:
+        with budget.limit(seconds):
+            data = getattr(module, runner.PARSE)(content) if hasattr(module, runner.PARSE) else content
+            return "ok", value_of(func(data))
+    except budget.BudgetExceeded:
+        return "timeout", None
+    except Exception as e:
+        return "error", f"{type(e).__name__}: {e}"
+
+
+def check(module, part_name, reference, content, seconds):
+    """
+    Run a part and its reference on one input.
+    Returns (mismatch, part outcome, reference outcome): a mismatch is a
+    different answer, or a part that fails where the reference does not.
+    """
+    expected = call(module, reference, content, seconds)
+    actual = call(module, getattr(module, part_name), content, seconds)
+    if expected[0] != "ok" or actual[0] == "timeout":
+        return False, actual, expected
+    return actual != expected, actual, expected
+
+
+def split_records(content):
+    """
+    Records the minimizer removes: blank-line separated blocks if the input
+    has any, lines otherwise. Returns (records, separator).
+    """
+    text = content.strip('\n')
+    if '\n\n' in text:
+        return text.split('\n\n'), '\n\n'
+    return text.split('\n'), '\n'
+
+
+def minimize(records, fails):
+    """
+    Delta debugging: drop chunks of records, halving the chunk size whenever
+    no chunk can go, while fails(records) stays true
+    """
+    chunks = 2
+    while len(records) > 1:
+        size = -(-len(records) // chunks)
+        for start in range(0, len(records), size):
+            remaining = records[:start] + records[start + size:]
+            if remaining and fails(remaining):
+                records = remaining
+                chunks = max(chunks - 1, 2)
+                break
+        else:
+            if chunks >= len(records):
+                break
+            chunks = min(chunks * 2, len(records))
+    return records
+
+
+def fuzz_part(module, generator, part_name, reference, runs, seed, seconds):
+    """
+    Fuzz one part against its reference.
+    Returns {"runs": completed runs, "skipped": runs where the reference
+    failed or either side timed out, "mismatch": None or its details}.
+    """
+    sizes = getattr(generator, "FUZZ_SIZES", DEFAULT_SIZES)
+    make_input = getattr(generator, "fuzz", generator.generate)
+    skipped = 0
+
+    desc = f"{runner.day_label(module.__file__)} {part_name}"
+    with progress.bar(total=runs, desc=desc, unit="runs", level=QUIET) as bar:
+        for run in range(runs):
+            size = sizes[run % len(sizes)]
+            content = make_input(size, random.Random(seed + run))
+            mismatch, actual, expected = check(module, part_name, reference, content, seconds)
+            bar.update()
+            if expected[0] != "ok" or actual[0] == "timeout":
+                skipped += 1
+            if not mismatch:
+                continue
+
+            records, separator = split_records(content)
+            records = minimize(records, lambda candidate: check(
+                module, part_name, reference, separator.join(candidate) + '\n', seconds)[0])
+            minimized = separator.join(records) + '\n'
+            _, actual, expected = check(module, part_name, reference, minimized, seconds)
+            return {"runs": run + 1, "skipped": skipped, "mismatch": {
+                "seed": seed + run, "size": size, "input": content, "minimized": minimized,
+                "value": actual[1], "expected": expected[1],
+            }}
+    return {"runs": runs, "skipped": skipped, "mismatch": None}
+
+
+def fuzz_day(day_path, runs=DEFAULT_RUNS, seed=scaling.DEFAULT_SEED, seconds=DEFAULT_BUDGET):
+    """
+    Fuzz every part a day has a reference for.
+    Returns {part_name: report}, or None if the day has no references or
+    no generator.
+    """
+    generator = scaling.load_generator(day_path)
+    if generator is None:
+        return None
+    module = runner.load_day(day_path)
+    references = getattr(module, REFERENCES, None)
+    if not references:
+        return None
+    return {part_name: fuzz_part(module, generator, part_name, reference, runs, seed, seconds)
+            for part_name, reference in references.items()}
+
+
+def print_report(label, report):
+    """
+    One line per fuzzed part, with the minimized input of a mismatch
+    """
+    for part_name, result in report.items():
+        mismatch = result["mismatch"]
+        skipped = f"{Fore.LIGHTBLACK_EX}, {result['skipped']} skipped" if result["skipped"] else ""
+        if mismatch is None:
+            print(f"  {Fore.MAGENTA}{label} {Fore.YELLOW}{part_name}  "
+                  f"{Fore.GREEN}{result['runs']} run(s), no mismatch{skipped}")
+            continue
+        print(f"  {Fore.MAGENTA}{label} {Fore.YELLOW}{part_name}  {Fore.RED}MISMATCH "
+              f"on run {result['runs']} (seed {mismatch['seed']}, size {mismatch['size']}): "
+              f"{mismatch['value']!r}, reference {mismatch['expected']!r}")
+        print(f"{Fore.LIGHTBLACK_EX}    minimized input:")
+        for line in mismatch["minimized"].rstrip('\n').split('\n'):
+            print(f"      {line}")
+
+
+def main(day_paths, runs=DEFAULT_RUNS, seed=scaling.DEFAULT_SEED, seconds=DEFAULT_BUDGET,
+         output=DEFAULT_OUTPUT):
+    """
+    Fuzz every day that has references and a generator, print the results
+    and write the JSON report. Returns True if no part disagreed with its
+    reference.
+    """
+    set_verbosity(QUIET)
+    print(f"{Fore.CYAN}Fuzzing {len(day_paths)} day(s): "
+          f"{Fore.YELLOW}{runs} run(s) per part from seed {seed}, {seconds:g}s budget per call")
+
+    reports = {}
+    for day_path in day_paths:
+        label = runner.day_label(day_path)
+        report = fuzz_day(day_path, runs, seed, seconds)
+        if report is None:
+            continue
+        reports[label] = report
+        print_report(label, report)
+
+    if not reports:
+        print(f"{Fore.LIGHTBLACK_EX}No day with {REFERENCES} and a {scaling.GENERATOR_FILE}")
+
+    with open(output, 'w') as file:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "runs": runs,
+            "budget_seconds": seconds,
+            "days": reports,
+        }, file, indent=2, default=str)
+    print(f"\n{Fore.GREEN}Fuzz report written to {output}")
+    return all(result["mismatch"] is None for report in reports.values() for result in report.values())
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main(runner.discover_days(sys.argv[1:])) else 1)
@@ -0,0 +1,221 @@
+#!/usr/bin/python3
+
+"""
+Historical timing database.
+
+Every regular or benchmark run appends its per-day, per-part, per-input
+timings and peak memory to a local SQLite file. Rows are keyed by the git
+commit of the tree and a hash of the solver source, so a later compare can
+tell whether a part got slower and which change caused it.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import platform
+import subprocess
+from colorama import Fore
+
+from aoc import runner
+
+DEFAULT_DB = os.path.join(runner.REPO_ROOT, ".aoc_history.sqlite")
+DEFAULT_THRESHOLD = 10.0  # percent
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created TEXT NOT NULL,
+    git_commit TEXT,
+    mode TEXT NOT NULL,
+    python TEXT,
+    host TEXT
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    year TEXT NOT NULL,
+    day TEXT NOT NULL,
+    input TEXT NOT NULL,
+    part TEXT NOT NULL,
+    source_hash TEXT NOT NULL,
+    status TEXT,
+    runs INTEGER NOT NULL,
+    min_ns INTEGER NOT NULL,
+    median_ns INTEGER NOT NULL,
+    p95_ns INTEGER NOT NULL,
+    stdev_ns INTEGER NOT NULL,
+    peak_rss_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS timings_key ON timings(year, day, input, part, run_id);
+"""
+
+
+def connect(db_path=DEFAULT_DB):
+    """
+    Open the history database, creating the tables on first use
+    """
+    connection = sqlite3.connect(db_path)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def git_commit(root=runner.REPO_ROOT):
+    """
+    Current commit of the tree, suffixed with -dirty when there are local changes
+    """
+    try:
+        output = subprocess.run(
+            ["git", "describe", "--always", "--dirty", "--abbrev=12"],
+            cwd=root, capture_output=True, text=True, check=True)
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def source_hash(day_path):
+    """
+    SHA-256 of a solver's source file
+    """
+    with open(day_path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def to_rows(results, day_paths):
+    """
+    Turn runner or benchmark results into timing rows.
+    Regular runs only have one sample, reported as min, median and p95 alike.
+    Cached and timed out results are skipped.
+    """
+    hashes = {runner.day_label(path): source_hash(path) for path in day_paths}
+
+    rows = []
+    for label, day_results in results.items():
+        year, day = label.split('/')
+        for filename, (success, result) in day_results.items():
+            if not success:
+                continue
+            for part_name, part_result in result.items():
+                if part_result.get("cached"):
+                    # Not a new measurement, the original run is already recorded
+                    continue
+                if "timeout" in part_result:
+                    # Only says how long the budget was
+                    continue
+                if "median_ns" in part_result:
+                    timing = (part_result["runs"], part_result["min_ns"], part_result["median_ns"],
+                              part_result["p95_ns"], part_result["stdev_ns"])
+                else:
+                    elapsed_ns = int(part_result["execution_time"] * 1e9)
+                    timing = (1, elapsed_ns, elapsed_ns, elapsed_ns, 0)
+
+                rows.append((year, day, filename, part_name, hashes[label],
+                             part_result.get("status")) + timing +
+                            (part_result.get("peak_rss_bytes"),))
+    return rows
+
+
+def record_run(results, day_paths, mode, db_path=DEFAULT_DB):
+    """
+    Append one run and all its timings to the database. Returns the run id.
+    """
+    connection = connect(db_path)
+    with connection:
+        cursor = connection.execute(
+            "INSERT INTO runs (created, git_commit, mode, python, host) VALUES (?, ?, ?, ?, ?)",
+            (time.strftime("%Y-%m-%dT%H:%M:%S"), git_commit(), mode,
+             platform.python_version(), platform.node()))
+        run_id = cursor.lastrowid
+        connection.executemany(
+            "INSERT INTO timings (run_id, year, day, input, part, source_hash, status, "
+            "runs, min_ns, median_ns, p95_ns, stdev_ns, peak_rss_bytes) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(run_id,) + row for row in to_rows(results, day_paths)])
+    connection.close()
+    return run_id
+
+
+def latest_timings(connection, mode, commit=None):
+    """
+    The most recent timing of every (year, day, input, part) for a mode,
+    optionally restricted to the runs of one commit.
+    Returns {key: (run_id, git_commit, source_hash, median_ns)}.
+    """
+    query = ("SELECT t.year, t.day, t.input, t.part, t.run_id, r.git_commit, "
+             "t.source_hash, t.median_ns "
+             "FROM timings t JOIN runs r ON r.id = t.run_id WHERE r.mode = ?")
+    params = [mode]
+    if commit is not None:
+        query += " AND r.git_commit LIKE ?"
+        params.append(commit + '%')
+    query += " ORDER BY t.run_id"
+
+    timings = {}
+    for year, day, filename, part, run_id, commit_id, hash_, median_ns in connection.execute(query, params):
+        timings[(year, day, filename, part)] = (run_id, commit_id, hash_, median_ns)
+    return timings
+
+
+def previous_timing(connection, mode, key, before_run):
+    """
+    The latest timing of one (year, day, input, part) recorded before a run
+    """
+    return connection.execute(
+        "SELECT t.run_id, r.git_commit, t.source_hash, t.median_ns "
+        "FROM timings t JOIN runs r ON r.id = t.run_id "
+        "WHERE r.mode = ? AND t.year = ? AND t.day = ? AND t.input = ? AND t.part = ? "
+        "AND t.run_id < ? ORDER BY t.run_id DESC LIMIT 1",
+        (mode, *key, before_run)).fetchone()
+
+
+def compare(mode="bench", threshold=DEFAULT_THRESHOLD, baseline_commit=None, db_path=DEFAULT_DB):
+    """
+    Compare the latest timing of every part against its previous baseline.
+    The baseline is the previous run of the same part, or the latest run at
+    baseline_commit when one is given. Returns the list of regressions as
+    (key, baseline_ns, current_ns, change_pct).
+    """
+    connection = connect(db_path)
+    current = latest_timings(connection, mode)
+    if baseline_commit is not None:
+        baseline = latest_timings(connection, mode, commit=baseline_commit)
+
+    regressions = []
+    print(f"\n{Fore.CYAN}{'='*80}")
+    print(f"{Fore.CYAN}Timing comparison ({mode} mode, threshold {threshold:.1f}%)")
+    print(f"{Fore.CYAN}{'='*80}\n")
+
+    for key, (run_id, commit_id, hash_, current_ns) in sorted(current.items()):
+        if baseline_commit is None:
+            previous = previous_timing(connection, mode, key, run_id)
+        else:
+            previous = baseline.get(key)
+        if previous is None or previous[0] == run_id:
+            continue
+
+        _, base_commit, base_hash, baseline_ns = previous
+        change_pct = (current_ns - baseline_ns) / baseline_ns * 100 if baseline_ns else 0.0
+        changed = " (source changed)" if hash_ != base_hash else ""
+
+        if change_pct > threshold:
+            color, label = Fore.RED, "SLOWER"
+            regressions.append((key, baseline_ns, current_ns, change_pct))
+        elif change_pct < -threshold:
+            color, label = Fore.GREEN, "FASTER"
+        else:
+            color, label = Fore.WHITE, "SAME"
+
+        year, day, filename, part = key
+        print(f"  {Fore.YELLOW}{year}/{day} {filename:<15} {part}  "
+              f"{color}{label:<7} {change_pct:+7.1f}%  "
+              f"{Fore.CYAN}{baseline_ns / 1e6:10.3f}ms -> {current_ns / 1e6:10.3f}ms  "
+              f"{Fore.WHITE}{base_commit} -> {commit_id}{changed}")
+
+    connection.close()
+
+    print(f"\n{Fore.CYAN}{'='*80}")
+    if regressions:
+        print(f"{Fore.RED}{len(regressions)} part(s) slower than {threshold:.1f}%")
+    else:
+        print(f"{Fore.GREEN}No regressions above {threshold:.1f}%")
+    print(f"{Fore.CYAN}{'='*80}")
+    return regressions
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+
+"""
+Streaming access to the puzzle inputs.
+
+By default a day receives its whole input as one string. Days whose
+algorithms make a single pass over the input can set STREAM_INPUT = True:
+the runner then hands them an InputFile instead, which never holds the text
+in memory. It can be walked line by line from a buffered reader, mapped into
+memory for byte-level scanning (regular expressions run directly on the
+mapping) and hashed for the result cache without being read into a string.
+
+lines(), buffer() and Records accept either an InputFile or a plain string,
+so the same solver code still works when it is called with the text itself.
+"""
+
+import io
+import os
+import mmap
+import hashlib
+import itertools
+import contextlib
+
+READ_BUFFER = 1024 * 1024
+
+
+class InputFile:
+    """
+    A puzzle input on disk. Only the path is kept: every pass opens its own
+    handle, so the object is cheap to pickle and safe to share between parts.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+
+    def __repr__(self):
+        return f"InputFile({self.path!r})"
+
+    def __len__(self):
+        return os.path.getsize(self.path)
+
+    def __iter__(self):
+        return self.lines()
+
+    def lines(self):
+        """
+        Lines of the file without their line endings, read in constant memory
+        """
+        with open(self.path, 'r', buffering=READ_BUFFER) as file:
+            for line in file:
+                yield line.rstrip('\r\n')
+
+    @contextlib.contextmanager
+    def memory_map(self):
+        """
+        Read-only memory map of the whole file, or b'' when it is empty.
+        Nothing taken from the map may outlive the with block.
+        """
+        with open(self.path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                yield b''
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, "MADV_SEQUENTIAL"):
+                    # Lets the kernel read ahead and drop pages already scanned
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                yield mapped
+
+    def read(self):
+        """
+        The whole file as one string, for code that cannot stream
+        """
+        with open(self.path, 'r') as file:
+            return file.read()
+
+    def digest(self):
+        """
+        SHA-256 of the file contents, hashed straight from the memory map
+        """
+        with self.memory_map() as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+
+def lines(source):
+    """
+    Lines of an InputFile or a string, without line endings
+    """
+    if isinstance(source, InputFile):
+        return source.lines()
+    return (line.rstrip('\r\n') for line in io.StringIO(source))
+
+
+@contextlib.contextmanager
+def buffer(source):
+    """
+    Bytes view of an InputFile (memory mapped) or of a string (encoded)
+    """
+    if isinstance(source, InputFile):
+        with source.memory_map() as mapped:
+            yield mapped
+    else:
+        yield source.encode()
+
+
+class Records:
+    """
+    Re-iterable view of the non-blank lines of an input, each stripped and
+    passed through convert(). Lines for which convert() returns None are
+    left out, and the first skip lines are ignored. Every iteration is a new
+    pass over the input, so no record is kept in memory between passes.
+    """
+
+    def __init__(self, source, convert=str, skip=0):
+        self.source = source
+        self.convert = convert
+        self.skip = skip
+
+    def __iter__(self):
+        for line in itertools.islice(lines(self.source), self.skip, None):
+            line = line.strip()
+            if not line:
+                continue
+            record = self.convert(line)
+            if record is not None:
+                yield record
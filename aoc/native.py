@@ -0,0 +1,266 @@
+#!/usr/bin/python3
+
+"""
+Benchmarks for the native (C++) solutions.
+
+The 2022 days are C++ programs, one per part (day_DDa.cpp, day_DDb.cpp),
+that take an input path as their first argument and print the answer. Each
+program is compiled once with -O2 into the cache directory, under a key made
+of its source hash, the compiler and the flags, so later runs reuse the
+binary until the source changes.
+
+Every binary is then run a few times to warm up (page cache, dynamic
+loader) and N more times against each input of its day, every run timed with
+time.perf_counter_ns around the whole process. The timings therefore include
+process start-up; the report carries the median cost of spawning an empty
+process (spawn_ns) to subtract when comparing with the in-process Python
+timings. Records use the same schema as the Python benchmarks.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import platform
+import subprocess
+from colorama import Fore
+
+from aoc import bench, cache, runner
+
+NATIVE_YEARS = ("2022",)
+DEFAULT_OUTPUT = "native_benchmark.json"
+BINARY_DIR = os.path.join(cache.DEFAULT_DIR, "native")
+
+COMPILERS = ("clang++", "g++")
+FLAGS = ("-O2", "-std=c++20")
+
+SOURCE_PATTERN = re.compile(r"^day_(\d{2})([a-z])\.cpp$")
+INPUT_PATTERN = re.compile(r"^day_\d{2}_.*input.*$")
+
+
+def find_compiler():
+    """
+    $CXX, or the first of COMPILERS on the PATH
+    """
+    candidates = [os.environ["CXX"]] if os.environ.get("CXX") else COMPILERS
+    for candidate in candidates:
+        path = shutil.which(candidate)
+        if path:
+            return path
+    raise FileNotFoundError(f"No C++ compiler found, tried {', '.join(candidates)}.")
+
+
+def compiler_version(compiler):
+    """
+    First line of the compiler's --version, part of the binary cache key
+    """
+    completed = subprocess.run([compiler, "--version"], capture_output=True, text=True)
+    return completed.stdout.splitlines()[0] if completed.stdout else compiler
+
+
+def discover_days(targets=None, root=runner.REPO_ROOT):
+    """
+    Day directories holding C++ solutions. A target can be a year ("2022")
+    or a day ("2022/01"); every day of NATIVE_YEARS by default.
+    """
+    day_dirs = []
+    for target in targets or NATIVE_YEARS:
+        path = os.path.abspath(target if os.path.exists(target) else os.path.join(root, target))
+        if not os.path.isdir(path):
+            raise FileNotFoundError(f"Nothing to run for '{target}'.")
+        candidates = [path] if list_sources(path) else \
+            [os.path.join(path, name) for name in sorted(os.listdir(path))]
+        for candidate in candidates:
+            if candidate not in day_dirs and list_sources(candidate):
+                day_dirs.append(candidate)
+    return day_dirs
+
+
+def list_sources(day_dir):
+    """
+    (part name, source path) of every solution of a day: the a program is
+    part1, the b program part2
+    """
+    if not os.path.isdir(day_dir):
+        return []
+    sources = []
+    for name in sorted(os.listdir(day_dir)):
+        match = SOURCE_PATTERN.match(name)
+        if match:
+            part_name = f"part{ord(match.group(2)) - ord('a') + 1}"
+            sources.append((part_name, os.path.join(day_dir, name)))
+    return sources
+
+
+def list_inputs(day_dir):
+    """
+    Input files of a day, samples first
+    """
+    names = [name for name in os.listdir(day_dir) if INPUT_PATTERN.match(name)]
+    return sorted(names, key=lambda name: ("sample" not in name, name))
+
+
+def day_label(day_dir):
+    """
+    "YEAR/DD" label of a day directory
+    """
+    return '/'.join(os.path.abspath(day_dir).split(os.sep)[-2:])
+
+
+def compile_source(source, compiler, version, binary_dir=BINARY_DIR):
+    """
+    Path of the binary built from a source file, compiling it only when the
+    cache has none for this source, compiler and flags.
+    Returns (binary path, compile time in ns, 0 when cached).
+    """
+    key = cache.make_key(cache.source_digest(source), version, *FLAGS)
+    stem = os.path.splitext(os.path.basename(source))[0]
+    binary = os.path.join(binary_dir, f"{key[:16]}_{stem}")
+    if os.path.exists(binary):
+        return binary, 0
+
+    os.makedirs(binary_dir, exist_ok=True)
+    # Built under a temporary name so an interrupted compile is never reused
+    partial = f"{binary}.{os.getpid()}.partial"
+    start_ns = time.perf_counter_ns()
+    completed = subprocess.run([compiler, *FLAGS, source, "-o", partial],
+                               capture_output=True, text=True)
+    compile_ns = time.perf_counter_ns() - start_ns
+    if completed.returncode:
+        if os.path.exists(partial):
+            os.remove(partial)
+        errors = [line for line in completed.stderr.splitlines() if "error" in line]
+        raise RuntimeError(f"{os.path.basename(source)} does not compile: "
+                           f"{errors[0] if errors else completed.returncode}")
+    os.replace(partial, binary)
+    return binary, compile_ns
+
+
+def run_binary(binary, input_path):
+    """
+    Run a solution once. Returns (answer printed, elapsed ns, peak RSS bytes).
+    The exit status is not checked: some programs return their answer.
+    """
+    start_ns = time.perf_counter_ns()
+    process = subprocess.Popen([binary, input_path], stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, text=True,
+                               cwd=os.path.dirname(input_path))
+    stdout = process.stdout.read()
+    # wait4 reaps the child with its own rusage, not the max over all children.
+    # The kernel still counts the image forked from this interpreter, so the
+    # figure is floored at the parent's size.
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed_ns = time.perf_counter_ns() - start_ns
+    process.returncode = os.waitstatus_to_exitcode(status)
+    process.stdout.close()
+
+    if process.returncode < 0:
+        raise RuntimeError(f"{os.path.basename(binary)} killed by signal {-process.returncode}")
+    lines = stdout.strip().splitlines()
+    return (lines[-1].strip() if lines else None), elapsed_ns, usage.ru_maxrss * 1024
+
+
+def spawn_overhead(repeat=bench.DEFAULT_REPEAT):
+    """
+    Median ns to start and reap a process that does nothing
+    """
+    true = shutil.which("true")
+    if true is None:
+        return None
+    samples_ns = []
+    for _ in range(repeat):
+        start_ns = time.perf_counter_ns()
+        subprocess.run([true])
+        samples_ns.append(time.perf_counter_ns() - start_ns)
+    return bench.summarize(samples_ns)["median_ns"]
+
+
+def benchmark_part(binary, input_path, repeat, warmup):
+    """
+    Time one binary on one input: warmup runs first, then repeat timed runs
+    """
+    for _ in range(warmup):
+        run_binary(binary, input_path)
+
+    samples_ns = []
+    peak_rss = 0
+    for _ in range(repeat):
+        value, elapsed_ns, rss = run_binary(binary, input_path)
+        samples_ns.append(elapsed_ns)
+        peak_rss = max(peak_rss, rss)
+
+    stats = bench.summarize(samples_ns)
+    stats["value"] = value
+    stats["peak_rss_bytes"] = peak_rss
+    stats["samples_ns"] = samples_ns
+    return stats
+
+
+def benchmark_day(day_dir, compiler, version, repeat=bench.DEFAULT_REPEAT,
+                  warmup=bench.DEFAULT_WARMUP, binary_dir=BINARY_DIR):
+    """
+    Benchmark every part of a day on every input.
+    Returns {filename: (success, {part_name: stats}) or (False, error)}.
+    """
+    binaries = {}
+    try:
+        for part_name, source in list_sources(day_dir):
+            binaries[part_name] = compile_source(source, compiler, version, binary_dir)
+    except RuntimeError as e:
+        return {filename: (False, str(e)) for filename in list_inputs(day_dir)}
+
+    results = {}
+    for filename in list_inputs(day_dir):
+        input_path = os.path.join(day_dir, filename)
+        try:
+            parts = {}
+            for part_name, (binary, compile_ns) in binaries.items():
+                parts[part_name] = benchmark_part(binary, input_path, repeat, warmup)
+                parts[part_name]["language"] = "c++"
+                parts[part_name]["compile_ns"] = compile_ns
+            results[filename] = (True, parts)
+        except (OSError, RuntimeError) as e:
+            results[filename] = (False, str(e))
+    return results
+
+
+def main(day_dirs, repeat=bench.DEFAULT_REPEAT, warmup=bench.DEFAULT_WARMUP,
+         output=DEFAULT_OUTPUT, binary_dir=BINARY_DIR):
+    """
+    Compile (once) and benchmark the given native days, print the summary
+    and write the JSON report
+    """
+    compiler = find_compiler()
+    version = compiler_version(compiler)
+    print(f"{Fore.CYAN}Benchmarking {len(day_dirs)} native day(s) with {version}: "
+          f"{Fore.YELLOW}{' '.join(FLAGS)}, {warmup} warmup + {repeat} timed run(s) per part")
+
+    results = {day_label(day_dir): benchmark_day(day_dir, compiler, version, repeat, warmup,
+                                                 binary_dir)
+               for day_dir in day_dirs}
+    spawn_ns = spawn_overhead(repeat)
+    bench.print_benchmarks(results)
+    if spawn_ns is not None:
+        print(f"\n{Fore.CYAN}Process spawn overhead included in every run: "
+              f"{bench.format_ns(spawn_ns)}")
+
+    with open(output, 'w') as file:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "compiler": version,
+            "flags": list(FLAGS),
+            "repeat": repeat,
+            "warmup": warmup,
+            "spawn_ns": spawn_ns,
+            "records": bench.to_records(results),
+        }, file, indent=2, default=str)
+    print(f"\n{Fore.GREEN}Native benchmark report written to {output}")
+    return results
+
+
+if __name__ == "__main__":
+    main(discover_days(sys.argv[1:]))
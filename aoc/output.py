@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+
+"""
+Buffered, leveled output for the solvers.
+
+Days call log() instead of print(). Every message has a verbosity level:
+
+    QUIET  (0)  only what the runner itself reports
+    NORMAL (1)  one-off progress and summary messages (default)
+    DETAIL (2)  per-item traces, tables and grids from inside hot loops
+
+Messages above the current verbosity return immediately, so at level 0 the
+solvers do no terminal I/O at all. Everything else is buffered and written
+in large chunks, either as text or, with the json format, as one structured
+record per line. The level and format are read from AOC_VERBOSITY and
+AOC_LOG_FORMAT so worker processes and directly run days inherit them.
+"""
+
+import os
+import re
+import sys
+import json
+import atexit
+from colorama import Style
+
+QUIET = 0
+NORMAL = 1
+DETAIL = 2
+
+BUFFER_LIMIT = 64 * 1024
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*m")
+
+VERBOSITY = int(os.environ.get("AOC_VERBOSITY", NORMAL))
+FORMAT = os.environ.get("AOC_LOG_FORMAT", "text")
+
+_buffer = []
+_buffered_size = 0
+_partial_line = []
+
+
+def set_verbosity(level):
+    """
+    Change the verbosity of this process and of the processes it starts
+    """
+    global VERBOSITY
+    VERBOSITY = level
+    os.environ["AOC_VERBOSITY"] = str(level)
+
+
+def set_format(log_format):
+    """
+    Switch between "text" and "json" output
+    """
+    global FORMAT
+    FORMAT = log_format
+    os.environ["AOC_LOG_FORMAT"] = log_format
+
+
+def enabled(level=NORMAL):
+    """
+    True when messages of the given level are shown. Use it to skip building
+    expensive output (grids, tables) that would be thrown away anyway.
+    """
+    return level <= VERBOSITY
+
+
+def _write(text):
+    """
+    Append text to the buffer, flushing it once it grows past BUFFER_LIMIT
+    """
+    global _buffered_size
+    _buffer.append(text)
+    _buffered_size += len(text)
+    if _buffered_size >= BUFFER_LIMIT:
+        _drain()
+
+
+def _drain():
+    """
+    Write the buffer to stdout
+    """
+    global _buffered_size
+    if _buffer:
+        sys.stdout.write(''.join(_buffer))
+        _buffer.clear()
+        _buffered_size = 0
+    sys.stdout.flush()
+
+
+def log(*args, level=NORMAL, sep=' ', end='\n', flush=False, **fields):
+    """
+    print() replacement that honours the verbosity level.
+    Extra keyword arguments are kept as fields of the json records.
+    """
+    if level > VERBOSITY:
+        return
+
+    message = sep.join(str(arg) for arg in args)
+
+    if FORMAT == "json":
+        # Lines built from several end='' calls become a single record
+        _partial_line.append(message + end)
+        if not end.endswith('\n'):
+            return
+        text = ANSI_ESCAPE.sub('', ''.join(_partial_line)).rstrip('\n')
+        _partial_line.clear()
+        record = {"level": level, "message": text}
+        record.update(fields)
+        _write(json.dumps(record, default=str) + '\n')
+    else:
+        # Same effect as colorama's autoreset on every print() call
+        if '\x1b[' in message:
+            message += Style.RESET_ALL
+        _write(message + end)
+
+    if flush:
+        _drain()
+
+
+def flush():
+    """
+    Write everything buffered so far to stdout
+    """
+    _drain()
+
+
+atexit.register(flush)
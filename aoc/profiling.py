@@ -0,0 +1,233 @@
+#!/usr/bin/python3
+
+"""
+Per-part CPU and memory profiling.
+
+With --profile cpu every part call runs under cProfile and leaves two files
+per (day, input file, part) in the profile directory:
+
+    <input>.<part>.pstats      raw stats, for pstats/snakeviz
+    <input>.<part>.collapsed   "a;b;c microseconds" lines for flamegraph.pl,
+                               speedscope or inferno
+
+With --profile mem the call runs under tracemalloc instead and leaves:
+
+    <input>.<part>.allocations.txt   peak traced memory and the top-N
+                                     allocation sites by size
+    <input>.<part>.mem.collapsed     allocations by call stack, in bytes
+
+Most of what a part allocates is freed before it returns, so the allocation
+sites come from the largest of the snapshots a background thread takes each
+time the traced memory has grown by a quarter, not from the final state.
+
+cProfile only records caller/callee pairs, so the CPU stacks are rebuilt by
+walking the call graph from its roots and splitting each function's own time
+between its callers in proportion to the time spent under each of them.
+"""
+
+import os
+import pstats
+import cProfile
+import threading
+import tracemalloc
+
+MODES = ("cpu", "mem")
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".aoc_profiles")
+DEFAULT_TOP = 20
+
+# Stack depth recorded by tracemalloc for the allocation stacks
+TRACE_FRAMES = 32
+
+# Call graph paths below this many seconds are not worth a flamegraph frame
+MIN_STACK_SECONDS = 1e-6
+
+# How often the memory sampler looks at the traced size, and how much it must
+# have grown since the last snapshot before a new one is taken
+SAMPLE_INTERVAL = 0.01
+SNAPSHOT_GROWTH = 1.25
+
+
+def profile_path(profile_dir, label, filename, part_name):
+    """
+    Common prefix of the files written for one part of one input file
+    """
+    directory = os.path.join(profile_dir, label.replace('/', '_'))
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"{filename.lstrip('.')}.{part_name}")
+
+
+def frame_name(filename, lineno, function=None):
+    """
+    Flamegraph frame label; ';' separates frames so it cannot appear in one
+    """
+    if not lineno:
+        # Built-ins have no source location
+        name = function
+    elif function:
+        name = f"{os.path.basename(filename)}:{lineno}({function})"
+    else:
+        name = f"{os.path.basename(filename)}:{lineno}"
+    return name.replace(';', ',')
+
+
+def collapsed_cpu_stacks(stats):
+    """
+    Rebuild {stack tuple: seconds} from a pstats.Stats call graph
+    """
+    entries = stats.stats
+    children = {}
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, edge in callers.items():
+            children.setdefault(caller, []).append((function, edge[3]))
+
+    stacks = {}
+
+    def visit(function, path, share):
+        _, _, own_time, _, _ = entries[function]
+        path = path + (function,)
+        if own_time * share > 0:
+            stacks[path] = stacks.get(path, 0.0) + own_time * share
+
+        for child, edge_time in children.get(function, ()):
+            child_time = entries[child][3]
+            # Recursion is folded into the first occurrence of a function
+            if child in path or child_time <= 0:
+                continue
+            child_share = share * min(1.0, edge_time / child_time)
+            if child_time * child_share >= MIN_STACK_SECONDS:
+                visit(child, path, child_share)
+
+    for function, (_, _, _, _, callers) in entries.items():
+        if not callers:
+            visit(function, (), 1.0)
+    return stacks
+
+
+def write_collapsed(path, stacks, scale=1):
+    """
+    Write {stack tuple: weight} as collapsed stack lines, heaviest first
+    """
+    with open(path, 'w') as file:
+        for stack, weight in sorted(stacks.items(), key=lambda item: item[1], reverse=True):
+            weight = int(weight * scale)
+            if weight > 0:
+                file.write(f"{';'.join(stack)} {weight}\n")
+
+
+def profile_cpu(func, arg, base_path):
+    """
+    Run func(arg) under cProfile. Returns (result, written files).
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, arg)
+
+    stats_path = base_path + ".pstats"
+    profiler.dump_stats(stats_path)
+
+    stats = pstats.Stats(profiler)
+    stacks = {}
+    for stack, seconds in collapsed_cpu_stacks(stats).items():
+        named = tuple(frame_name(*function) for function in stack)
+        stacks[named] = stacks.get(named, 0.0) + seconds
+    collapsed_path = base_path + ".collapsed"
+    write_collapsed(collapsed_path, stacks, scale=1e6)
+
+    return result, [stats_path, collapsed_path]
+
+
+class SnapshotSampler(threading.Thread):
+    """
+    Keeps a tracemalloc snapshot of the largest traced size seen while a
+    part runs
+    """
+
+    def __init__(self, interval=SAMPLE_INTERVAL, growth=SNAPSHOT_GROWTH):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.snapshot = None
+        self.snapshot_size = 0
+        self.stopped = threading.Event()
+
+    def take(self):
+        """
+        Snapshot now if memory grew enough since the last one
+        """
+        current, _ = tracemalloc.get_traced_memory()
+        if self.snapshot is None or current > self.snapshot_size * self.growth:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            self.take()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        # The final state counts too, parts that keep their data end at the peak
+        self.take()
+
+
+def profile_memory(func, arg, base_path, top=DEFAULT_TOP):
+    """
+    Run func(arg) under tracemalloc. Returns (result, written files).
+    """
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start(TRACE_FRAMES)
+    tracemalloc.reset_peak()
+    sampler = SnapshotSampler()
+    sampler.start()
+    try:
+        result = func(arg)
+    finally:
+        sampler.stop()
+        current, peak = tracemalloc.get_traced_memory()
+        if not already_tracing:
+            tracemalloc.stop()
+
+    # The profiler's own bookkeeping is not part of the solver
+    snapshot = sampler.snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+    ))
+
+    allocations_path = base_path + ".allocations.txt"
+    with open(allocations_path, 'w') as file:
+        file.write(f"peak traced: {peak} bytes\n")
+        file.write(f"live at end: {current} bytes\n")
+        file.write(f"snapshot:    {sampler.snapshot_size} bytes\n\n")
+        file.write(f"top {top} allocation sites of the snapshot by size:\n")
+        for stat in snapshot.statistics('lineno')[:top]:
+            frame = stat.traceback[0]
+            file.write(f"{stat.size:>14} B {stat.count:>10} blocks  "
+                       f"{frame.filename}:{frame.lineno}\n")
+
+    stacks = {}
+    for stat in snapshot.statistics('traceback'):
+        # Frames go from the oldest call to the allocation site; the runner
+        # frames above the profiled part are dropped
+        frames = list(stat.traceback)
+        start = 0
+        for index, frame in enumerate(frames):
+            if frame.filename == __file__:
+                start = index + 1
+        stack = tuple(frame_name(frame.filename, frame.lineno) for frame in frames[start:])
+        stacks[stack] = stacks.get(stack, 0) + stat.size
+    collapsed_path = base_path + ".mem.collapsed"
+    write_collapsed(collapsed_path, stacks)
+
+    return result, [allocations_path, collapsed_path]
+
+
+def profile_call(mode, func, arg, base_path, top=DEFAULT_TOP):
+    """
+    Run func(arg) under the profiler of the given mode and write its reports
+    next to base_path. Returns (result, written files).
+    """
+    if mode == "cpu":
+        return profile_cpu(func, arg, base_path)
+    if mode == "mem":
+        return profile_memory(func, arg, base_path, top)
+    raise ValueError(f"Unknown profile mode '{mode}', expected one of {', '.join(MODES)}")
@@ -0,0 +1,186 @@
+#!/usr/bin/python3
+
+"""
+Rate-limited progress bars for the solvers.
+
+Hot loops only bump a counter:
+
+    from aoc import progress
+    ...
+    with progress.bar(total=len(cells), desc="Checking positions") as bar:
+        for cell in cells:
+            ...
+            bar.update()
+
+or wrap an iterable with progress.track(). Nothing is formatted or written
+from the loop itself: a single background thread renders the innermost open
+bar to stderr at most every INTERVAL seconds, and each bar prints its final
+state once when it closes. Extra counters can be shown next to the bar with
+bar.set(name=value), which only stores them.
+
+Bars follow the output verbosity (shown from NORMAL by default) and are
+never drawn once disable() has been called, as the benchmarks do, or when
+AOC_PROGRESS=0 is set. Updates still count in that case, so the loops run
+the same code either way.
+"""
+
+import os
+import sys
+import time
+import threading
+
+from aoc import output
+
+INTERVAL = 0.1
+
+_disabled = os.environ.get("AOC_PROGRESS", "1") == "0"
+_active = []
+_lock = threading.Lock()
+_renderer = None
+
+
+def disable():
+    """
+    Stop drawing progress in this process and in the processes it starts
+    """
+    global _disabled
+    _disabled = True
+    os.environ["AOC_PROGRESS"] = "0"
+
+
+def enabled(level=output.NORMAL):
+    """
+    True when bars of the given level are drawn
+    """
+    return not _disabled and output.enabled(level)
+
+
+def format_seconds(seconds):
+    """
+    m:ss or h:mm:ss
+    """
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+class Progress:
+    """
+    A progress counter, drawn while it is open as a context manager
+    """
+
+    def __init__(self, total=None, desc="", unit="it", level=output.NORMAL):
+        self.total = total
+        self.desc = desc
+        self.unit = unit
+        self.level = level
+        self.count = 0
+        self.fields = {}
+        self.started = None
+        self.width = 0
+
+    def update(self, n=1):
+        """
+        Count n more units of work
+        """
+        self.count += n
+
+    def set(self, **fields):
+        """
+        Counters shown after the bar on its next render
+        """
+        self.fields.update(fields)
+
+    def line(self):
+        """
+        Current state as one line of text
+        """
+        elapsed = time.perf_counter() - self.started
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        text = f"{self.desc}: " if self.desc else ""
+        if self.total:
+            done = min(self.count / self.total, 1.0)
+            remaining = (self.total - self.count) / rate if rate else 0.0
+            text += (f"{done:4.0%} {self.count:,}/{self.total:,} "
+                     f"[{format_seconds(elapsed)}<{format_seconds(remaining)}")
+        else:
+            text += f"{self.count:,} [{format_seconds(elapsed)}"
+        text += f", {rate:,.0f} {self.unit}/s]"
+        if self.fields:
+            text += ' ' + ' '.join(f"{name}={value:,}" if isinstance(value, int) else f"{name}={value}"
+                                   for name, value in self.fields.items())
+        return text
+
+    def draw(self, end=''):
+        """
+        Overwrite the bar's line on stderr
+        """
+        text = self.line()
+        padding = ' ' * max(0, self.width - len(text))
+        self.width = len(text)
+        sys.stderr.write('\r' + text + padding + end)
+        sys.stderr.flush()
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        if enabled(self.level):
+            with _lock:
+                _active.append(self)
+            _start_renderer()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self in _active:
+            with _lock:
+                _active.remove(self)
+                self.draw(end='\n')
+        return False
+
+
+def _render():
+    """
+    Renderer thread: draws the innermost open bar every INTERVAL seconds and
+    exits once no bar is open
+    """
+    global _renderer
+    while True:
+        time.sleep(INTERVAL)
+        with _lock:
+            if not _active:
+                _renderer = None
+                return
+            _active[-1].draw()
+
+
+def _start_renderer():
+    global _renderer
+    with _lock:
+        if _renderer is None:
+            _renderer = threading.Thread(target=_render, name="aoc-progress", daemon=True)
+            _renderer.start()
+
+
+def bar(total=None, desc="", unit="it", level=output.NORMAL):
+    """
+    A Progress to use as a context manager around a loop
+    """
+    return Progress(total, desc, unit, level)
+
+
+def track(iterable, total=None, desc="", unit="it", level=output.NORMAL):
+    """
+    Iterate over iterable while counting the items on a progress bar.
+    When bars are not drawn the iterable is returned as it is.
+    """
+    if not enabled(level):
+        return iterable
+    if total is None and hasattr(iterable, "__len__"):
+        total = len(iterable)
+    return _tracked(iterable, Progress(total, desc, unit, level))
+
+
+def _tracked(iterable, progress):
+    with progress:
+        for item in iterable:
+            yield item
+            progress.count += 1
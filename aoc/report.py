@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+
+"""
+Machine-readable run results.
+
+With --format json or csv the runner writes one record per (year, day,
+input, part) instead of the colored report. Every record has exactly the
+fields of FIELDS, in that order, whatever the day returned:
+
+    year, day, input, part      what ran ("2024", "06", "input_I.txt", "part1")
+    value, expected, status     the answer, the known answer (null when there
+                                is none) and the test status
+    wall_seconds, cpu_seconds   execution_time and user + system CPU time
+    parse_seconds               time of the input's shared parse stage, if any
+    peak_rss_bytes              peak RSS of the process after the part
+    peak_rss_delta_bytes        peak RSS during the part above the RSS it
+                                started with (how much the part raised the
+                                process peak where Linux's reset is missing)
+    tracemalloc_peak_bytes      peak of Python allocations, with --trace-malloc
+    cached                      true when the result came from the cache
+    timeout                     why a part was stopped, if it was
+    error                       why a whole input failed (part is then empty)
+    counters                    work counters of the part (see aoc.counters)
+
+Fields a result does not have are null (empty in CSV). The JSON document
+wraps the records with SCHEMA_VERSION and run metadata; the CSV file has a
+header row and holds the counters as a JSON object. New fields are only
+ever appended, and SCHEMA_VERSION changes if one is renamed or removed.
+"""
+
+import csv
+import sys
+import json
+import time
+import platform
+
+FORMATS = ("text", "json", "csv")
+SCHEMA_VERSION = 1
+
+FIELDS = ("year", "day", "input", "part", "value", "expected", "status",
+          "wall_seconds", "cpu_seconds", "parse_seconds", "peak_rss_bytes",
+          "peak_rss_delta_bytes", "tracemalloc_peak_bytes", "cached", "timeout",
+          "error", "counters")
+
+# What the runner stores as expected for inputs without a known answer
+NO_EXPECTED = 'N/A'
+
+# Record field: key of the part result it is read from
+RESULT_KEYS = {
+    "value": "value",
+    "expected": "expected",
+    "status": "status",
+    "wall_seconds": "execution_time",
+    "cpu_seconds": "cpu_time",
+    "peak_rss_bytes": "peak_rss_bytes",
+    "peak_rss_delta_bytes": "peak_rss_delta_bytes",
+    "tracemalloc_peak_bytes": "tracemalloc_peak_bytes",
+    "timeout": "timeout",
+}
+
+
+def to_records(results):
+    """
+    Flatten runner results into one record per (day, input, part)
+    """
+    records = []
+    for label, day_results in results.items():
+        year, day = label.split('/')
+        for filename, (success, result) in day_results.items():
+            if not success:
+                record = dict.fromkeys(FIELDS)
+                record.update(year=year, day=day, input=filename, error=result,
+                              cached=False, counters={})
+                records.append(record)
+                continue
+            # Parsed once per input, by whichever part ran first
+            parse_time = max((part_result.get("parse_time") or 0.0
+                              for part_result in result.values()), default=0.0) or None
+            for part_name, part_result in result.items():
+                record = dict.fromkeys(FIELDS)
+                record.update(year=year, day=day, input=filename, part=part_name)
+                for field, key in RESULT_KEYS.items():
+                    record[field] = part_result.get(key)
+                if record["expected"] == NO_EXPECTED:
+                    record["expected"] = None
+                record["parse_seconds"] = parse_time
+                record["cached"] = bool(part_result.get("cached"))
+                record["counters"] = part_result.get("counters", {})
+                records.append(record)
+    return records
+
+
+def write_json(records, stream):
+    """
+    The records and run metadata as one JSON document
+    """
+    json.dump({
+        "schema_version": SCHEMA_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fields": list(FIELDS),
+        "records": records,
+    }, stream, indent=2, default=str)
+    stream.write('\n')
+
+
+def write_csv(records, stream):
+    """
+    The records as CSV with a header row
+    """
+    writer = csv.DictWriter(stream, fieldnames=FIELDS, lineterminator='\n')
+    writer.writeheader()
+    for record in records:
+        row = dict(record)
+        row["counters"] = json.dumps(record["counters"], sort_keys=True)
+        writer.writerow(row)
+
+
+def write(results, results_format, path=None, stream=None):
+    """
+    Write runner results as json or csv to path, or to stream (stdout by
+    default) when no path is given
+    """
+    writer = write_json if results_format == "json" else write_csv
+    records = to_records(results)
+    if path:
+        with open(path, 'w', newline='') as file:
+            writer(records, file)
+    else:
+        stream = stream or sys.stdout
+        writer(records, stream)
+        stream.flush()
+    return records
@@ -0,0 +1,938 @@
+#!/usr/bin/python3
+
+"""
+Shared runner for the daily solutions.
+
+Each day module only has to provide part1(content) and part2(content), both
+returning a dict with at least "value" and "execution_time", plus an optional
+TEST_SOLUTIONS table keyed by input filename. A day can also provide
+parse(content): the runner then parses every input once and hands the parsed
+model to both parts instead of the raw text. Parts must not modify it.
+Days with single-pass solvers can set STREAM_INPUT = True to get an
+aoc.inputs.InputFile (streamed lines or a memory map) instead of a string,
+so inputs far larger than memory still work. The runner finds the input
+files, runs every (day, input file) pair on a process pool, validates the
+answers and prints the usual pass/fail report. Part results can be served
+from an on-disk cache keyed by the input and the solver source.
+"""
+
+import gc
+import os
+import re
+import sys
+import time
+import pickle
+import argparse
+import resource
+import importlib.util
+from colorama import init, Fore
+
+from aoc import budget, cache, counters, inputs, output
+from aoc.output import log
+
+init(autoreset=True)
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PARTS = ("part1", "part2")
+PARSE = "parse"
+STREAM_INPUT = "STREAM_INPUT"
+
+# Parsed models of inputs at least this big are pickled in the result cache
+PARSE_CACHE_MIN_BYTES = 256 * 1024
+
+# Years whose days follow the part1/part2(content) contract
+DEFAULT_YEARS = ("2024", "2025")
+
+DAY_FILE_PATTERN = re.compile(r"^advent_(\d{4})_(\d{2})\.py$")
+
+TEST_STATUS = {
+    "PASSED": "PASSED",
+    "FAILED": "FAILED",
+    "IN_PROGRESS": "IN PROGRESS",
+    "NOT_APPLICABLE": "NOT APPLICABLE",
+    "UNKNOWN": "UNKNOWN",
+    "TIMEOUT": "TIMEOUT"
+}
+
+STATUS_COLORS = {
+    TEST_STATUS["PASSED"]: Fore.GREEN,
+    TEST_STATUS["FAILED"]: Fore.RED,
+    TEST_STATUS["IN_PROGRESS"]: Fore.YELLOW,
+    TEST_STATUS["NOT_APPLICABLE"]: Fore.LIGHTBLACK_EX,
+    TEST_STATUS["UNKNOWN"]: Fore.BLUE,
+    TEST_STATUS["TIMEOUT"]: Fore.MAGENTA
+}
+
+# Day modules already imported in this process, keyed by absolute path
+_DAY_MODULES = {}
+
+# Linux restarts a process's peak RSS (VmHWM) from its current RSS when "5"
+# is written here
+CLEAR_REFS = "/proc/self/clear_refs"
+PROC_STATUS = "/proc/self/status"
+
+# Peak RSS of the process before the kernel's count was last restarted
+_peak_before_reset = 0
+
+
+def print_header(filename, part):
+    """
+    Simple header printing function
+    """
+    log(f"\n{Fore.CYAN}{'='*80}")
+    log(f"{Fore.CYAN}Processing file: {Fore.YELLOW}{filename}")
+    log(f"{Fore.CYAN}Part {part}")
+    log(f"{Fore.CYAN}{'='*80}\n")
+
+
+def day_label(day_path):
+    """
+    Short "YEAR/DD" label for a day script path
+    """
+    match = DAY_FILE_PATTERN.match(os.path.basename(day_path))
+    if not match:
+        return os.path.basename(day_path)
+    return f"{match.group(1)}/{match.group(2)}"
+
+
+def find_day_script(directory):
+    """
+    Return the advent_YEAR_DD.py script inside a day directory, or None
+    """
+    if not os.path.isdir(directory):
+        return None
+    for name in sorted(os.listdir(directory)):
+        if DAY_FILE_PATTERN.match(name):
+            return os.path.join(directory, name)
+    return None
+
+
+def discover_days(targets=None, root=REPO_ROOT):
+    """
+    Resolve command line targets into day script paths.
+    A target can be a year ("2024"), a day ("2024/06"), a day directory or a
+    day script. Without targets every day of DEFAULT_YEARS is returned.
+    """
+    if not targets:
+        targets = list(DEFAULT_YEARS)
+
+    day_paths = []
+    for target in targets:
+        path = target if os.path.exists(target) else os.path.join(root, target)
+        path = os.path.abspath(path)
+
+        if os.path.isfile(path):
+            candidates = [path]
+        elif find_day_script(path):
+            candidates = [find_day_script(path)]
+        elif os.path.isdir(path):
+            candidates = [find_day_script(os.path.join(path, d))
+                          for d in sorted(os.listdir(path))]
+        else:
+            raise FileNotFoundError(f"Nothing to run for '{target}'.")
+
+        for candidate in candidates:
+            if candidate and candidate not in day_paths:
+                day_paths.append(candidate)
+
+    return day_paths
+
+
+def load_day(day_path):
+    """
+    Import a day script as a module (once per process)
+    """
+    day_path = os.path.abspath(day_path)
+    if day_path in _DAY_MODULES:
+        return _DAY_MODULES[day_path]
+
+    module_name = os.path.splitext(os.path.basename(day_path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, day_path)
+    module = importlib.util.module_from_spec(spec)
+    # Registered before executing so pickling by reference works in pools
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+
+    _DAY_MODULES[day_path] = module
+    return module
+
+
+def peak_rss_bytes():
+    """
+    Peak resident set size of this process so far, in bytes
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    peak = peak if sys.platform == "darwin" else peak * 1024
+    return max(peak, _peak_before_reset)
+
+
+def proc_status_bytes(field):
+    """
+    A memory figure of /proc/self/status (VmRSS, VmHWM, ...) in bytes
+    """
+    with open(PROC_STATUS) as file:
+        for line in file:
+            if line.startswith(field + ':'):
+                return int(line.split()[1]) * 1024
+    raise OSError(f"No {field} in {PROC_STATUS}")
+
+
+def reset_peak_rss():
+    """
+    Restart the kernel's peak RSS count from the current RSS, so the next
+    VmHWM is the peak of what runs from now on rather than of the whole
+    process. Returns the current RSS, or None where the peak cannot be reset
+    (not Linux, or /proc unavailable).
+    """
+    global _peak_before_reset
+    peak = peak_rss_bytes()
+    try:
+        rss = proc_status_bytes("VmRSS")
+        with open(CLEAR_REFS, 'w') as file:
+            file.write("5")
+    except OSError:
+        return None
+    # ru_maxrss restarts with it: keep the process peak for peak_rss_bytes
+    _peak_before_reset = peak
+    return rss
+
+
+def cpu_seconds():
+    """
+    User + system CPU time of this process and of its finished child processes
+    """
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+def gc_collections():
+    """
+    Number of garbage collections run so far, per generation
+    """
+    return [generation["collections"] for generation in gc.get_stats()]
+
+
+def get_parts(module):
+    """
+    Return the (name, function) pairs of the parts a day implements
+    """
+    return [(name, getattr(module, name)) for name in PARTS if hasattr(module, name)]
+
+
+def default_input_dir(day_path):
+    """
+    The input directory that lives next to a day script
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(day_path)), "input")
+
+
+def input_sort_key(filename):
+    """
+    Sort key that puts test files first, then input files
+    """
+    name = filename.lstrip('.')
+    if name.startswith('test'):
+        return (0, name)
+    elif name.startswith('input'):
+        return (1, name)
+    return (2, name)
+
+
+def list_input_files(input_dir):
+    """
+    All files in an input directory, test files first
+    """
+    if not os.path.exists(input_dir):
+        raise FileNotFoundError(f"Input directory '{input_dir}' does not exist.")
+
+    files = [f for f in os.listdir(input_dir) if os.path.isfile(os.path.join(input_dir, f))]
+    return sorted(files, key=input_sort_key)
+
+
+def get_expected(test_solutions, filename, part_name):
+    """
+    Read the expected value of a part from a TEST_SOLUTIONS table.
+    Both {"part1": value, "verified": bool} and
+    {"part1": {"value": value, "verified": bool}} layouts are accepted.
+    Returns (expected, verified).
+    """
+    test_solution = test_solutions.get(filename, {})
+    expected = test_solution.get(part_name, 'N/A')
+    verified = test_solution.get("verified", True)
+
+    if isinstance(expected, dict):
+        verified = expected.get("verified", verified)
+        expected = expected.get("value", 'N/A')
+
+    return expected, verified
+
+
+def determine_test_status(result, expected, verified=True):
+    """
+    Determine the test status based on the result and expected value.
+    An expected value of None marks a part that does not apply to the input.
+    """
+    if expected is None:
+        return TEST_STATUS["NOT_APPLICABLE"]
+
+    if expected == 'N/A':
+        return TEST_STATUS["IN_PROGRESS"]
+
+    if not verified:
+        if expected == 0:
+            return TEST_STATUS["IN_PROGRESS"]
+        return TEST_STATUS["UNKNOWN"]
+
+    # Compare as strings to handle mixed int/str answers
+    if str(result["value"]) == str(expected):
+        return TEST_STATUS["PASSED"]
+    return TEST_STATUS["FAILED"]
+
+
+def get_status_color(status):
+    """
+    Get the appropriate color for each status
+    """
+    return STATUS_COLORS.get(status, Fore.WHITE)
+
+
+def read_input(module, filepath):
+    """
+    The raw input of a day: a string, or an InputFile for streaming days
+    """
+    if getattr(module, STREAM_INPUT, False):
+        return inputs.InputFile(filepath)
+    with open(filepath, 'r') as file:
+        return file.read()
+
+
+def input_identity(content):
+    """
+    What the cache keys hash for an input: the text itself, or the digest
+    of a streamed file so it is never read into memory
+    """
+    if isinstance(content, inputs.InputFile):
+        return content.digest()
+    return content
+
+
+def parse_content(module, content, cache_dir=None, cache_max_bytes=cache.DEFAULT_MAX_BYTES):
+    """
+    Run a day's parse stage once for an input.
+    Days without parse() get the raw content back. For large text inputs the
+    parsed model is pickled in the cache, so repeat runs skip text parsing.
+    Streamed inputs are parsed into lazy views and never cached.
+    Returns (data, parse_time).
+    """
+    if not hasattr(module, PARSE):
+        return content, 0.0
+
+    start_time = time.time()
+    key = None
+    if cache_dir and isinstance(content, str) and len(content) >= PARSE_CACHE_MIN_BYTES:
+        key = cache.result_key(content, module.__file__, PARSE)
+        data = cache.load(key, cache_dir)
+        if data is not None:
+            return data, time.time() - start_time
+
+    data = getattr(module, PARSE)(content)
+    parse_time = time.time() - start_time
+
+    if key:
+        try:
+            cache.store(key, data, cache_dir, cache_max_bytes)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            log(f"{Fore.RED}Could not cache the parsed input: {str(e)}", level=output.QUIET)
+    return data, parse_time
+
+
+def run_part(module, part_name, data, filepath, profile=None, trace_malloc=False, limits=None):
+    """
+    Run one part of a day on the given content (or parsed model) and return
+    its result dict, with the resources the call used added to it:
+
+        cpu_time               user + system seconds, child processes included
+        peak_rss_delta_bytes   peak RSS during the call above the RSS it
+                               started with (on Linux; elsewhere how much
+                               the call raised the process's peak RSS)
+        gc_collections         collections run per generation
+        tracemalloc_peak_bytes peak of Python allocations, with trace_malloc
+
+    profile is an optional (mode, directory, top) tuple that runs the part
+    under aoc.profiling and records the files it wrote. limits is an optional
+    (seconds, nodes) budget: a part that runs out of it is stopped and
+    returns "timeout" with the reason and its "progress" counters.
+    """
+    if hasattr(module, "CURRENT_FILEPATH"):
+        module.CURRENT_FILEPATH = filepath
+
+    part = getattr(module, part_name)
+    profile_files = None
+
+    if trace_malloc:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+    counters.reset()
+    # A reused worker's peak usually comes from an earlier part: restart it
+    rss_start = reset_peak_rss()
+    rss_before = peak_rss_bytes() if rss_start is None else rss_start
+    gc_before = gc_collections()
+    cpu_before = cpu_seconds()
+    start_time = time.time()
+    try:
+        with budget.limit(*(limits or (None, None))):
+            if profile:
+                from aoc import profiling
+                mode, profile_dir, top = profile
+                base_path = profiling.profile_path(profile_dir, day_label(module.__file__),
+                                                   os.path.basename(filepath), part_name)
+                result, profile_files = profiling.profile_call(mode, part, data, base_path, top)
+            else:
+                result = part(data)
+    except budget.BudgetExceeded as e:
+        result = {"value": None, "timeout": e.reason, "progress": e.progress}
+    elapsed = time.time() - start_time
+    cpu_time = cpu_seconds() - cpu_before
+
+    if not isinstance(result, dict):
+        result = {"value": result}
+    result.setdefault("execution_time", elapsed)
+    result["cpu_time"] = cpu_time
+    result["peak_rss_bytes"] = peak_rss_bytes()
+    part_peak = result["peak_rss_bytes"] if rss_start is None else proc_status_bytes("VmHWM")
+    result["peak_rss_delta_bytes"] = part_peak - rss_before
+    result["gc_collections"] = [after - before for after, before in zip(gc_collections(), gc_before)]
+    work = counters.totals()
+    if work:
+        result["counters"] = work
+    if trace_malloc:
+        result["tracemalloc_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+    if profile_files:
+        result["profile_files"] = profile_files
+    return result
+
+
+def load_cached_result(content, day_path, part_name, cache_dir):
+    """
+    A part's cached result flagged with "cached": True, or None on a miss
+    """
+    result = cache.load(cache.result_key(content, day_path, part_name), cache_dir)
+    if result is not None:
+        result["cached"] = True
+    return result
+
+
+def store_cached_result(content, day_path, part_name, result, cache_dir, cache_max_bytes):
+    """
+    Save a part's result in the cache
+    """
+    try:
+        cache.store(cache.result_key(content, day_path, part_name), result,
+                    cache_dir, cache_max_bytes)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+        log(f"{Fore.RED}Could not cache {part_name}: {str(e)}", level=output.QUIET)
+
+
+def process_file(day_path, filepath, cache_dir=None, cache_max_bytes=cache.DEFAULT_MAX_BYTES,
+                 profile=None, trace_malloc=False, limits=None):
+    """
+    Process a single file and validate results against test solutions.
+    When cache_dir is given, part results are read from and saved to it.
+    profile, trace_malloc and limits are passed on to run_part.
+    Returns (success, {part_name: result}) or (False, error message).
+    """
+    filename = os.path.basename(filepath)
+
+    try:
+        module = load_day(day_path)
+        test_solutions = getattr(module, "TEST_SOLUTIONS", {})
+
+        content = read_input(module, filepath)
+        # Hashed once: for streamed inputs this is a full pass over the file
+        identity = input_identity(content) if cache_dir else None
+
+        results = {}
+        data = None
+        for part_number, (part_name, _) in enumerate(get_parts(module), start=1):
+            print_header(filename, part_number)
+
+            part_result = None
+            if cache_dir:
+                part_result = load_cached_result(identity, day_path, part_name, cache_dir)
+
+            if part_result is None:
+                # Parsed lazily: when every part is cached the input is never parsed
+                parse_time = None
+                if data is None:
+                    data, parse_time = parse_content(module, content, cache_dir, cache_max_bytes)
+                part_result = run_part(module, part_name, data, filepath, profile, trace_malloc,
+                                       limits)
+                if parse_time and hasattr(module, PARSE):
+                    part_result["parse_time"] = parse_time
+                # A stopped part has no answer worth keeping
+                if cache_dir and "timeout" not in part_result:
+                    store_cached_result(identity, day_path, part_name, part_result,
+                                        cache_dir, cache_max_bytes)
+
+            expected, verified = get_expected(test_solutions, filename, part_name)
+            part_result["expected"] = expected
+            if "timeout" in part_result:
+                part_result["status"] = TEST_STATUS["TIMEOUT"]
+            else:
+                part_result["status"] = determine_test_status(part_result, expected, verified)
+            results[part_name] = part_result
+
+        return True, results
+
+    except Exception as e:
+        log(f"{Fore.RED}Error processing {filename}: {str(e)}", level=output.QUIET)
+        return False, str(e)
+
+    finally:
+        # One write per job keeps the output of parallel jobs from interleaving
+        output.flush()
+
+
+def collect_jobs(day_paths, input_dir=None):
+    """
+    List the (day script, input file) pairs to run, test files first
+    """
+    jobs = []
+    for day_path in day_paths:
+        day_input_dir = input_dir or default_input_dir(day_path)
+        for filename in list_input_files(day_input_dir):
+            jobs.append((day_path, os.path.join(day_input_dir, filename)))
+    return jobs
+
+
+def run_jobs(jobs, worker, args=(), workers=None, on_result=None):
+    """
+    Call worker(day_path, filepath, *args) for every job on a process pool.
+    Jobs start in list order. on_result(job, result), if given, is called in
+    this process as soon as each job finishes.
+    Returns {day label: {filename: worker result}} with files in job order,
+    whatever order the jobs finished in.
+    """
+    finished = {}
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            finished[job] = worker(*job, *args)
+            if on_result:
+                on_result(job, finished[job])
+    else:
+        # Imported here: the pool machinery costs more startup than most days
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(worker, *job, *args): job for job in jobs}
+            for future in as_completed(futures):
+                finished[futures[future]] = future.result()
+                if on_result:
+                    on_result(futures[future], finished[futures[future]])
+
+    results = {}
+    for day_path, filepath in jobs:
+        day_results = results.setdefault(day_label(day_path), {})
+        day_results[os.path.basename(filepath)] = finished[(day_path, filepath)]
+    return results
+
+
+def run_days(day_paths, input_dir=None, workers=None, cache_dir=None,
+             cache_max_bytes=cache.DEFAULT_MAX_BYTES, profile=None, trace_malloc=False,
+             limits=None):
+    """
+    Run every input file of every day on a process pool.
+    Returns {day label: {filename: (success, result)}}.
+    """
+    return run_jobs(collect_jobs(day_paths, input_dir), process_file,
+                    args=(cache_dir, cache_max_bytes, profile, trace_malloc, limits),
+                    workers=workers)
+
+
+def format_bytes(size):
+    """
+    Human friendly memory size
+    """
+    if abs(size) >= 2**30:
+        return f"{size / 2**30:.2f}GiB"
+    if abs(size) >= 2**20:
+        return f"{size / 2**20:.1f}MiB"
+    return f"{size / 2**10:.1f}KiB"
+
+
+def format_resources(part_result):
+    """
+    CPU, memory and GC figures of a part result, for the report line
+    """
+    if "cpu_time" not in part_result:
+        return ""
+    text = (f"  CPU: {part_result['cpu_time']:.3f}s"
+            f"  RSS: +{format_bytes(part_result['peak_rss_delta_bytes'])}")
+    if "tracemalloc_peak_bytes" in part_result:
+        text += f"  Heap: {format_bytes(part_result['tracemalloc_peak_bytes'])}"
+    text += f"  GC: {'/'.join(str(count) for count in part_result['gc_collections'])}"
+    if part_result.get("counters"):
+        text += f"  Work: {counters.format_counters(part_result['counters'])}"
+    return text
+
+
+def all_passed(results):
+    """
+    True when every input ran and no part failed or timed out
+    """
+    failing = (TEST_STATUS["FAILED"], TEST_STATUS["TIMEOUT"])
+    return all(success and all(part_result["status"] not in failing
+                               for part_result in result.values())
+               for day_results in results.values()
+               for success, result in day_results.values())
+
+
+def print_results(results):
+    """
+    Print results with enhanced status display.
+    Returns True when no test failed.
+    """
+    output.flush()
+    print(f"\n{Fore.CYAN}{'='*80}")
+    print(f"{Fore.CYAN}Final Results")
+    print(f"{Fore.CYAN}{'='*80}\n")
+
+    all_tests_passed = all_passed(results)
+
+    for label, day_results in results.items():
+        if len(results) > 1:
+            print(f"\n{Fore.MAGENTA}{label}")
+
+        for file, (success, result) in day_results.items():
+            parse_time = 0.0
+            if success:
+                parse_time = max((r.get("parse_time", 0.0) for r in result.values()), default=0.0)
+            parse_text = f"  {Fore.CYAN}Parse: {parse_time:.6f}s" if parse_time else ""
+            print(f"\n{Fore.BLUE}{file}:{parse_text}")
+
+            if not success:
+                print(f"  {Fore.RED}Error - {result}")
+                continue
+
+            for part_name, part_result in result.items():
+                status_color = get_status_color(part_result["status"])
+                status_text = f"[{part_result['status']}]"
+
+                # Add expected value for FAILED status
+                if part_result["status"] == TEST_STATUS["FAILED"]:
+                    status_text += f" (Expected: {part_result['expected']})"
+
+                # Stopped parts show why and how far they got
+                if part_result["status"] == TEST_STATUS["TIMEOUT"]:
+                    status_text += (f" ({part_result['timeout']}: "
+                                    f"{counters.format_counters(part_result['progress'])})")
+
+                cached_text = f" {Fore.LIGHTBLACK_EX}(cached)" if part_result.get("cached") else ""
+                print(f"  {Fore.YELLOW}{part_name}: "
+                      f"{Fore.GREEN}{str(part_result['value']):<15} "
+                      f"{status_color}{status_text}  "
+                      f"{Fore.CYAN}Time: {part_result['execution_time']:.6f}s"
+                      f"{format_resources(part_result)}{cached_text}")
+
+    # Print overall test summary
+    print(f"\n{Fore.CYAN}{'='*80}")
+    if all_tests_passed:
+        print(f"{Fore.GREEN}🎉 ALL TESTS PASSED! 🎉")
+    else:
+        print(f"{Fore.RED}❌ SOME TESTS FAILED")
+    print(f"{Fore.CYAN}{'='*80}")
+
+    return all_tests_passed
+
+
+def report_results(results, results_format="text", path=None, stream=None):
+    """
+    Print the colored report, or write the results as json or csv records
+    (see aoc.report) to path or stream. Returns True when no test failed.
+    """
+    if results_format == "text":
+        return print_results(results)
+    from aoc import report
+    output.flush()
+    report.write(results, results_format, path, stream)
+    return all_passed(results)
+
+
+def record_history(results, day_paths, mode, db_path=None):
+    """
+    Append a run to the timing history database
+    """
+    from aoc import history
+    try:
+        history.record_run(results, day_paths, mode, db_path or history.DEFAULT_DB)
+    except Exception as e:
+        print(f"{Fore.RED}Could not record timing history: {str(e)}")
+
+
+def run_day(day_file):
+    """
+    Entry point used by each day script when run directly.
+    An input directory can be given as the first command line argument.
+    AOC_FORMAT=json or csv writes the results as records instead of the report.
+    """
+    results_format = os.environ.get("AOC_FORMAT", "text")
+    # Records on stdout must not be mixed with logs and messages
+    results_stream = None
+    if results_format != "text":
+        results_stream = sys.stdout
+        sys.stdout = sys.stderr
+
+    try:
+        input_dir = sys.argv[1] if len(sys.argv) > 1 else None
+        day_paths = [os.path.abspath(day_file)]
+        results = run_days(day_paths, input_dir=input_dir)
+        report_results(results, results_format, stream=results_stream)
+        record_history(results, day_paths, "run")
+    except Exception as e:
+        print(f"{Fore.RED}Error: {str(e)}")
+        sys.exit(1)
+
+
+def positive_int(text):
+    """
+    argparse type for counts that must be at least 1
+    """
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def build_parser():
+    """
+    Command line options of the shared runner
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc",
+        description="Run Advent of Code solutions in parallel.")
+    parser.add_argument("targets", nargs="*",
+                        help="years (2024), days (2024/06) or day scripts; all days by default")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="number of worker processes (default: one per CPU, "
+                             "or 1 when benchmarking)")
+    parser.add_argument("--bench", action="store_true",
+                        help="benchmark every part instead of running it once")
+    parser.add_argument("--repeat", type=positive_int, default=None,
+                        help="timed runs per part (default: 10 with --bench, best of 3 with --scale)")
+    parser.add_argument("--warmup", type=int, default=2,
+                        help="untimed warmup runs per part in benchmark mode (default: 2)")
+    parser.add_argument("--bench-output", default=None,
+                        help="JSON file for the benchmark report (default: benchmark.json, "
+                             "native_benchmark.json with --native)")
+    parser.add_argument("--native", action="store_true",
+                        help="benchmark the C++ solutions of 2022 (or the targets), each "
+                             "compiled once with -O2 and cached by source hash")
+    parser.add_argument("--schedule", action="store_true",
+                        help="run every day of 2023-2025 (or the targets) longest job first, "
+                             "streaming results as they complete")
+    parser.add_argument("--schedule-output", default="schedule.jsonl",
+                        help="JSON lines file the scheduled results are appended to as they "
+                             "complete (default: schedule.jsonl)")
+    parser.add_argument("--scale", action="store_true",
+                        help="time every part on synthetic inputs of growing size and fit "
+                             "its complexity exponent")
+    parser.add_argument("--sizes", default=None,
+                        help="comma separated size ladder for --scale (default: each "
+                             "generator's own)")
+    parser.add_argument("--seed", type=int, default=2024,
+                        help="random seed of the synthetic inputs (default: 2024)")
+    parser.add_argument("--scale-output", default="scaling.json",
+                        help="JSON file for the scaling report (default: scaling.json)")
+    parser.add_argument("--fuzz", action="store_true",
+                        help="check the optimized parts against their reference "
+                             "implementations on random synthetic inputs")
+    parser.add_argument("--fuzz-runs", type=int, default=200,
+                        help="random inputs per fuzzed part (default: 200)")
+    parser.add_argument("--fuzz-output", default="fuzz.json",
+                        help="JSON file for the fuzz report (default: fuzz.json)")
+    parser.add_argument("--batch", default=None, metavar="SOURCE",
+                        help="solve every input of a directory or tar archive with one day "
+                             "on a pool of warm workers and report throughput and latency")
+    parser.add_argument("--batch-output", default="batch.json",
+                        help="JSON file for the batch report (default: batch.json)")
+    parser.add_argument("--generate", type=int, default=None, metavar="SIZE",
+                        help="print a synthetic input of the given size for one day and exit")
+    parser.add_argument("--history", default=None,
+                        help="SQLite timing history file (default: .aoc_history.sqlite)")
+    parser.add_argument("--no-history", action="store_true",
+                        help="do not record this run in the timing history")
+    parser.add_argument("--compare", action="store_true",
+                        help="compare the latest timings against the previous baseline and exit")
+    parser.add_argument("--compare-mode", choices=("bench", "run"), default="bench",
+                        help="which kind of recorded runs to compare (default: bench)")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="percent slowdown of the median flagged as a regression (default: 10)")
+    parser.add_argument("--baseline", default=None,
+                        help="commit to compare against instead of the previous run")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="run every part even if its result is cached")
+    parser.add_argument("--cache-dir", default=cache.DEFAULT_DIR,
+                        help="result cache directory (default: .aoc_cache)")
+    parser.add_argument("--cache-size", type=float, default=cache.DEFAULT_MAX_BYTES / 2**20,
+                        help="result cache size limit in MiB, least recently used "
+                             "entries are evicted first (default: 64)")
+    parser.add_argument("--clear-cache", action="store_true",
+                        help="empty the result cache and exit")
+    parser.add_argument("--format", choices=("text", "json", "csv"),
+                        default=os.environ.get("AOC_FORMAT", "text"),
+                        help="text prints the colored report; json and csv write one record "
+                             "per day, input and part instead (default: text)")
+    parser.add_argument("-o", "--output", default=None,
+                        help="file for the json or csv records (default: stdout, with "
+                             "everything else moved to stderr)")
+    parser.add_argument("-q", "--quiet", action="store_const", dest="verbosity",
+                        const=output.QUIET, default=output.VERBOSITY,
+                        help="only print the final report")
+    parser.add_argument("-v", "--verbose", action="store_const", dest="verbosity",
+                        const=output.DETAIL,
+                        help="also print the per-item traces and grids of the solvers")
+    parser.add_argument("--log-format", choices=("text", "json"), default=output.FORMAT,
+                        help="format of the solver messages (default: text)")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="seconds each part may run before it is stopped and reported "
+                             "as TIMEOUT")
+    parser.add_argument("--node-budget", type=int, default=None,
+                        help="search nodes each part may expand (counted by parts that "
+                             "call aoc.budget.checkpoint) before it is stopped")
+    parser.add_argument("--trace-malloc", action="store_true",
+                        help="also report the tracemalloc peak of every part "
+                             "(slows allocation heavy parts down)")
+    parser.add_argument("--profile", choices=("cpu", "mem"), default=None,
+                        help="run every part under cProfile (cpu) or tracemalloc (mem) and "
+                             "write the reports to the profile directory; "
+                             "implies --no-cache and --no-history")
+    parser.add_argument("--profile-dir", default=None,
+                        help="directory for the profile reports (default: .aoc_profiles)")
+    parser.add_argument("--profile-top", type=int, default=20,
+                        help="allocation sites listed per part with --profile mem (default: 20)")
+    return parser
+
+
+def main(argv=None):
+    """
+    Run one or many days from the command line
+    """
+    args = build_parser().parse_args(argv)
+    # Set before the pool starts so the workers inherit them
+    output.set_verbosity(args.verbosity)
+    output.set_format(args.log_format)
+
+    # Records on stdout must not be mixed with logs and messages
+    results_stream = None
+    if args.format != "text" and not args.output:
+        results_stream = sys.stdout
+        sys.stdout = sys.stderr
+
+    try:
+        if args.compare:
+            from aoc import history
+            regressions = history.compare(args.compare_mode, args.threshold, args.baseline,
+                                          args.history or history.DEFAULT_DB)
+            sys.exit(1 if regressions else 0)
+
+        if args.clear_cache:
+            removed = cache.clear(args.cache_dir)
+            print(f"{Fore.GREEN}Removed {removed} cached result(s) from {args.cache_dir}")
+            sys.exit(0)
+
+        if args.native:
+            from aoc import bench, native
+            native.main(native.discover_days(args.targets),
+                        repeat=args.repeat or bench.DEFAULT_REPEAT, warmup=args.warmup,
+                        output=args.bench_output or native.DEFAULT_OUTPUT)
+            sys.exit(0)
+
+        if args.schedule:
+            from aoc import schedule
+            day_paths = discover_days(args.targets or list(schedule.SCHEDULE_YEARS))
+            results = schedule.schedule(day_paths, workers=args.workers,
+                                        cache_dir=None if args.no_cache else args.cache_dir,
+                                        cache_max_bytes=int(args.cache_size * 2**20),
+                                        limits=(args.time_budget, args.node_budget),
+                                        db_path=args.history, output_path=args.schedule_output)
+            all_tests_passed = report_results(results, args.format, args.output, results_stream)
+            if not args.no_history:
+                record_history(results, day_paths, "run", args.history)
+            sys.exit(0 if all_tests_passed else 1)
+
+        day_paths = discover_days(args.targets)
+
+        if args.generate is not None:
+            from aoc import scaling
+            if len(day_paths) != 1:
+                raise ValueError("--generate needs exactly one day.")
+            sys.stdout.write(scaling.generate_input(day_paths[0], args.generate, args.seed))
+            sys.exit(0)
+
+        if args.scale:
+            from aoc import scaling
+            sizes = [int(size) for size in args.sizes.split(',')] if args.sizes else None
+            scaling.main(day_paths, sizes=sizes, seed=args.seed,
+                         repeat=args.repeat or scaling.DEFAULT_REPEAT,
+                         seconds=args.time_budget or scaling.DEFAULT_BUDGET,
+                         output=args.scale_output)
+            sys.exit(0)
+
+        if args.batch:
+            from aoc import batch
+            if len(day_paths) != 1:
+                raise ValueError("--batch needs exactly one day.")
+            solved = batch.main(day_paths[0], args.batch, workers=args.workers,
+                                limits=(args.time_budget, args.node_budget),
+                                output=args.batch_output)
+            sys.exit(0 if solved else 1)
+
+        if args.fuzz:
+            from aoc import fuzz
+            agreed = fuzz.main(day_paths, runs=args.fuzz_runs, seed=args.seed,
+                               seconds=args.time_budget or fuzz.DEFAULT_BUDGET,
+                               output=args.fuzz_output)
+            sys.exit(0 if agreed else 1)
+
+        if args.bench:
+            from aoc import bench
+            results = bench.main(day_paths, repeat=args.repeat or bench.DEFAULT_REPEAT,
+                                 warmup=args.warmup,
+                                 output=args.bench_output or bench.DEFAULT_OUTPUT,
+                                 workers=args.workers or 1)
+            if not args.no_history:
+                record_history(results, day_paths, "bench", args.history)
+            sys.exit(0)
+
+        profile = None
+        if args.profile:
+            from aoc import profiling
+            profile = (args.profile, os.path.abspath(args.profile_dir or profiling.DEFAULT_DIR),
+                       args.profile_top)
+
+        print(f"{Fore.CYAN}Running {len(day_paths)} day(s): "
+              f"{Fore.YELLOW}{', '.join(day_label(p) for p in day_paths)}")
+        # Profiled parts must really run, and their timings include the profiler
+        results = run_days(day_paths, workers=args.workers,
+                           cache_dir=None if args.no_cache or profile else args.cache_dir,
+                           cache_max_bytes=int(args.cache_size * 2**20), profile=profile,
+                           trace_malloc=args.trace_malloc,
+                           limits=(args.time_budget, args.node_budget))
+        all_tests_passed = report_results(results, args.format, args.output, results_stream)
+        if profile:
+            print(f"{Fore.GREEN}{args.profile} profiles written to {profile[1]}")
+        elif not args.no_history:
+            record_history(results, day_paths, "run", args.history)
+    except Exception as e:
+        print(f"{Fore.RED}Error: {str(e)}")
+        sys.exit(1)
+
+    sys.exit(0 if all_tests_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+#!/usr/bin/python3
+
+"""
+Complexity scans on synthetic inputs.
+
+A day can ship a generator.py next to its script that provides
+
+    SIZES                 the default size ladder
+    generate(size, rng)   a valid input of that size, drawn from rng
+
+where the meaning of size (grid side, number of lines, ...) is documented
+in the generator. Inputs are generated from a fixed seed so every scan of
+the same ladder sees the same data.
+
+Each part (and the parse stage, if the day has one) is timed on every size
+of the ladder, best of a few runs, under a time budget: a part that runs
+out of it is marked as timed out and skipped for the larger sizes. The
+exponent k of time ~ c * size^k is then fitted by least squares on the
+log-log points, so k close to 1 is linear, 2 quadratic and so on.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import platform
+import importlib.util
+from colorama import Fore
+
+from aoc import budget, runner
+from aoc.output import QUIET, set_verbosity
+
+GENERATOR_FILE = "generator.py"
+DEFAULT_SEED = 2024
+DEFAULT_REPEAT = 3
+DEFAULT_BUDGET = 60.0
+DEFAULT_OUTPUT = "scaling.json"
+
+# Points faster than this are mostly timer and call overhead
+MIN_FIT_NS = 100_000
+
+
+def generator_path(day_path):
+    """
+    The generator module that lives next to a day script
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(day_path)), GENERATOR_FILE)
+
+
+def load_generator(day_path):
+    """
+    Import a day's generator module, or return None if it has none
+    """
+    path = generator_path(day_path)
+    if not os.path.exists(path):
+        return None
+    name = "generator_" + runner.day_label(day_path).replace('/', '_')
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def generate_input(day_path, size, seed=DEFAULT_SEED):
+    """
+    Synthetic input of a day at the given size
+    """
+    generator = load_generator(day_path)
+    if generator is None:
+        raise FileNotFoundError(f"{runner.day_label(day_path)} has no {GENERATOR_FILE}.")
+    return generator.generate(size, random.Random(seed))
+
+
+def time_call(func, arg, repeat, seconds):
+    """
+    Best of repeat timed calls of func(arg) in nanoseconds, or None if one
+    of them ran out of the time budget
+    """
+    best_ns = None
+    for _ in range(repeat):
+        try:
+            with budget.limit(seconds):
+                start_ns = time.perf_counter_ns()
+                func(arg)
+                elapsed_ns = time.perf_counter_ns() - start_ns
+        except budget.BudgetExceeded:
+            return None
+        best_ns = elapsed_ns if best_ns is None else min(best_ns, elapsed_ns)
+    return best_ns
+
+
+def fit_exponent(points):
+    """
+    Least squares fit of log(time) = k * log(size) + c over (size, ns)
+    points. Returns (k, r_squared), or (None, None) with fewer than two
+    usable points.
+    """
+    usable = [(math.log(size), math.log(ns)) for size, ns in points
+              if ns is not None and ns >= MIN_FIT_NS]
+    if len(usable) < 2:
+        return None, None
+
+    mean_x = sum(x for x, _ in usable) / len(usable)
+    mean_y = sum(y for _, y in usable) / len(usable)
+    sxx = sum((x - mean_x) ** 2 for x, _ in usable)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in usable)
+    syy = sum((y - mean_y) ** 2 for _, y in usable)
+    if sxx == 0:
+        return None, None
+
+    slope = sxy / sxx
+    r_squared = sxy * sxy / (sxx * syy) if syy else 1.0
+    return slope, r_squared
+
+
+def scan_day(day_path, sizes=None, seed=DEFAULT_SEED, repeat=DEFAULT_REPEAT,
+             seconds=DEFAULT_BUDGET):
+    """
+    Time every stage of a day across a size ladder.
+    Returns {"sizes": [...], "stages": {stage: {"points": [...], "exponent",
+    "r_squared"}}}, or None if the day has no generator.
+    """
+    generator = load_generator(day_path)
+    if generator is None:
+        return None
+
+    module = runner.load_day(day_path)
+    sizes = list(sizes or generator.SIZES)
+    stages = ([runner.PARSE] if hasattr(module, runner.PARSE) else []) + \
+        [name for name, _ in runner.get_parts(module)]
+    points = {stage: [] for stage in stages}
+    timed_out = set()
+
+    for size in sizes:
+        content = generator.generate(size, random.Random(seed))
+        if hasattr(module, "CURRENT_FILEPATH"):
+            # Days that special-case the test files must treat this as a real input
+            module.CURRENT_FILEPATH = f"synthetic_{size}.txt"
+
+        data = content
+        for stage in stages:
+            if stage in timed_out:
+                points[stage].append({"size": size, "bytes": len(content), "ns": None,
+                                      "timeout": True})
+                continue
+            if stage == runner.PARSE:
+                elapsed_ns = time_call(getattr(module, stage), content, repeat, seconds)
+                if elapsed_ns is not None:
+                    data = getattr(module, stage)(content)
+            else:
+                elapsed_ns = time_call(getattr(module, stage), data, repeat, seconds)
+
+            if elapsed_ns is None:
+                timed_out.add(stage)
+                if stage == runner.PARSE:
+                    # Nothing left to run the parts on at this size or above
+                    timed_out.update(stages)
+            points[stage].append({"size": size, "bytes": len(content), "ns": elapsed_ns,
+                                  "timeout": elapsed_ns is None})
+
+    report = {"sizes": sizes, "stages": {}}
+    for stage, stage_points in points.items():
+        exponent, r_squared = fit_exponent([(point["size"], point["ns"]) for point in stage_points])
+        report["stages"][stage] = {"points": stage_points, "exponent": exponent,
+                                   "r_squared": r_squared}
+    return report
+
+
+def format_point(point):
+    """
+    One cell of the scan table
+    """
+    if point["timeout"]:
+        return "timeout"
+    ns = point["ns"]
+    if ns >= 1e9:
+        return f"{ns / 1e9:.2f}s"
+    if ns >= 1e6:
+        return f"{ns / 1e6:.1f}ms"
+    return f"{ns / 1e3:.0f}µs"
+
+
+def print_scan(label, report):
+    """
+    Print the timings of every stage across the ladder and the fitted exponent
+    """
+    print(f"\n{Fore.MAGENTA}{label}  {Fore.CYAN}sizes {', '.join(map(str, report['sizes']))}")
+    for stage, result in report["stages"].items():
+        cells = ' '.join(f"{format_point(point):>9}" for point in result["points"])
+        if result["exponent"] is None:
+            fit = f"{Fore.LIGHTBLACK_EX}not enough points to fit"
+        else:
+            color = Fore.RED if result["exponent"] >= 1.8 else Fore.GREEN
+            fit = (f"{color}~ n^{result['exponent']:.2f}"
+                   f"{Fore.LIGHTBLACK_EX}  (r² {result['r_squared']:.3f})")
+        print(f"  {Fore.YELLOW}{stage:<6} {Fore.CYAN}{cells}  {fit}")
+
+
+def main(day_paths, sizes=None, seed=DEFAULT_SEED, repeat=DEFAULT_REPEAT, seconds=DEFAULT_BUDGET,
+         output=DEFAULT_OUTPUT):
+    """
+    Scan every day that has a generator, print the table and write the JSON report
+    """
+    set_verbosity(QUIET)
+    print(f"{Fore.CYAN}Scaling {len(day_paths)} day(s): "
+          f"{Fore.YELLOW}seed {seed}, best of {repeat} run(s), {seconds:g}s budget per run")
+
+    reports = {}
+    for day_path in day_paths:
+        label = runner.day_label(day_path)
+        report = scan_day(day_path, sizes, seed, repeat, seconds)
+        if report is None:
+            print(f"\n{Fore.MAGENTA}{label}  {Fore.LIGHTBLACK_EX}no {GENERATOR_FILE}, skipped")
+            continue
+        reports[label] = report
+        print_scan(label, report)
+
+    with open(output, 'w') as file:
+        json.dump({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "budget_seconds": seconds,
+            "days": reports,
+        }, file, indent=2)
+    print(f"\n{Fore.GREEN}Scaling report written to {output}")
+    return reports
+
+
+if __name__ == "__main__":
+    main(runner.discover_days(sys.argv[1:]))
@@ -0,0 +1,176 @@
+#!/usr/bin/python3
+
+"""
+Longest-job-first scheduling of every runnable day.
+
+Every (day, input file) pair of 2023, 2024 and 2025 becomes one job. Its cost
+is estimated from the timing history: the sum of the latest median of each
+of its parts, from regular runs first and benchmarks otherwise. Jobs that
+were never timed fall back to an estimate from the size of their input.
+
+The jobs are submitted to the process pool longest first, so the slowest
+days start right away and the short ones fill the gaps at the end instead of
+one long day starting last and running alone. Each result is printed and
+appended to a JSON lines file as soon as its job finishes, so a sweep can be
+followed, or tailed, while it runs.
+"""
+
+import os
+import sys
+import json
+import time
+from colorama import Fore
+
+from aoc import cache, output, runner
+from aoc.output import log
+
+SCHEDULE_YEARS = ("2023", "2024", "2025")
+DEFAULT_OUTPUT = "schedule.jsonl"
+
+# Rough solver throughput for inputs that have never been timed
+DEFAULT_NS_PER_BYTE = 1000
+
+
+def history_costs(db_path):
+    """
+    {(year, day, input): ns} summed over the parts of the latest timings,
+    regular runs taking precedence over benchmarks
+    """
+    from aoc import history
+    if not os.path.exists(db_path):
+        return {}
+
+    connection = history.connect(db_path)
+    try:
+        costs = {}
+        for mode in ("bench", "run"):
+            per_input = {}
+            for (year, day, filename, _), timing in history.latest_timings(connection, mode).items():
+                key = (year, day, filename)
+                per_input[key] = per_input.get(key, 0) + timing[3]
+            costs.update(per_input)
+        return costs
+    finally:
+        connection.close()
+
+
+def estimate_cost(job, costs):
+    """
+    Estimated run time of a job in nanoseconds and where it came from
+    """
+    day_path, filepath = job
+    year, day = runner.day_label(day_path).split('/')
+    key = (year, day, os.path.basename(filepath))
+    if key in costs:
+        return costs[key], "history"
+
+    return os.path.getsize(filepath) * DEFAULT_NS_PER_BYTE, "size"
+
+
+def run_job(day_path, filepath, cache_dir=None, cache_max_bytes=cache.DEFAULT_MAX_BYTES,
+            limits=None):
+    """
+    Pool worker for one job: one input file of a day
+    """
+    return runner.process_file(day_path, filepath, cache_dir, cache_max_bytes, limits=limits)
+
+
+def job_status(success, result):
+    """
+    Status of a finished job: FAILED or TIMEOUT if any part is, else its part statuses
+    """
+    if not success:
+        return "ERROR"
+    statuses = [part_result["status"] for part_result in result.values()]
+    for status in ("FAILED", "TIMEOUT"):
+        if runner.TEST_STATUS[status] in statuses:
+            return runner.TEST_STATUS[status]
+    return ', '.join(sorted(set(statuses)))
+
+
+def job_seconds(success, result):
+    """
+    Time spent in the parts (and parse stage) of a finished job
+    """
+    if not success:
+        return 0.0
+    parse_time = max((r.get("parse_time") or 0.0 for r in result.values()), default=0.0)
+    return parse_time + sum(r.get("execution_time") or 0.0 for r in result.values())
+
+
+def to_record(job, estimate, source, success, result):
+    """
+    JSON record of one finished job
+    """
+    day_path, filepath = job
+    record = {
+        "finished": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "day": runner.day_label(day_path),
+        "input": os.path.basename(filepath),
+        "estimate_ns": estimate,
+        "estimate_source": source,
+        "status": job_status(success, result),
+        "seconds": job_seconds(success, result),
+    }
+    if success:
+        record["parts"] = {name: {key: part_result.get(key)
+                                  for key in ("value", "status", "execution_time", "cached")}
+                           for name, part_result in result.items()}
+    else:
+        record["error"] = result
+    return record
+
+
+def schedule(day_paths, workers=None, cache_dir=None, cache_max_bytes=cache.DEFAULT_MAX_BYTES,
+             limits=None, db_path=None, output_path=DEFAULT_OUTPUT):
+    """
+    Run every job longest first, streaming each result to the console and to
+    output_path. Returns {day label: {filename: (success, result)}} in day
+    and file order.
+    """
+    from aoc import history
+    costs = history_costs(db_path or history.DEFAULT_DB)
+    jobs = runner.collect_jobs(day_paths)
+    estimates = {job: estimate_cost(job, costs) for job in jobs}
+    ordered = sorted(jobs, key=lambda job: estimates[job][0], reverse=True)
+
+    from_history = sum(1 for source in estimates.values() if source[1] == "history")
+    print(f"{Fore.CYAN}Scheduling {len(jobs)} job(s) of {len(day_paths)} day(s) longest first: "
+          f"{Fore.YELLOW}{from_history} estimated from history, "
+          f"{len(jobs) - from_history} from input size")
+
+    done = 0
+    with open(output_path, 'w') as file:
+
+        def on_result(job, job_result):
+            nonlocal done
+            done += 1
+            estimate, source = estimates[job]
+            record = to_record(job, estimate, source, *job_result)
+            file.write(json.dumps(record, default=str) + "\n")
+            file.flush()
+
+            color = runner.get_status_color(record["status"])
+            if record["status"] == "ERROR":
+                color = Fore.RED
+            output.flush()
+            print(f"{Fore.LIGHTBLACK_EX}[{done:>{len(str(len(jobs)))}}/{len(jobs)}] "
+                  f"{Fore.MAGENTA}{record['day']} {Fore.BLUE}{record['input']:<15} "
+                  f"{color}{record['status']:<15} {Fore.CYAN}{record['seconds']:.3f}s "
+                  f"{Fore.LIGHTBLACK_EX}(est {estimate / 1e9:.3f}s from {source})", flush=True)
+
+        results = runner.run_jobs(ordered, run_job, args=(cache_dir, cache_max_bytes, limits),
+                                  workers=workers, on_result=on_result)
+
+    log(f"{Fore.GREEN}Schedule results written to {output_path}", level=output.QUIET)
+    # Report in day and file order, not completion order
+    report = {}
+    for day_path, filepath in jobs:
+        label = runner.day_label(day_path)
+        filename = os.path.basename(filepath)
+        report.setdefault(label, {})[filename] = results[label][filename]
+    return report
+
+
+if __name__ == "__main__":
+    runner.print_results(schedule(runner.discover_days(sys.argv[1:] or list(SCHEDULE_YEARS))))
@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+
+"""
+Parts that run on a process pool must stop on their time budget as a part
+on one process does, instead of waiting for the work already handed out.
+
+Each test slows down the function the pool workers call (the workers are
+forked, so they see the patched module) and forces the pooled path on any
+number of CPUs.
+"""
+
+import os
+import sys
+import time
+import multiprocessing
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from aoc import runner
+from aoc.output import QUIET, set_verbosity
+
+BUDGET = 0.5
+# Pool start-up and teardown on a loaded machine
+SLACK = 2.0
+# Far longer than any budget: a part that waits for it has not stopped
+TASK_SECONDS = 30
+
+pytestmark = pytest.mark.skipif(multiprocessing.get_start_method() != "fork",
+                                reason="the slowed-down solvers reach the workers by fork")
+
+
+def day_path(label):
+    return os.path.join(runner.REPO_ROOT, label, f"advent_{label.replace('/', '_')}.py")
+
+
+def read_input(label):
+    with open(os.path.join(runner.default_input_dir(day_path(label)), "input_I.txt")) as file:
+        return file.read()
+
+
+def run_under_budget(module, data, filepath):
+    """
+    Run part2 with a BUDGET time budget, returning its result and wall time
+    """
+    set_verbosity(QUIET)
+    start = time.perf_counter()
+    result = runner.run_part(module, "part2", data, filepath, limits=(BUDGET, None))
+    return result, time.perf_counter() - start
+
+
+def test_sharded_guard_stops_on_budget(monkeypatch):
+    module = runner.load_day(day_path("2024/06"))
+    monkeypatch.setattr(module, "SHARD_MIN_CANDIDATES", 0)
+    monkeypatch.setattr(module.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(module, "simulate_with_obstruction",
+                        lambda *args: time.sleep(TASK_SECONDS))
+
+    result, elapsed = run_under_budget(module, read_input("2024/06"), "input_I.txt")
+
+    assert "timeout" in result
+    assert elapsed < BUDGET + SLACK
+
+
+def test_pooled_calibration_stops_on_budget(monkeypatch):
+    module = runner.load_day(day_path("2024/07"))
+    is_valid_equation = module.is_valid_equation
+
+    def slow_concat(target, numbers, include_concat=False):
+        if include_concat:
+            time.sleep(TASK_SECONDS)
+        return is_valid_equation(target, numbers, include_concat)
+
+    monkeypatch.setattr(module, "POOL_MIN_EQUATIONS", 0)
+    monkeypatch.setattr(module.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(module, "is_valid_equation", slow_concat)
+
+    data = module.parse(read_input("2024/07"))
+    result, elapsed = run_under_budget(module, data, "input_I.txt")
+
+    assert "timeout" in result
+    assert elapsed < BUDGET + SLACK